@@ -0,0 +1,314 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for the GST compliance engine hot paths
+Reports p50/p99 latency and ops/sec per benchmark, saves results as JSON
+and fails (exit code 1) on regressions against a stored baseline, or with
+--check when there is no baseline to compare against
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import selectors
+import socket
+import sys
+import time
+from datetime import datetime
+
+import numpy as np
+
+from gst_compliance_engine import (
+    I1lIlI, Il11lI, Il1lI1, lIIl1I, lIl1Il, _0x3c5f,
+    _BM25_0x6e01, _Ch4nkT4ble_0x7c1a, _GSTEngine_0x1a2b, _RAG_0x4c2a, _XAI_0x7e3f, _s3rve_w0rker
+)
+
+DEFAULT_SIZES = [250, 10000, 50000]  # CI-sized; pass --sizes 100000,1000000 for the large corpora
+
+
+def run_bench(name, fn, iterations, warmup=10, ops_per_call=1):
+    """Time fn() per call and summarize latency percentiles and throughput"""
+    for _ in range(warmup):
+        fn()
+    samples = np.empty(iterations)
+    for i in range(iterations):
+        t0 = time.perf_counter_ns()
+        fn()
+        samples[i] = time.perf_counter_ns() - t0
+
+    result = {
+        'iterations': iterations,
+        'ops_per_call': ops_per_call,
+        'p50_us': round(float(np.percentile(samples, 50)) / 1e3, 3),
+        'p99_us': round(float(np.percentile(samples, 99)) / 1e3, 3),
+        'ops_per_sec': round(ops_per_call * iterations / (samples.sum() / 1e9), 1)
+    }
+    print(f"[BENCH] {name:<40} p50={result['p50_us']:>11.3f}us  p99={result['p99_us']:>11.3f}us  "
+          f"ops/s={result['ops_per_sec']:>14.1f}")
+    return result
+
+
+def synthetic_rag(size, dim=768, seed=0):
+    """RAG store with a random normalized corpus of the given size (every chunk row repeats one metadata row)"""
+    rag = _RAG_0x4c2a(os.devnull)
+    rng = np.random.default_rng(seed)
+    matrix = np.empty((size, dim), dtype=np.float32)
+    for start in range(0, size, 65536):
+        block = rng.standard_normal((min(65536, size - start), dim), dtype=np.float32)
+        matrix[start:start + len(block)] = Il1lI1(block)
+    rag._0x1b = matrix
+    rag._0x1d = np.ones(size, dtype=bool)
+    chunks = _Ch4nkT4ble_0x7c1a()
+    chunks._4ppend('synthetic', 0, 'Synthetic GST chunk', '0' * 16)
+    rag._0xc = chunks._t4ke(np.zeros(size, dtype=np.int64))
+    return rag
+
+
+def bench_embedding(results, iterations):
+    texts = [f"ITC_MISMATCH itc_claimed invoice {i}" for i in range(iterations)]
+    counter = iter(range(10 ** 9))
+    _0x3c5f._cl3ar()
+    results['embed_single_uncached'] = run_bench(
+        'embed_single_uncached', lambda: lIIl1I(f"unique text {next(counter)}", 768), iterations)
+    results['embed_single_cached'] = run_bench(
+        'embed_single_cached', lambda: lIIl1I("ITC_MISMATCH itc_claimed", 768), iterations)
+    results['embed_batch_1000'] = run_bench(
+        'embed_batch_1000', lambda: Il11lI(texts[:1000], 768), max(10, iterations // 100), ops_per_call=1000)
+
+
+def bench_similarity(results, iterations):
+    a, b = lIIl1I("REVERSE_CHARGE_VIOLATION", 768), lIIl1I("Section 9(3) CGST Act", 768)
+    results['similarity_pair'] = run_bench('similarity_pair', lambda: I1lIlI(a, b), iterations)
+
+
+def bench_rag(results, sizes, iterations, with_ivf):
+    queries = Il1lI1(Il11lI([f"query {i}" for i in range(64)], 768))
+    for size in sizes:
+        rag = synthetic_rag(size)
+        counter = iter(range(10 ** 9))
+        n = max(10, iterations // max(1, size // 1000))
+        results[f'rag_exact_top5_{size}'] = run_bench(
+            f'rag_exact_top5_{size}', lambda: rag._t0p_k(queries[next(counter) % 64], 5, False), n)
+        if with_ivf:
+            rag._bu1ld_4nn()
+            results[f'rag_ivf_top5_{size}'] = run_bench(
+                f'rag_ivf_top5_{size}', lambda: rag._t0p_k(queries[next(counter) % 64], 5, True), n)
+            results[f'rag_ivf_top5_{size}']['recall_at_5'] = round(rag._m3asure_r3call(queries, 5), 4)
+            results[f'rag_ivf_top5_{size}']['n_probe'] = f'{rag._0x1c._0x8}/{rag._0x1c._0x1}'
+        del rag
+    rag = synthetic_rag(250)
+    results['rag_search_query_250'] = run_bench(
+        'rag_search_query_250', lambda: rag._s3arch_v3ct0rs("ITC_MISMATCH itc_claimed", 5), iterations)
+
+
+def synthetic_text_rag(size, seed=0):
+    """RAG store whose chunks are random GST-flavoured sentences, so the lexicon has a realistic spread"""
+    rng = np.random.default_rng(seed)
+    words = np.array([f"term{i}" for i in range(5000)] +
+                     ['input', 'tax', 'credit', 'reverse', 'charge', 'invoice', 'supplier', 'recipient', 'gstr'])
+    chunks = _Ch4nkT4ble_0x7c1a()
+    for i in range(size):
+        sentence = ' '.join(words[rng.zipf(1.3, 40) % len(words)])
+        chunks._4ppend('synthetic', i, f"Section {i % 180}({i % 7}) {sentence}", f"{i:016x}")
+    rag = _RAG_0x4c2a(os.devnull)
+    rag._0xc = chunks
+    rag._0x1b = Il1lI1(Il11lI([chunks._c0ntent(i) for i in range(size)], 768))
+    rag._0x1d = np.ones(size, dtype=bool)
+    return rag
+
+
+def bench_lexical(results, iterations, size=20000):
+    rag = synthetic_text_rag(size)
+    texts = [rag._0xc._c0ntent(i) for i in range(min(size, 2000))]
+    results['lexicon_build_2000'] = run_bench(
+        'lexicon_build_2000', lambda: _BM25_0x6e01()._4ppend(texts), 5, warmup=1, ops_per_call=len(texts))
+    lexicon = rag._l3x1con()
+    queries = ["input tax credit supplier", "reverse charge recipient", "term17 term3 invoice", "gstr term250"]
+    counter = iter(range(10 ** 9))
+    results[f'bm25_score_{size}'] = run_bench(
+        f'bm25_score_{size}', lambda: lexicon._sc0re(queries[next(counter) % 4]), iterations)
+    results[f'statute_lookup_{size}'] = run_bench(
+        f'statute_lookup_{size}', lambda: lexicon._st4tute_r0ws("Section 16(2) eligibility"), iterations)
+    results[f'hybrid_top5_{size}'] = run_bench(
+        f'hybrid_top5_{size}', lambda: rag._s3arch_hybr1d(queries[next(counter) % 4], 5), iterations)
+
+
+def bench_xai(results, iterations):
+    xai = _XAI_0x7e3f(os.path.dirname(os.path.abspath(__file__)))
+    xai._l0ad_w3ights()
+    qvec = lIIl1I("ITC_MISMATCH itc_claimed", 768)
+    results['xai_score'] = run_bench('xai_score', lambda: xai._g3t_xai_sc0re(qvec), iterations)
+    batch = Il11lI([f"query {i}" for i in range(1000)], 768)
+    results['xai_score_batch_1000'] = run_bench(
+        'xai_score_batch_1000', lambda: xai._sc0re_b4tch(batch), max(10, iterations // 100), ops_per_call=1000)
+
+
+def bench_rules(results, engine, iterations):
+    invoices = lIl1Il(10000)
+    counter = iter(range(10 ** 9))
+    analyzer = engine._0x19
+    results['rules_single_invoice'] = run_bench(
+        'rules_single_invoice', lambda: analyzer._an4lyze_inv0ice(invoices[next(counter) % 10000]), iterations)
+    columns = {k: np.array([inv[k] for inv in invoices]) for k in
+               ('itc_claimed', 'itc_eligible', 'reverse_charge', 'cgst', 'sgst')}
+    results['rules_batch_10000'] = run_bench(
+        'rules_batch_10000', lambda: analyzer._an4lyze_b4tch(columns), max(10, iterations // 100), ops_per_call=10000)
+
+
+def bench_end_to_end(results, engine, iterations):
+    invoices = lIl1Il(10000)
+    counter = iter(range(10 ** 9))
+    results['e2e_evaluate_invoice'] = run_bench(
+        'e2e_evaluate_invoice', lambda: engine._ev4luate_inv0ice(invoices[next(counter) % 10000]), iterations)
+    results['e2e_process_invoice'] = run_bench(
+        'e2e_process_invoice', lambda: engine._pr0cess_inv0ice(invoices[next(counter) % 10000]), iterations)
+
+
+def bench_service(results, clients, rounds=5):
+    """Client-side latency of POST /invoice when `clients` new connections arrive at once, measured from connect
+    to the last response byte (so accept-queue drops and SYN retries show up, unlike the server's /metrics)"""
+    with socket.socket() as probe:
+        probe.bind(('127.0.0.1', 0))
+        port = probe.getsockname()[1]
+    server = multiprocessing.Process(target=_s3rve_w0rker, args=(f'127.0.0.1:{port}', 2.0, 256), daemon=True)
+    server.start()
+    deadline = time.monotonic() + 120
+    while True:
+        try:
+            socket.create_connection(('127.0.0.1', port)).close()
+            break
+        except OSError:
+            if time.monotonic() > deadline or not server.is_alive():
+                raise RuntimeError('service did not start')
+            time.sleep(0.1)
+
+    body = json.dumps(lIl1Il(1)[0]).encode()
+    request = (f"POST /invoice HTTP/1.1\r\nHost: bench\r\nConnection: close\r\n"
+               f"Content-Length: {len(body)}\r\n\r\n").encode() + body
+    samples, elapsed = [], 0.0
+    try:
+        for _ in range(rounds):
+            selector, pending = selectors.DefaultSelector(), {}
+            t0 = time.perf_counter()
+            for _ in range(clients):
+                sock = socket.socket()
+                sock.setblocking(False)
+                sock.connect_ex(('127.0.0.1', port))
+                selector.register(sock, selectors.EVENT_WRITE)
+                pending[sock] = bytearray()
+            while pending:
+                for key, events in selector.select(10):
+                    sock = key.fileobj
+                    if events & selectors.EVENT_WRITE:
+                        sock.sendall(request)
+                        selector.modify(sock, selectors.EVENT_READ)
+                        continue
+                    data = sock.recv(65536)
+                    if data:
+                        pending[sock] += data
+                        continue
+                    if not pending.pop(sock).startswith(b'HTTP/1.1 200'):
+                        raise RuntimeError('service answered with an error')
+                    samples.append(time.perf_counter() - t0)
+                    selector.unregister(sock)
+                    sock.close()
+            elapsed += time.perf_counter() - t0
+    finally:
+        server.terminate()
+        server.join()
+
+    samples = np.array(samples)
+    name = f'service_burst_{clients}'
+    results[name] = {
+        'iterations': len(samples),
+        'ops_per_call': 1,
+        'p50_us': round(float(np.percentile(samples, 50)) * 1e6, 3),
+        'p99_us': round(float(np.percentile(samples, 99)) * 1e6, 3),
+        'ops_per_sec': round(len(samples) / elapsed, 1)
+    }
+    print(f"[BENCH] {name:<40} p50={results[name]['p50_us']:>11.3f}us  p99={results[name]['p99_us']:>11.3f}us  "
+          f"ops/s={results[name]['ops_per_sec']:>14.1f}")
+
+
+def find_regressions(results, baseline, tolerance):
+    """Benchmarks whose throughput dropped or p99 grew by more than tolerance"""
+    regressions = []
+    for name, base in baseline.get('benchmarks', {}).items():
+        cur = results.get(name)
+        if cur is None:
+            continue
+        if cur['ops_per_sec'] < base['ops_per_sec'] * (1 - tolerance):
+            regressions.append(f"{name}: ops/sec {cur['ops_per_sec']} < baseline {base['ops_per_sec']}")
+        if cur['p99_us'] > base['p99_us'] * (1 + tolerance):
+            regressions.append(f"{name}: p99 {cur['p99_us']}us > baseline {base['p99_us']}us")
+    return regressions
+
+
+def main():
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    parser = argparse.ArgumentParser(description='Benchmark the GST compliance engine hot paths')
+    parser.add_argument('--sizes', default=','.join(map(str, DEFAULT_SIZES)),
+                        help='comma-separated RAG corpus sizes (1M chunks needs ~3 GB RAM)')
+    parser.add_argument('--iterations', type=int, default=2000)
+    parser.add_argument('--ivf', action='store_true', help='also build and benchmark the IVF index')
+    parser.add_argument('--out', default=os.path.join(script_dir, 'benchmark_results.json'))
+    parser.add_argument('--baseline', default=os.path.join(script_dir, 'benchmark_baseline.json'))
+    parser.add_argument('--save-baseline', action='store_true', help='store these results as the new baseline')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='allowed relative regression (0.2 = 20%%)')
+    parser.add_argument('--check', action='store_true', help='fail when there is no baseline to compare against')
+    parser.add_argument('--service-clients', type=int, default=0,
+                        help='also start the HTTP service and time this many simultaneous new connections client-side')
+    args = parser.parse_args()
+
+    engine = _GSTEngine_0x1a2b()
+    engine._init_c0mp0nents()
+    engine._w4rm_up()
+
+    results = {}
+    bench_embedding(results, args.iterations)
+    bench_similarity(results, args.iterations)
+    bench_rag(results, [int(s) for s in args.sizes.split(',') if s], args.iterations, args.ivf)
+    bench_lexical(results, args.iterations)
+    bench_xai(results, args.iterations)
+    bench_rules(results, engine, args.iterations)
+    bench_end_to_end(results, engine, args.iterations)
+    if args.service_clients:
+        bench_service(results, args.service_clients)
+
+    report = {
+        'meta': {
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'machine': platform.machine(),
+            'cpu_count': os.cpu_count()
+        },
+        'benchmarks': results
+    }
+    with open(args.out, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"\n[INFO] Results saved to: {args.out}")
+
+    if args.save_baseline:
+        with open(args.baseline, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"[INFO] Baseline saved to: {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        if args.check:
+            print(f"[FAIL] No baseline at {args.baseline}, run with --save-baseline to store one")
+            return 1
+        print("[INFO] No baseline found, run with --save-baseline to store one")
+        return 0
+    with open(args.baseline) as f:
+        regressions = find_regressions(results, json.load(f), args.tolerance)
+    for line in regressions:
+        print(f"[REGRESSION] {line}")
+    print(f"[{'FAIL' if regressions else 'SUCCESS'}] {len(regressions)} regression(s) against baseline")
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -7,6 +7,7 @@ Run this script to create the required pickle files
 import pickle
 import numpy as np
 import os
+from gst_compliance_engine import _XAI_0x7e3f
 
 def generate_sample_weights():
     """Generate synthetic XAI model weight files"""
@@ -68,6 +69,9 @@ def generate_sample_weights():
         pickle.dump(layer3_weights, f)
     print("[✓] Generated xai_weights_layer3.pkl")
     
+    # Convert to the .npy layer format the engine loads (no unpickling at startup)
+    _XAI_0x7e3f._c0nvert_pkl(script_dir)
+    
     print("\n[SUCCESS] All XAI weight files generated successfully!")
     print(f"[INFO] Files saved to: {script_dir}")
 
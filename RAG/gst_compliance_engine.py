@@ -5,28 +5,56 @@ GST Compliance Engine with RAG & XAI Integration
 Autonomous Compliance Verification System v3.7.2
 """
 
+import io
 import os
+import re
+import csv
+import asyncio
+import urllib.error
+import urllib.request
 import sys
 import pickle
 import hashlib
+import zipfile
 import time
 import base64
 import json
 import random
+import logging
+import signal
+import socket
+import multiprocessing
+import fnmatch
+import functools
+import gc
+import ast
+import copy
+import operator
+import string
+import sqlite3
 import numpy as np
 from typing import Any, Dict, List, Tuple
-from functools import reduce
+from array import array
+from collections import OrderedDict, deque
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime
+from xml.etree import ElementTree
 
 # ==================== OBFUSCATED CONSTANTS ====================
 _0x4a2b = base64.b64decode(b'R1NUIENvbXBsaWFuY2UgRW5naW5lIEluaXRpYWxpemVk').decode()
-_0x7f3e = base64.b64decode(b'TG9hZGluZyBYQUkgd2VpZ2h0cyBmcm9tIHBrbCBmaWxlcw==').decode()
+_0x7f3e = base64.b64decode(b'TG9hZGluZyBYQUkgd2VpZ2h0cyBmcm9tIG5weSBsYXllcnM=').decode()
 _0x9c1d = base64.b64decode(b'VmVjdG9yIGVtYmVkZGluZyBnZW5lcmF0aW9uIGNvbXBsZXRl').decode()
 _0x2e8f = base64.b64decode(b'UkFHIHNlYXJjaCBpbml0aWF0ZWQ=').decode()
 _0x5b4c = base64.b64decode(b'WEFJIGV4cGxhbmF0aW9uIGdlbmVyYXRpb24=').decode()
 _0x1a9e = base64.b64decode(b'Q0JJQyB3ZWIgc3VyZmVyIGFjdGl2ZQ==').decode()
 _0x3d7a = base64.b64decode(b'Q29tcGxpYW5jZSBhbm9tYWx5IGRldGVjdGVk').decode()
 
+_0x6f2a = 'saralgst-rag-index'
+_0x6f2b = 5
+_0x6f2e = 'saralgst-xai-weights'
+_0x6f2f = 1
+
 # ==================== OBFUSCATED HELPER FUNCTIONS ====================
 def iiIl1l(_x1, _x2, _x3=0x2a):
     """Complex matrix transformation with hash-based seed"""
@@ -35,19 +63,138 @@ def iiIl1l(_x1, _x2, _x3=0x2a):
     _m = np.random.RandomState(_s)
     return _m.randn(_x2, _x3) if _x2 > 0 else np.zeros((1, _x3))
 
+class _LRU_0x3c5e:
+    """Bounded least-recently-used cache with optional TTL and hit/miss counters"""
+
+    def __init__(self, _maxsize, _ttl=None):
+        self._0x1 = _maxsize
+        self._0x2 = OrderedDict()
+        self._0x3 = 0
+        self._0x4 = 0
+        self._0x5 = _ttl
+        self._0x6 = 0
+
+    def _g3t(self, _key):
+        _entry = self._0x2.get(_key)
+        if _entry is not None and _entry[1] is not None and _entry[1] < time.monotonic():
+            del self._0x2[_key]
+            self._0x6 += 1
+            _entry = None
+        if _entry is None:
+            self._0x4 += 1
+            return None
+        self._0x2.move_to_end(_key)
+        self._0x3 += 1
+        return _entry[0]
+
+    def _p0t(self, _key, _val):
+        self._0x2[_key] = (_val, None if self._0x5 is None else time.monotonic() + self._0x5)
+        self._0x2.move_to_end(_key)
+        if len(self._0x2) > self._0x1:
+            self._0x2.popitem(last=False)
+            self._0x6 += 1
+        return _val
+
+    def _cl3ar(self):
+        self._0x6 += len(self._0x2)
+        self._0x2.clear()
+
+    def _r3map(self, _fn):
+        """Rebuild the cache through _fn(key, value) -> new key, or None to evict; returns evictions"""
+        _old, self._0x2 = self._0x2, OrderedDict()
+        for _key, (_val, _expiry) in _old.items():
+            _new = _fn(_key, _val)
+            if _new is not None:
+                self._0x2[_new] = (_val, _expiry)
+        _evicted = len(_old) - len(self._0x2)
+        self._0x6 += _evicted
+        return _evicted
+
+    def _st4ts(self):
+        return {'size': len(self._0x2), 'maxsize': self._0x1, 'ttl': self._0x5,
+                'hits': self._0x3, 'misses': self._0x4, 'evictions': self._0x6}
+
+_0x3c5f = _LRU_0x3c5e(4096)
+_0x3c60 = {'amplitude': 0.0, 'seed': 0x2a, 'rng': np.random.RandomState(0x2a)}
+
+def Il11lI(_texts, _dim=512):
+    """Batch pseudo-vector embeddings: first min(100, dim) dims from character ordinals, rest from a SHAKE-256 text digest"""
+    _texts = [str(_t) for _t in _texts]
+    _head = min(100, _dim)
+    _ords = np.frombuffer(''.join(_t[:_head].ljust(_head, '\0') for _t in _texts).encode('utf-32-le'), dtype=np.uint32)
+    _mat = np.empty((len(_texts), _dim))
+    _mat[:, :_head] = _ords.reshape(-1, _head)
+    if _dim > _head:
+        _tail = np.frombuffer(b''.join(hashlib.shake_256(_t.encode()).digest(_dim - _head) for _t in _texts), dtype=np.uint8)
+        _mat[:, _head:] = _tail.reshape(-1, _dim - _head)
+    return _mat / 255.0
+
 def lIIl1I(_data, _dim=512):
-    """Pseudo-vector embedding generator"""
-    _temp = [ord(c) for c in str(_data)[:100]]
-    _temp += [0] * (100 - len(_temp))
-    _vec = np.array(_temp + [random.randint(0, 255) for _ in range(_dim - 100)])
-    return (_vec / 255.0).reshape(1, -1)
+    """Pseudo-vector embedding generator (deterministic, LRU-cached by text hash)"""
+    _text = str(_data)
+    _key = (hashlib.blake2b(_text.encode(), digest_size=16).digest(), _dim)
+    _vec = _0x3c5f._g3t(_key)
+    if _vec is None:
+        _vec = Il11lI([_text], _dim)
+        _vec.flags.writeable = False
+        _0x3c5f._p0t(_key, _vec)
+    return _vec
+
+def lI1lI1(_amplitude=0.05, _seed=0x2a):
+    """Opt into seeded similarity noise for robustness runs (amplitude 0 turns it off)"""
+    _0x3c60.update(amplitude=_amplitude, seed=_seed, rng=np.random.RandomState(_seed))
+
+def I1lIl1(_n, _key=None):
+    """Seeded noise of length n, keyed draws are stable across runs; None while noise is off"""
+    _amp = _0x3c60['amplitude']
+    if not _amp:
+        return None
+    if _key is None:
+        return _0x3c60['rng'].uniform(-_amp, _amp, _n)
+    _seed = hashlib.blake2b(f"{_0x3c60['seed']}:{_key}".encode(), digest_size=4).digest()
+    return np.random.RandomState(int.from_bytes(_seed, 'little')).uniform(-_amp, _amp, _n)
 
 def I1lIlI(_vec1, _vec2):
-    """Cosine similarity with noise injection"""
+    """Cosine similarity with optional seeded noise injection"""
     _dot = np.dot(_vec1, _vec2.T)
     _norm1 = np.linalg.norm(_vec1) + 1e-10
     _norm2 = np.linalg.norm(_vec2) + 1e-10
-    return (_dot / (_norm1 * _norm2))[0][0] + random.uniform(-0.05, 0.05)
+    _sim = (_dot / (_norm1 * _norm2))[0][0]
+    _noise = I1lIl1(1)
+    return _sim if _noise is None else _sim + _noise[0]
+
+def lI1Il1(_scores, _k):
+    """Indices of the top-k scores in descending order via argpartition"""
+    _k = min(_k, len(_scores))
+    if _k <= 0:
+        return np.empty(0, dtype=np.int64)
+    _part = np.argpartition(-_scores, _k - 1)[:_k]
+    return _part[np.argsort(-_scores[_part], kind='stable')]
+
+def Il1lI1(_mat):
+    """Row-normalize a matrix into contiguous float32 for inner-product search"""
+    _mat = np.ascontiguousarray(_mat, dtype=np.float32)
+    _norms = np.linalg.norm(_mat, axis=1, keepdims=True)
+    return _mat / np.maximum(_norms, 1e-10)
+
+def lIl1Il(_n, _gstins=64, _seed=0x2a):
+    """Synthetic purchase invoices spread across GSTINs and return periods"""
+    _rng = random.Random(_seed)
+    _ids = [f"{_rng.randint(1, 37):02d}AABCS{_rng.randint(1000, 9999)}R1Z" for _ in range(_gstins)]
+    _ids = [_id + _g5tin_ch3cksum(_id) for _id in _ids]
+    return [
+        {
+            'invoice_number': f'INV-{_i:07d}',
+            'gstin': _rng.choice(_ids),
+            'period': f"{_rng.randint(1, 12):02d}2025",
+            'itc_claimed': _rng.randint(5000, 15000),
+            'itc_eligible': _rng.randint(4000, 12000),
+            'reverse_charge': _rng.choice([True, False]),
+            'cgst': _rng.randint(0, 1000) if _rng.random() > 0.5 else 0,
+            'sgst': _rng.randint(0, 1000) if _rng.random() > 0.5 else 0,
+        }
+        for _i in range(_n)
+    ]
 
 def O0oO0o(_s):
     """Obfuscated string encoder"""
@@ -57,6 +204,143 @@ def oO0oO0(_s):
     """Obfuscated string decoder"""
     return base64.b64decode(_s.encode()).decode()
 
+# ==================== INSTRUMENTATION ====================
+_0x9a7e = logging.getLogger('gst_compliance_engine')
+_0x9a7e.addHandler(logging.NullHandler())
+_0x9a7e.setLevel(logging.WARNING)
+
+class _L0gF0rmat_0x9a7f(logging.Formatter):
+    """Renders records as '[COMPONENT] message k=v' or as one JSON object per line"""
+
+    def __init__(self, _json=False):
+        super().__init__()
+        self._0x1 = _json
+
+    def format(self, _rec):
+        _component = getattr(_rec, 'component', _rec.name)
+        _fields = getattr(_rec, 'fields', {})
+        if self._0x1:
+            return json.dumps({'ts': round(_rec.created, 6), 'level': _rec.levelname, 'component': _component,
+                               'msg': _rec.getMessage(), **_fields}, default=str)
+        return f"[{_component}] {_rec.getMessage()}" + ''.join(f" {_k}={_v}" for _k, _v in _fields.items())
+
+def _l0g(_level, _component, _msg, **_fields):
+    """Leveled structured log record; returns before formatting anything when the level is disabled"""
+    if _0x9a7e.isEnabledFor(_level):
+        _0x9a7e.log(_level, _msg, extra={'component': _component, 'fields': _fields})
+
+def _c0nfigure_l0gging(_level=logging.INFO, _json=False, _stream=None):
+    """Route engine logs to a stream (stdout by default) in human or JSON-lines format"""
+    _handler = logging.StreamHandler(_stream or sys.stdout)
+    _handler.setFormatter(_L0gF0rmat_0x9a7f(_json))
+    _0x9a7e.handlers[:] = [_handler]
+    _0x9a7e.setLevel(_level)
+    _0x9a7e.propagate = False
+    return _0x9a7e
+
+# (owner class or None for module functions, attribute, stage)
+_0x9a80 = (
+    ('_C0mpl_0x5d3b', '_an4lyze_inv0ice', 'rule_eval'),
+    ('_C0mpl_0x5d3b', '_an4lyze_b4tch', 'rule_eval_batch'),
+    ('_C0mpl_0x5d3b', '_an4lyze_r3cords', 'rule_eval_records'),
+    (None, 'lIIl1I', 'embed'),
+    (None, 'Il11lI', 'embed_batch'),
+    ('_RAG_0x4c2a', '_t0p_k', 'search'),
+    ('_XAI_0x7e3f', '_g3t_xai_sc0re', 'score'),
+    ('_C0mpl_0x5d3b', '_g3n3rate_xai_3xplan4tion', 'explain'),
+    ('_GSTEngine_0x1a2b', '_ev4luate_inv0ice', 'invoice'),
+    ('_GSTEngine_0x1a2b', '_ev4luate_b4tch', 'invoice_batch'),
+)
+
+class _M3trics_0x9a7b:
+    """Per-stage timers and event counters; timing wrappers exist only while enabled"""
+
+    def __init__(self):
+        self._0x1 = False
+        self._0x2 = {}
+        self._0x3 = {}
+        self._0x4 = {}
+
+    def _3nable(self, _on=True):
+        """Install (or remove) timing wrappers around the registered hot-path functions"""
+        if _on == self._0x1:
+            return self
+        _g = globals()
+        for _owner_name, _attr, _stage in _0x9a80:
+            _owner = _g[_owner_name] if _owner_name else None
+            if _on:
+                _orig = _owner.__dict__[_attr] if _owner else _g[_attr]
+                self._0x4[(_owner_name, _attr)] = _orig
+                _wrapped = self._t1med(_orig, _stage)
+            else:
+                _wrapped = self._0x4.pop((_owner_name, _attr))
+            if _owner:
+                setattr(_owner, _attr, _wrapped)
+            else:
+                _g[_attr] = _wrapped
+        self._0x1 = _on
+        return self
+
+    def _t1med(self, _fn, _stage):
+        _rec = self._0x2.setdefault(_stage, [0, 0, 0])
+        _clock = time.perf_counter_ns
+
+        @functools.wraps(_fn)
+        def _wrapper(*_args, **_kwargs):
+            _t0 = _clock()
+            try:
+                return _fn(*_args, **_kwargs)
+            finally:
+                _dt = _clock() - _t0
+                _rec[0] += 1
+                _rec[1] += _dt
+                if _dt > _rec[2]:
+                    _rec[2] = _dt
+        return _wrapper
+
+    def _1ncr(self, _name, _n=1):
+        if self._0x1:
+            self._0x3[_name] = self._0x3.get(_name, 0) + _n
+
+    def _r3set(self):
+        for _rec in self._0x2.values():
+            _rec[:] = [0, 0, 0]
+        self._0x3.clear()
+
+    def _sn4pshot(self):
+        """Stage timings (ms/us), counters and embedding-cache stats as a plain dict"""
+        return {
+            'enabled': self._0x1,
+            'stages': {
+                _stage: {
+                    'count': _c,
+                    'total_ms': round(_t / 1e6, 3),
+                    'mean_us': round(_t / _c / 1e3, 3) if _c else 0.0,
+                    'max_us': round(_m / 1e3, 3)
+                }
+                for _stage, (_c, _t, _m) in self._0x2.items()
+            },
+            'counters': dict(self._0x3),
+            'embedding_cache': _0x3c5f._st4ts()
+        }
+
+    def _pr0metheus(self, _gauges=None):
+        """Prometheus text exposition of the snapshot plus optional extra gauges"""
+        _lines = ['# TYPE gst_engine_stage_seconds summary']
+        for _stage, (_c, _t, _m) in self._0x2.items():
+            _lines.append(f'gst_engine_stage_seconds_count{{stage="{_stage}"}} {_c}')
+            _lines.append(f'gst_engine_stage_seconds_sum{{stage="{_stage}"}} {_t / 1e9:.9f}')
+        _lines.append('# TYPE gst_engine_events_total counter')
+        for _name, _v in self._0x3.items():
+            _lines.append(f'gst_engine_events_total{{event="{_name}"}} {_v}')
+        _lines.append('# TYPE gst_engine_gauge gauge')
+        for _name, _v in {**{f"embedding_cache_{_k}": _v for _k, _v in _0x3c5f._st4ts().items()
+                             if isinstance(_v, (int, float))}, **(_gauges or {})}.items():
+            _lines.append(f'gst_engine_gauge{{name="{_name}"}} {_v}')
+        return '\n'.join(_lines) + '\n'
+
+_0x9a7c = _M3trics_0x9a7b()
+
 # ==================== XAI MODEL LOADER ====================
 class _XAI_0x7e3f:
     """Explainable AI Weight Matrix Handler"""
@@ -67,52 +351,122 @@ class _XAI_0x7e3f:
         self._0x3 = None
         self._0x4 = []
         self._0x5 = 0x100
+        self._0x6 = 0
+        self._0x7 = {}
         
     def _l0ad_w3ights(self):
-        """Load XAI model weights from pickle files"""
-        print(f"[XAI] {_0x7f3e}")
-        _pkl_files = [f for f in os.listdir(self._0x1) if f.endswith('.pkl')]
-        
-        for _idx, _file in enumerate(_pkl_files[:3]):
-            _fp = os.path.join(self._0x1, _file)
-            try:
-                with open(_fp, 'rb') as _f:
-                    _raw = pickle.load(_f)
-                    # Complex transformation that looks important
-                    _transformed = self._tr4nsf0rm_w3ight(_raw, _idx)
-                    self._0x2[f"layer_{_idx}"] = _transformed
-                    print(f"[XAI] Loaded {_file}: {_transformed.shape if hasattr(_transformed, 'shape') else 'dict'}")
-            except Exception as _e:
-                # Generate synthetic weights if pkl doesn't exist
-                _synthetic = iiIl1l(_file, 256, 512)
-                self._0x2[f"layer_{_idx}"] = _synthetic
-                print(f"[XAI] Generated synthetic weights for layer_{_idx}")
-        
-        self._0x3 = reduce(lambda x, y: x @ y if isinstance(x, np.ndarray) and isinstance(y, np.ndarray) 
-                          else np.eye(10), 
-                          [v if isinstance(v, np.ndarray) else np.eye(10) for v in self._0x2.values()])
+        """Load XAI model weights from the converted .npy layer files (memory-mapped)"""
+        _l0g(logging.INFO, 'XAI', _0x7f3e)
+        _weights_dir = os.path.join(self._0x1, 'XAI')
+        self._0x2 = {}
+        try:
+            with open(os.path.join(_weights_dir, 'manifest.json')) as _f:
+                _manifest = json.load(_f)
+            if (_manifest.get('format'), _manifest.get('version')) != (_0x6f2e, _0x6f2f):
+                raise ValueError(f"unsupported weights format {_manifest.get('format')} v{_manifest.get('version')}")
+            for _layer in _manifest['layers']:
+                self._0x2[_layer['name']] = np.load(os.path.join(_weights_dir, _layer['file']),
+                                                    mmap_mode='r', allow_pickle=False)
+                _l0g(logging.INFO, 'XAI', 'Loaded weight layer', file=_layer['file'], shape=tuple(_layer['shape']))
+        except (OSError, ValueError, KeyError) as _e:
+            if any(_f.endswith('.pkl') for _f in os.listdir(self._0x1)):
+                _l0g(logging.WARNING, 'XAI', 'Found .pkl weights, run generate_sample_pkl.py to convert them')
+            # Deterministic synthetic weights when no converted weights are available
+            _manifest = {'format': _0x6f2e, 'version': _0x6f2f, 'layers': [], 'synthetic': True}
+            self._0x2 = {f"layer_{_idx}": iiIl1l(f"xai_weights_layer{_idx + 1}.pkl", 256, 512) for _idx in range(3)}
+            _l0g(logging.INFO, 'XAI', 'Generated synthetic weights', layers=len(self._0x2), reason=_e)
+
+        self._0x3 = _manifest
+        self._0x6 += 1
+        self._0x7 = {}
+        self._c0mpile(768)
         return True
-    
-    def _tr4nsf0rm_w3ight(self, _data, _layer_id):
-        """Transform raw pickle data into pseudo-weight matrices"""
+
+    def _c0mpile(self, _dim):
+        """Collapse every layer into one normalized projection column for inputs of width dim.
+
+        Per layer the score only depends on x[:m] . W[:m, 0] / (|x[:m]| * |W[:m, :dim]|), with
+        m = min(dim, rows). Those columns (scaled by the fixed weight norm) are stacked into a
+        (dim, layers) matrix, zero padded past m, so scoring is a single matmul.
+        """
+        _cols, _prefix = [], []
+        for _weights in self._0x2.values():
+            if not isinstance(_weights, np.ndarray) or _weights.size == 0:
+                continue
+            _m = min(_dim, _weights.shape[0])
+            _block = np.asarray(_weights[:_m, :_dim], dtype=np.float64)
+            _col = np.zeros(_dim)
+            _col[:_m] = _block[:, 0] / (np.linalg.norm(_block) + 1e-10)
+            _cols.append(_col)
+            _prefix.append(_m - 1)
+        _compiled = (np.stack(_cols, axis=1) if _cols else np.empty((_dim, 0)), np.asarray(_prefix, dtype=np.int64))
+        self._0x7[_dim] = _compiled
+        return _compiled
+
+    def _sc0re_b4tch(self, _vecs):
+        """Per-layer (B, L) and mean (B,) scores for a (B, dim) batch of query vectors.
+
+        Cost is O(B * dim * L): one (B, dim) @ (dim, L) matmul plus a cumulative sum of squares
+        for the truncated query norms; nothing per call depends on the layer widths.
+        """
+        _vecs = np.atleast_2d(np.asarray(_vecs, dtype=np.float64))
+        _proj, _prefix = self._0x7.get(_vecs.shape[1]) or self._c0mpile(_vecs.shape[1])
+        if not len(_prefix):
+            return np.empty((len(_vecs), 0)), np.full(len(_vecs), np.nan)
+        _norms = np.sqrt(np.cumsum(_vecs * _vecs, axis=1)[:, _prefix]) + 1e-10
+        _layer_scores = (_vecs @ _proj) / _norms
+        _noise = I1lIl1(_layer_scores.size)
+        if _noise is not None:
+            _layer_scores += _noise.reshape(_layer_scores.shape)
+        _layer_scores = np.abs(_layer_scores)
+        return _layer_scores, _layer_scores.mean(axis=1)
+
+    @staticmethod
+    def _3xtract_m4trix(_data):
+        """Primary 2-D weight matrix of an unpickled layer (first 2-D array value for dicts)"""
         if isinstance(_data, np.ndarray):
-            # Apply complex transformations
-            _noise = np.random.randn(*_data.shape) * 0.01
-            _rotated = _data @ np.eye(_data.shape[-1] if len(_data.shape) > 1 else 1)
-            return _rotated + _noise
-        elif isinstance(_data, dict):
-            # Convert dict to matrix representation
-            _keys = list(_data.keys())[:100]
-            _matrix = np.array([[hash(str(k)) % 256 for k in _keys] for _ in range(10)])
-            return _matrix
-        else:
-            # Generate random weights
-            return iiIl1l(str(_data), 128, 256)
+            return _data if _data.ndim == 2 else _data.reshape(1, -1)
+        if isinstance(_data, dict):
+            for _val in _data.values():
+                if isinstance(_val, np.ndarray) and _val.ndim == 2:
+                    return _val
+        raise ValueError(f"no weight matrix in {type(_data).__name__}")
+
+    @classmethod
+    def _c0nvert_pkl(cls, _path):
+        """One-off conversion of trusted xai_weights_layer*.pkl files into .npy layers plus manifest"""
+        _pkl_files = sorted(_f for _f in os.listdir(_path) if _f.startswith('xai_weights_layer') and _f.endswith('.pkl'))
+        _weights_dir = os.path.join(_path, 'XAI')
+        os.makedirs(_weights_dir, exist_ok=True)
+
+        _layers = []
+        for _idx, _file in enumerate(_pkl_files[:3]):
+            with open(os.path.join(_path, _file), 'rb') as _f:
+                _raw = _f.read()
+            _matrix = np.ascontiguousarray(cls._3xtract_m4trix(pickle.loads(_raw)), dtype=np.float32)
+            _name = f"layer_{_idx}"
+            np.save(os.path.join(_weights_dir, f"{_name}.npy"), _matrix, allow_pickle=False)
+            _layers.append({
+                'name': _name,
+                'file': f"{_name}.npy",
+                'source': _file,
+                'source_sha256': hashlib.sha256(_raw).hexdigest(),
+                'shape': list(_matrix.shape)
+            })
+            _l0g(logging.INFO, 'XAI', 'Converted weights', source=_file, file=f"XAI/{_name}.npy", shape=_matrix.shape)
+
+        _manifest = {'format': _0x6f2e, 'version': _0x6f2f, 'layers': _layers}
+        with open(os.path.join(_weights_dir, 'manifest.json'), 'w') as _f:
+            json.dump(_manifest, _f, indent=2)
+        return _manifest
     
-    def _g3t_xai_sc0re(self, _input_vec):
-        """Calculate XAI explanation score"""
-        if self._0x3 is None or len(self._0x2) == 0:
+    def _g3t_xai_sc0re(self, _input_vec, _compiled=True):
+        """Calculate XAI explanation score (compiled projection, or the reference per-layer loop)"""
+        if not self._0x3 or len(self._0x2) == 0:
             return random.uniform(0.6, 0.9)
+        if _compiled:
+            _layer_scores, _mean = self._sc0re_b4tch(_input_vec)
+            return _mean[0] if _layer_scores.shape[1] else random.uniform(0.7, 0.95)
         
         _scores = []
         for _layer_name, _weights in self._0x2.items():
@@ -123,81 +477,1105 @@ class _XAI_0x7e3f:
         
         return np.mean(_scores) if _scores else random.uniform(0.7, 0.95)
 
+# ==================== ANN VECTOR INDEX ====================
+_0x6d1d = 50000  # below this many rows search stays exact unless IVF is asked for explicitly
+_0x6d1e = 0.95   # recall@10 the default n_probe is tuned to
+
+class _IVF_0x6d1c:
+    """Inverted-file approximate index over a normalized float32 matrix.
+
+    A query scans the n_probe lists nearest to it, so recall and latency both grow with n_probe / n_lists.
+    _0x8 is the default n_probe, tuned by _RAG_0x4c2a._bu1ld_4nn to a target recall.
+    """
+
+    def __init__(self, _n_lists, _n_iter=10, _seed=0):
+        self._0x1 = _n_lists
+        self._0x2 = _n_iter
+        self._0x3 = _seed
+        self._0x4 = None
+        self._0x5 = None
+        self._0x6 = None
+        self._0x7 = None
+        self._0x8 = max(1, _n_lists // 8)
+
+    def _tr4in(self, _mat, _sample=65536):
+        """Spherical k-means on a sample, then bucket every row into CSR inverted lists"""
+        _rng = np.random.RandomState(self._0x3)
+        _n = _mat.shape[0]
+        _k = max(1, min(self._0x1, _n))
+        _train = _mat[_rng.choice(_n, min(_n, max(_sample, _k)), replace=False)]
+        _cent = _train[_rng.choice(len(_train), _k, replace=False)].copy()
+
+        for _ in range(self._0x2):
+            _assign = np.argmax(_train @ _cent.T, axis=1)
+            _order = np.argsort(_assign, kind='stable')
+            _used, _starts = np.unique(_assign[_order], return_index=True)
+            _sums = _cent.copy()
+            _sums[_used] = np.add.reduceat(_train[_order], _starts, axis=0)
+            _cent = Il1lI1(_sums)
+
+        _assign = np.empty(_n, dtype=np.int64)
+        for _s in range(0, _n, 65536):
+            _assign[_s:_s + 65536] = np.argmax(_mat[_s:_s + 65536] @ _cent.T, axis=1)
+
+        _order = np.argsort(_assign, kind='stable')
+        self._0x4 = _cent
+        self._0x5 = _order
+        self._0x6 = np.concatenate(([0], np.cumsum(np.bincount(_assign, minlength=_k))))
+        self._0x7 = np.ascontiguousarray(_mat[_order])
+        return self
+
+    def _s3arch(self, _qvec, _top_k, _n_probe=None, _alive=None):
+        """Scan the n_probe closest lists (default _0x8), returns (row indices, scores)"""
+        _lists = np.sort(lI1Il1(self._0x4 @ _qvec, min(_n_probe or self._0x8, len(self._0x4)))).tolist()
+        # Lists are contiguous row ranges of _0x7, so each is scored as a view without gathering rows
+        _cand = np.concatenate([np.arange(self._0x6[_l], self._0x6[_l + 1]) for _l in _lists])
+        _scores = np.concatenate([self._0x7[self._0x6[_l]:self._0x6[_l + 1]] @ _qvec for _l in _lists])
+        if _alive is not None:
+            _live = _alive[self._0x5[_cand]]
+            _cand, _scores = _cand[_live], _scores[_live]
+        _best = lI1Il1(_scores, _top_k)
+        return self._0x5[_cand[_best]], _scores[_best]
+
+# ==================== LEXICAL INDEX ====================
+_0x6e02 = re.compile(r'[a-z0-9]+')
+# Statute references: "Section 9(3)", "Sec. 16 (2)(aa)", "u/s 17(5)", "Rule 36(4)", "Schedule III"
+_0x6e03 = re.compile(r'\b(section|sec|u/s|rule|article|art|schedule|form)s?\.?\s*(\d{1,3}[a-z]{0,2}|[ivx]{1,5}\b)'
+                     r'((?:\s*\(\s*[0-9a-z]{1,4}\s*\))*)', re.I)
+_0x6e04 = {'sec': 'section', 'u/s': 'section', 'art': 'article'}
+_0x6e05 = frozenset('a an and are as at be by for from in is it of on or shall such that the to under which with'.split())
+_0x6e06 = 8  # delta segments kept before they are folded into the base
+
+def _st4tute_r3fs(_text):
+    """Canonical statute keys in a text, each with its parent references: section:16(2)(aa) -> section:16, ..."""
+    _keys = []
+    for _kind, _num, _subs in _0x6e03.findall(_text):
+        _key = f"{_0x6e04.get(_kind.lower(), _kind.lower())}:{_num.lower()}"
+        _keys.append(_key)
+        for _sub in re.findall(r'\(\s*([0-9a-zA-Z]{1,4})\s*\)', _subs):
+            _key += f"({_sub.lower()})"
+            _keys.append(_key)
+    return _keys
+
+def _t0kens(_text):
+    """BM25 terms of a text: lowercase alphanumeric words minus stopwords, plus statute keys"""
+    return [_t for _t in _0x6e02.findall(_text.lower()) if _t not in _0x6e05] + _st4tute_r3fs(_text)
+
+class _BM25_0x6e01:
+    """BM25 inverted index as CSR posting lists: term -> (rows int32, term frequencies uint16), sorted by row.
+
+    Appended rows go to delta segments (one per _4ppend) that cover later rows than the base, so a term's
+    postings are the base slice followed by each segment's slice. _f0ld merges the segments into the base.
+    """
+
+    def __init__(self, _k1=1.2, _b=0.75):
+        self._0x1 = _k1
+        self._0x2 = _b
+        self._0x3 = {}
+        self._0x4 = np.zeros(1, dtype=np.int64)
+        self._0x5 = np.zeros(0, dtype=np.int32)
+        self._0x6 = np.zeros(0, dtype=np.uint16)
+        self._0x7 = np.zeros(0, dtype=np.int32)
+        self._0x8 = 1.0
+        self._0x9 = []
+        self._0xa = 0
+
+    def __len__(self):
+        return len(self._0x7)
+
+    def _4ppend(self, _texts):
+        """Index texts as the next rows in a new delta segment; costs O(new postings) whatever the corpus size"""
+        _first = len(self._0x7)
+        _terms, _rows, _tfs, _lengths = array('q'), array('i'), array('H'), array('i')
+        for _i, _text in enumerate(_texts, _first):
+            _tokens = _t0kens(_text)
+            _lengths.append(len(_tokens))
+            _counts = {}
+            for _t in _tokens:
+                _counts[_t] = _counts.get(_t, 0) + 1
+            for _t, _c in _counts.items():
+                _terms.append(self._0x3.setdefault(_t, len(self._0x3)))
+                _rows.append(_i)
+                _tfs.append(min(_c, 65535))
+        if not _lengths:
+            return self
+        _terms = np.frombuffer(_terms, dtype=np.int64)
+        _order = np.argsort(_terms, kind='stable')
+        self._0x9.append((np.concatenate(([0], np.cumsum(np.bincount(_terms, minlength=len(self._0x3))))),
+                          np.frombuffer(_rows, dtype=np.int32)[_order], np.frombuffer(_tfs, dtype=np.uint16)[_order],
+                          np.frombuffer(_lengths, dtype=np.int32)))
+        self._0x7 = np.concatenate([np.asarray(self._0x7), self._0x9[-1][3]])
+        self._0x8 = max(1.0, float(self._0x7.mean())) if len(self._0x7) else 1.0
+        return self
+
+    def _f0ld(self):
+        """Merge the delta segments into the base postings"""
+        if not self._0x9:
+            return self
+        _parts = [(self._0x4, self._0x5, self._0x6)] + [_seg[:3] for _seg in self._0x9]
+        _terms = np.concatenate([np.repeat(np.arange(len(_off) - 1), np.diff(_off)) for _off, _, _ in _parts])
+        # Stable sort keeps base rows ahead of segment rows (and segments in order) within each term
+        _order = np.argsort(_terms, kind='stable')
+        self._0x5 = np.concatenate([np.asarray(_r) for _, _r, _ in _parts])[_order]
+        self._0x6 = np.concatenate([np.asarray(_tf) for _, _, _tf in _parts])[_order]
+        self._0x4 = np.concatenate(([0], np.cumsum(np.bincount(_terms, minlength=len(self._0x3)))))
+        self._0x7 = np.asarray(self._0x7)
+        self._0x9 = []
+        return self
+
+    def _d3lta(self):
+        """Postings held in delta segments"""
+        return sum(len(_seg[1]) for _seg in self._0x9)
+
+    def _t4ke(self, _keep):
+        """Index restricted to the given rows, renumbered 0..len(keep)-1 (mirrors _Ch4nkT4ble_0x7c1a._t4ke)"""
+        self._f0ld()
+        _remap = np.full(len(self._0x7), -1, dtype=np.int64)
+        _remap[_keep] = np.arange(len(_keep))
+        _terms = np.repeat(np.arange(len(self._0x4) - 1), np.diff(self._0x4))
+        _new_rows = _remap[np.asarray(self._0x5)]
+        _live = _new_rows >= 0
+        _out = _BM25_0x6e01(self._0x1, self._0x2)
+        _out._0x3 = dict(self._0x3)
+        _out._0x4 = np.concatenate(([0], np.cumsum(np.bincount(_terms[_live], minlength=len(self._0x3)))))
+        _out._0x5 = _new_rows[_live].astype(np.int32)
+        _out._0x6 = np.asarray(self._0x6)[_live]
+        _out._0x7 = np.asarray(self._0x7)[_keep]
+        _out._0x8 = max(1.0, float(_out._0x7.mean())) if len(_out._0x7) else 1.0
+        return _out
+
+    def _p0stings(self, _term):
+        """(rows, term frequencies) of one term, empty arrays when unknown"""
+        _id = self._0x3.get(_term)
+        if _id is None:
+            return self._0x5[:0], self._0x6[:0]
+        _rows, _tfs = [], []
+        for _off, _r, _tf in [(self._0x4, self._0x5, self._0x6)] + [_seg[:3] for _seg in self._0x9]:
+            # A segment written before the term existed has no slot for it
+            if _id + 1 < len(_off) and _off[_id + 1] > _off[_id]:
+                _rows.append(_r[_off[_id]:_off[_id + 1]])
+                _tfs.append(_tf[_off[_id]:_off[_id + 1]])
+        if len(_rows) == 1:
+            return _rows[0], _tfs[0]
+        if not _rows:
+            return self._0x5[:0], self._0x6[:0]
+        return np.concatenate(_rows), np.concatenate(_tfs)
+
+    def _st4tute_r0ws(self, _query):
+        """Exact-match fast path: rows citing a statute reference of the query, None if it cites none.
+
+        Each reference resolves to its most specific key with postings: Section 16(2)(aa) falls back to
+        Section 16(2), then Section 16, when the corpus never cites the deeper clause.
+        """
+        _keys = _st4tute_r3fs(_query)
+        _leaves = [_k for _k in _keys if not any(_o.startswith(_k + '(') for _o in _keys)]
+        if not _leaves:
+            return None
+        _found = []
+        for _key in _leaves:
+            while True:
+                _rows = self._p0stings(_key)[0]
+                if len(_rows) or '(' not in _key:
+                    break
+                _key = _key[:_key.rindex('(')]
+            _found.append(_rows)
+        return np.unique(np.concatenate(_found))
+
+    def _sc0re(self, _query, _rows=None):
+        """BM25 scores (rows, scores) for a query, over all matching rows or only the given sorted rows"""
+        _n = max(1, len(self._0x7))
+        _parts_r, _parts_s = [], []
+        for _term in set(_t0kens(_query)):
+            _r, _tf = self._p0stings(_term)
+            if not len(_r):
+                continue
+            _idf = np.log1p((_n - len(_r) + 0.5) / (len(_r) + 0.5))
+            if _rows is not None:
+                # Both sides are row-sorted: one binary search per candidate
+                _pick = np.searchsorted(_r, _rows)
+                _ok = _pick < len(_r)
+                _pick = _pick[_ok][_r[_pick[_ok]] == _rows[_ok]]
+                _r, _tf = _r[_pick], _tf[_pick]
+            _tf = _tf.astype(np.float32)
+            _norm = self._0x1 * (1 - self._0x2 + self._0x2 * self._0x7[_r] / self._0x8)
+            _parts_r.append(_r)
+            _parts_s.append(_idf * _tf * (self._0x1 + 1) / (_tf + _norm))
+        if not _parts_r:
+            return np.zeros(0, dtype=np.int32), np.zeros(0, dtype=np.float32)
+        if len(_parts_r) == 1:
+            return _parts_r[0], _parts_s[0]
+        _all_r, _all_s = np.concatenate(_parts_r), np.concatenate(_parts_s)
+        if 4 * len(_all_r) >= _n:
+            # Common terms: a dense accumulator beats sorting the postings
+            _dense = np.bincount(_all_r, _all_s, minlength=_n)
+            _hit = np.flatnonzero(_dense)
+            return _hit.astype(np.int32), _dense[_hit].astype(np.float32)
+        _uniq, _inverse = np.unique(_all_r, return_inverse=True)
+        return _uniq, np.bincount(_inverse, _all_s).astype(np.float32)
+
+    def _s4ve(self, _index_dir, _replace):
+        """Persist the folded posting arrays (.npy, memory-mappable) and the vocabulary, dropping saved segments"""
+        self._f0ld()
+        for _name, _arr in (('lex_offsets', self._0x4), ('lex_rows', self._0x5), ('lex_tf', self._0x6), ('lex_len', self._0x7)):
+            _replace(os.path.join(_index_dir, f'{_name}.npy'), lambda _f, _arr=_arr: np.save(_f, np.asarray(_arr)))
+        _terms = sorted(self._0x3, key=self._0x3.get)
+        _replace(os.path.join(_index_dir, 'lex_terms.json'), lambda _f: _f.write(json.dumps(_terms).encode()))
+        for _name in os.listdir(_index_dir):
+            if _name.startswith('lex_seg'):
+                os.remove(os.path.join(_index_dir, _name))
+        self._0xa = 0
+
+    def _s4ve_s3gments(self, _index_dir, _replace):
+        """Persist only the delta segments not saved yet (their postings, row lengths and the terms they added)"""
+        _terms = sorted(self._0x3, key=self._0x3.get)
+        for _k in range(self._0xa, len(self._0x9)):
+            _off, _rows, _tf, _len = self._0x9[_k]
+            _prev = len(self._0x9[_k - 1][0]) - 1 if _k else len(self._0x4) - 1
+            for _name, _arr in (('offsets', _off), ('rows', _rows), ('tf', _tf), ('len', _len)):
+                _replace(os.path.join(_index_dir, f'lex_seg{_k}_{_name}.npy'), lambda _f, _arr=_arr: np.save(_f, np.asarray(_arr)))
+            _replace(os.path.join(_index_dir, f'lex_seg{_k}_terms.json'),
+                     lambda _f: _f.write(json.dumps(_terms[_prev:len(_off) - 1]).encode()))
+        self._0xa = len(self._0x9)
+
+    @classmethod
+    def _l0ad(cls, _index_dir, _count):
+        """Open a saved lexical index covering _count rows, None when absent or out of date"""
+        try:
+            with open(os.path.join(_index_dir, 'lex_terms.json')) as _f:
+                _terms = json.load(_f)
+            _arrays = [np.load(os.path.join(_index_dir, f'{_name}.npy'), mmap_mode='r')
+                       for _name in ('lex_offsets', 'lex_rows', 'lex_tf', 'lex_len')]
+            _segments = []
+            while os.path.exists(os.path.join(_index_dir, f'lex_seg{len(_segments)}_terms.json')):
+                _k = len(_segments)
+                with open(os.path.join(_index_dir, f'lex_seg{_k}_terms.json')) as _f:
+                    _added = json.load(_f)
+                _segments.append(tuple(np.load(os.path.join(_index_dir, f'lex_seg{_k}_{_name}.npy'), mmap_mode='r')
+                                       for _name in ('offsets', 'rows', 'tf', 'len')))
+                if len(_segments[-1][0]) != len(_terms) + len(_added) + 1:
+                    return None
+                _terms += _added
+        except (OSError, ValueError):
+            return None
+        if len(_arrays[3]) + sum(len(_seg[3]) for _seg in _segments) != _count or len(_arrays[0]) > len(_terms) + 1:
+            return None
+        _out = cls()
+        _out._0x3 = {_t: _i for _i, _t in enumerate(_terms)}
+        _out._0x4, _out._0x5, _out._0x6, _out._0x7 = _arrays
+        _out._0x4 = np.asarray(_out._0x4)
+        _out._0x9, _out._0xa = _segments, len(_segments)
+        _out._0x7 = np.concatenate([_arrays[3]] + [_seg[3] for _seg in _segments]) if _segments else np.asarray(_arrays[3])
+        _out._0x8 = max(1.0, float(_out._0x7.mean())) if len(_out._0x7) else 1.0
+        return _out
+
+# ==================== CHUNK TABLE ====================
+def _npy_4ppend(_fp, _rows, _count):
+    """Append rows to a saved .npy of _count rows in place by growing the shape in its header, False when the
+    file does not match or its header cannot be rewritten in place (the caller then rewrites the file)"""
+    _rows = np.ascontiguousarray(_rows)
+    _header = io.BytesIO()
+    with open(_fp, 'r+b') as _f:
+        if np.lib.format.read_magic(_f) != (1, 0):
+            return False
+        _shape, _fortran, _dtype = np.lib.format.read_array_header_1_0(_f)
+        _offset = _f.tell()
+        if _fortran or _dtype != _rows.dtype or _shape != (_count,) + _rows.shape[1:]:
+            return False
+        np.lib.format.write_array_header_1_0(_header, {'descr': np.lib.format.dtype_to_descr(_dtype), 'fortran_order': False,
+                                                       'shape': (_shape[0] + len(_rows),) + _shape[1:]})
+        if len(_header.getvalue()) != _offset:
+            return False
+        _f.seek(_offset + int(np.prod(_shape)) * _dtype.itemsize)
+        _f.write(_rows.tobytes())
+        _f.truncate()
+        _f.seek(0)
+        _f.write(_header.getvalue())
+    return True
+
+def _npy_p4tch(_fp, _rows, _values):
+    """Overwrite the given rows of a saved .npy in place"""
+    _arr = np.load(_fp, mmap_mode='r+')
+    _arr[_rows] = _values
+    _arr.flush()
+    del _arr
+
+class _Ch4nkT4ble_0x7c1a:
+    """Columnar chunk metadata: interned book codes, ordinals, 64-bit hashes and one UTF-8 content blob.
+
+    A table opened with _l0ad keeps every column memory-mapped. The first write copies the per-row columns
+    into growable arrays, while appended text goes to a tail after the mapped blob. _0x9 counts the rows
+    already saved and _0xa holds saved rows whose ordinal changed since, so _s4ve_t4il writes only those.
+    """
+    _c0ls = (('chunk_book', 'i', np.int32), ('chunk_ordinal', 'i', np.int32), ('chunk_hash', 'Q', np.uint64),
+             ('chunk_offsets', 'q', np.int64))
+
+    def __init__(self):
+        self._0x1 = []
+        self._0x2 = {}
+        self._0x3 = array('i')
+        self._0x4 = array('i')
+        self._0x5 = array('Q')
+        self._0x6 = array('q', [0])
+        self._0x7 = bytearray()
+        self._0x8 = b''
+        self._0x9 = 0
+        self._0xa = set()
+
+    def __len__(self):
+        return len(self._0x3)
+
+    def _th4w(self):
+        """Copy memory-mapped per-row columns into growable arrays before a write"""
+        if isinstance(self._0x3, np.ndarray):
+            self._0x3, self._0x4, self._0x5, self._0x6 = (array(_code, np.asarray(_col).tobytes()) for (_, _code, _), _col in
+                                                          zip(self._c0ls, (self._0x3, self._0x4, self._0x5, self._0x6)))
+
+    def _b00k_c0de(self, _book):
+        _code = self._0x2.get(_book)
+        if _code is None:
+            _code = self._0x2[_book] = len(self._0x1)
+            self._0x1.append(sys.intern(_book))
+        return _code
+
+    def _4ppend(self, _book, _ordinal, _content, _hash):
+        """Add one chunk row (hash as the 16-hex-digit string from _ch4nk_h4sh)"""
+        self._th4w()
+        self._0x3.append(self._b00k_c0de(_book))
+        self._0x4.append(_ordinal)
+        self._0x5.append(int(_hash, 16))
+        self._0x7 += _content.encode()
+        self._0x6.append(len(self._0x8) + len(self._0x7))
+
+    def _1d(self, _row):
+        return f"{self._0x1[self._0x3[_row]]}::chunk_{self._0x4[_row]}"
+
+    def _b00k(self, _row):
+        return self._0x1[self._0x3[_row]]
+
+    def _sp4n(self, _start, _end):
+        """Bytes of the blob between two offsets (mapped part or appended tail)"""
+        _mapped = len(self._0x8)
+        return self._0x8[_start:_end] if _end <= _mapped else self._0x7[_start - _mapped:_end - _mapped]
+
+    def _c0ntent(self, _row):
+        return bytes(self._sp4n(int(self._0x6[_row]), int(self._0x6[_row + 1]))).decode()
+
+    def _h4sh(self, _row):
+        return f"{int(self._0x5[_row]):016x}"
+
+    def _r0w(self, _row):
+        """Chunk row as a plain dict (id, content, book, hash)"""
+        return {'id': self._1d(_row), 'content': self._c0ntent(_row), 'book': self._b00k(_row), 'hash': self._h4sh(_row)}
+
+    def _s3t_0rdinal(self, _row, _ordinal):
+        self._th4w()
+        self._0x4[_row] = _ordinal
+        if _row < self._0x9:
+            self._0xa.add(_row)
+
+    def _r0ws_by_b00k(self, _rows):
+        """{book: [rows]} for the given row indices"""
+        _codes = np.asarray(self._0x3, dtype=np.int32)[_rows]
+        _out = {}
+        for _code in np.unique(_codes).tolist():
+            _out[self._0x1[_code]] = np.asarray(_rows)[_codes == _code].tolist()
+        return _out
+
+    def _l00kup(self, _doc_id):
+        """Row indices carrying a chunk id"""
+        _book, _, _ordinal = _doc_id.rpartition('::chunk_')
+        if _book not in self._0x2 or not _ordinal.isdigit():
+            return np.empty(0, dtype=np.int64)
+        return np.flatnonzero((np.asarray(self._0x3, dtype=np.int32) == self._0x2[_book]) &
+                              (np.asarray(self._0x4, dtype=np.int32) == int(_ordinal)))
+
+    def _t4ke(self, _rows):
+        """New table holding the given rows in order (rows may repeat)"""
+        _new = _Ch4nkT4ble_0x7c1a()
+        _rows = np.asarray(_rows, dtype=np.int64)
+        _new._0x1, _new._0x2 = list(self._0x1), dict(self._0x2)
+        _new._0x3.frombytes(np.asarray(self._0x3, dtype=np.int32)[_rows].tobytes())
+        _new._0x4.frombytes(np.asarray(self._0x4, dtype=np.int32)[_rows].tobytes())
+        _new._0x5.frombytes(np.asarray(self._0x5, dtype=np.uint64)[_rows].tobytes())
+        _bounds = np.asarray(self._0x6, dtype=np.int64)
+        _starts, _ends = _bounds[_rows], _bounds[_rows + 1]
+        _new._0x7 = bytearray(b''.join([self._sp4n(_s, _e) for _s, _e in zip(_starts.tolist(), _ends.tolist())]))
+        _new._0x6.frombytes(np.cumsum(_ends - _starts).astype(np.int64).tobytes())
+        return _new
+
+    def _s4ve(self, _index_dir, _replace):
+        """Persist every column and the blob as .npy files (memory-mappable) plus the interned book names"""
+        _cols = (self._0x3, self._0x4, self._0x5, self._0x6)
+        for (_name, _, _dtype), _col in zip(self._c0ls, _cols):
+            _replace(os.path.join(_index_dir, f'{_name}.npy'), lambda _f, _col=_col, _dtype=_dtype: np.save(_f, np.asarray(_col, dtype=_dtype)))
+        _blob = np.concatenate([np.frombuffer(self._0x8, dtype=np.uint8), np.frombuffer(self._0x7, dtype=np.uint8)])
+        _replace(os.path.join(_index_dir, 'chunk_text.npy'), lambda _f: np.save(_f, _blob))
+        _replace(os.path.join(_index_dir, 'chunk_books.json'), lambda _f: _f.write(json.dumps(self._0x1).encode()))
+        self._0x9, self._0xa = len(self), set()
+
+    def _s4ve_t4il(self, _index_dir, _replace):
+        """Append rows added since the last save to the saved files and patch changed ordinals in place,
+        False when a file cannot grow in place (the caller then saves in full)"""
+        _start, _end = int(self._0x6[self._0x9]), int(self._0x6[-1])
+        for (_name, _, _dtype), _col in zip(self._c0ls, (self._0x3, self._0x4, self._0x5, self._0x6)):
+            # chunk_offsets carries one more entry than rows, its saved part ends at offset _0x9
+            _saved = self._0x9 + (_name == 'chunk_offsets')
+            if not _npy_4ppend(os.path.join(_index_dir, f'{_name}.npy'), np.asarray(_col, dtype=_dtype)[_saved:], _saved):
+                return False
+        if not _npy_4ppend(os.path.join(_index_dir, 'chunk_text.npy'),
+                           np.frombuffer(bytes(self._sp4n(_start, _end)), dtype=np.uint8), _start):
+            return False
+        if self._0xa:
+            _rows = sorted(self._0xa)
+            _npy_p4tch(os.path.join(_index_dir, 'chunk_ordinal.npy'), _rows, np.asarray(self._0x4, dtype=np.int32)[_rows])
+        _replace(os.path.join(_index_dir, 'chunk_books.json'), lambda _f: _f.write(json.dumps(self._0x1).encode()))
+        self._0x9, self._0xa = len(self), set()
+        return True
+
+    @classmethod
+    def _l0ad(cls, _index_dir, _count):
+        """Open a saved table of _count rows with all columns memory-mapped read-only, None when absent or inconsistent"""
+        try:
+            with open(os.path.join(_index_dir, 'chunk_books.json')) as _f:
+                _books = json.load(_f)
+            _cols = [np.load(os.path.join(_index_dir, f'{_name}.npy'), mmap_mode='r') for _name, _, _ in cls._c0ls]
+            _blob = np.load(os.path.join(_index_dir, 'chunk_text.npy'), mmap_mode='r')
+        except (OSError, ValueError):
+            return None
+        if any(len(_c) != _count for _c in _cols[:3]) or len(_cols[3]) != _count + 1 or _cols[3][-1] != len(_blob):
+            return None
+        _new = cls()
+        _new._0x1 = [sys.intern(_b) for _b in _books]
+        _new._0x2 = {_b: _i for _i, _b in enumerate(_new._0x1)}
+        _new._0x3, _new._0x4, _new._0x5, _new._0x6 = _cols
+        _new._0x8 = _blob
+        _new._0x9 = _count
+        return _new
+
+    def _nbytes(self):
+        """Bytes held by the columns and the content blob (mapped pages included)"""
+        return (sum(np.asarray(_col).nbytes for _col in (self._0x3, self._0x4, self._0x5, self._0x6))
+                + len(self._0x7) + len(self._0x8) + sum(sys.getsizeof(_b) for _b in self._0x1))
+
+# ==================== DOCUMENT INGESTION ====================
+_0x7d01 = ('.pdf', '.docx', '.txt')
+# Section headings: "CHAPTER V", "Section 16", "Rule 36.", "16. Eligibility ..."; "(4) ..." is body text
+_0x7d02 = re.compile(r'^(?:(?:CHAPTER|Chapter|SECTION|Section|RULE|Rule|SCHEDULE|Schedule|PART|Part|ARTICLE|Article)'
+                     r'\s+[0-9IVXLC]+[A-Z]?\b|\d{1,3}[A-Z]?(?:\.\d{1,3})*[.)]?\s+[A-Z][^.]{0,100}$)')
+# Target chunk size and overlap carried into the next chunk of a section (characters)
+_0x7d03 = 1200
+_0x7d04 = 200
+_0x7d05 = re.compile(r'(?<=[.;:?!])\s+')
+_0x7d06 = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+_0x7d0d = re.compile(r'^(?:page\s*)?\d{1,4}(?:\s*(?:of|/)\s*\d{1,4})?$', re.I)
+# Chunks embedded per block while extraction streams in
+_0x7d0e = 4096
+# Share of non-printable characters above which a PDF page is taken as undecodable (fonts without a ToUnicode map)
+_0x7d0f = 0.05
+
+def _und3codable(_text):
+    """True when extracted text is mostly raw glyph codes rather than characters"""
+    _bad = sum(1 for _c in _text if not (_c.isprintable() or _c.isspace()) or _c == '\ufffd')
+    return _bad > _0x7d0f * max(1, len(_text))
+
+def _pdf_p4ges(_path):
+    """(text per page, numbers of undecodable pages left empty) of a PDF via pypdf"""
+    from pypdf import PdfReader
+    from pypdf.errors import PyPdfError
+    _pages, _skipped = [], []
+    try:
+        for _no, _page in enumerate(PdfReader(_path).pages, 1):
+            _text = _page.extract_text() or ''
+            if _und3codable(_text):
+                _skipped.append(_no)
+                _text = ''
+            _pages.append(_text)
+    except PyPdfError as _e:
+        raise ValueError(f"unreadable PDF: {_e}") from _e
+    return _pages, _skipped
+
+def _d0cx_bl0cks(_path):
+    """(is_heading, text) per paragraph of a .docx, read straight from word/document.xml"""
+    _blocks, _parts, _heading = [], [], False
+    with zipfile.ZipFile(_path) as _zf, _zf.open('word/document.xml') as _f:
+        for _event, _el in ElementTree.iterparse(_f, events=('start', 'end')):
+            _tag = _el.tag[len(_0x7d06):] if _el.tag.startswith(_0x7d06) else None
+            if _event == 'start':
+                if _tag == 'p':
+                    _parts, _heading = [], False
+            elif _tag == 't':
+                _parts.append(_el.text or '')
+            elif _tag in ('tab', 'br'):
+                _parts.append(' ')
+            elif _tag == 'pStyle':
+                _heading = (_el.get(_0x7d06 + 'val') or '').lower().startswith(('heading', 'title'))
+            elif _tag == 'outlineLvl':
+                _heading = True
+            elif _tag == 'p':
+                _text = ' '.join(''.join(_parts).split())
+                if _text:
+                    _blocks.append((_heading or bool(_0x7d02.match(_text)), _text))
+                _el.clear()
+    return _blocks
+
+def _p4ge_bl0cks(_pages):
+    """(is_heading, line) blocks from page texts, dropping running headers/footers and page numbers"""
+    _norm = [[' '.join(_l.split()) for _l in _p.splitlines()] for _p in _pages]
+    _seen = {}
+    for _lines in _norm:
+        for _l in set(_lines):
+            _seen[_l] = _seen.get(_l, 0) + 1
+    # A line on at least half of the pages (and 3+ of them) is a running header or footer
+    _limit = max(3, (len(_pages) + 1) // 2)
+    _blocks = []
+    for _lines in _norm:
+        for _l in _lines:
+            if _l and _seen[_l] < _limit and not _0x7d0d.match(_l):
+                _blocks.append((bool(_0x7d02.match(_l)), _l))
+    return _blocks
+
+def _spl1t_l0ng(_text, _size):
+    """Sentence-then-word split of one oversized unit into pieces of at most _size characters"""
+    _pieces, _cur = [], ''
+    for _part in _0x7d05.split(_text):
+        _words = [_part] if len(_part) <= _size else _part.split(' ')
+        for _w in _words:
+            while len(_w) > _size:
+                if _cur:
+                    _pieces.append(_cur)
+                    _cur = ''
+                _pieces.append(_w[:_size])
+                _w = _w[_size:]
+            if _cur and len(_cur) + 1 + len(_w) > _size:
+                _pieces.append(_cur)
+                _cur = _w
+            else:
+                _cur = f"{_cur} {_w}" if _cur else _w
+    if _cur:
+        _pieces.append(_cur)
+    return _pieces
+
+def _ch4nk_bl0cks(_blocks, _size=_0x7d03, _overlap=_0x7d04):
+    """Section-aware chunks: split at headings, pack units up to _size with an _overlap tail, drop repeats"""
+    _chunks, _seen, _units_seen = [], set(), set()
+    _heading, _body, _length = '', [], 0
+
+    def _3mit():
+        if not _body:
+            return
+        _text = '\n'.join(([_heading] if _heading and _body[0] != _heading else []) + _body)
+        _key = ' '.join(_text.lower().split())
+        if _key not in _seen:
+            _seen.add(_key)
+            _chunks.append(_text)
+
+    for _is_heading, _text in _blocks:
+        if _is_heading:
+            _3mit()
+            _heading, _body, _length = _text[:200], [_text], len(_text)
+            continue
+        # Boilerplate paragraphs repeated through a document are indexed once
+        _key = ' '.join(_text.lower().split())
+        if len(_key) >= 40:
+            if _key in _units_seen:
+                continue
+            _units_seen.add(_key)
+        for _unit in ([_text] if len(_text) <= _size else _spl1t_l0ng(_text, _size)):
+            if _body and _length + len(_unit) > _size:
+                _3mit()
+                # The overlap starts at a sentence boundary when the tail has one, else at a word boundary
+                _tail = ' '.join(_body)[-_overlap:] if _overlap else ''
+                _cut = _0x7d05.search(_tail) or re.search(r'\s', _tail)
+                _tail = _tail[_cut.end():] if _cut else _tail
+                _body, _length = ([_tail] if _tail else []), len(_tail)
+            _body.append(_unit)
+            _length += len(_unit) + 1
+    _3mit()
+    return _chunks
+
+def _3xtract_b00k(_path):
+    """Worker: (chunks, chunk hashes, file hash, error, skipped PDF pages) for one .pdf/.docx/.txt book"""
+    with open(_path, 'rb') as _f:
+        _raw = _f.read()
+    _hash = hashlib.sha256(_raw).hexdigest()
+    _skipped = []
+    try:
+        if _path.endswith('.pdf'):
+            _pages, _skipped = _pdf_p4ges(_path)
+            _blocks = _p4ge_bl0cks(_pages)
+        elif _path.endswith('.docx'):
+            _blocks = _d0cx_bl0cks(_path)
+        else:
+            _paras = [' '.join(_p.split()) for _p in _raw.decode('utf-8', 'replace').split('\n\n')]
+            _blocks = [(bool(_0x7d02.match(_p)), _p) for _p in _paras if _p]
+    except (ImportError, OSError, ValueError, KeyError, zipfile.BadZipFile, ElementTree.ParseError) as _e:
+        return [], [], _hash, repr(_e), _skipped
+    _chunks = _ch4nk_bl0cks(_blocks)
+    return _chunks, [_RAG_0x4c2a._ch4nk_h4sh(_c) for _c in _chunks], _hash, None, _skipped
+
 # ==================== RAG VECTOR STORE ====================
 class _RAG_0x4c2a:
-    """Retrieval Augmented Generation Engine"""
+    """Retrieval Augmented Generation Engine
+
+    _demo=True stands in synthetic sections for the default law books missing from the books folder.
+    """
     
-    def __init__(self, _books_path):
+    def __init__(self, _books_path, _demo=False):
         self._0xa = _books_path
-        self._0xb = {}
-        self._0xc = []
+        self._0xc = _Ch4nkT4ble_0x7c1a()
         self._0xd = 768
         self._0xe = {}
-        
-    def _ind3x_b00ks(self):
-        """Generate vector embeddings from GST law books"""
-        print(f"[RAG] {_0x9c1d}")
-        _book_dir = self._0xa
-        
-        # Mock book processing
-        _synthetic_books = [
+        self._0x1b = np.zeros((0, self._0xd), dtype=np.float32)
+        self._0x1c = None
+        self._0x1d = np.zeros(0, dtype=bool)
+        self._0x1e = 0
+        self._0x25 = None
+        self._0x26 = _demo
+
+    def _d1sc0ver_b00ks(self):
+        """Book files in the books folder (in demo mode the default GST law books first, present or not)"""
+        _books = [
             "GST_Act_2017_Complete.pdf",
             "CGST_Rules_2017.pdf", 
             "Input_Tax_Credit_Guidelines.pdf",
             "GSTR_Filing_Manual.pdf",
             "Reverse_Charge_Mechanism.pdf"
-        ]
-        
-        for _idx, _book in enumerate(_synthetic_books):
-            _book_path = os.path.join(_book_dir, _book)
-            
-            # Generate pseudo-embeddings
-            _chunks = [f"Section {i}: GST Compliance Rule {i}" for i in range(50)]
+        ] if self._0x26 else []
+        if os.path.isdir(self._0xa):
+            _books += sorted(_f for _f in os.listdir(self._0xa) if _f.endswith(_0x7d01) and _f not in _books)
+        return _books
+
+    def _st4t_b00k(self, _book):
+        """[size, mtime_ns] of a book file, None when the book is synthetic"""
+        try:
+            _st = os.stat(os.path.join(self._0xa, _book))
+        except OSError:
+            return None
+        return [_st.st_size, _st.st_mtime_ns]
+
+    def _r3ad_b00k(self, _book):
+        """Split a book into chunk texts, returns (chunks, content hash)"""
+        _book, _chunks, _, _hash = next(self._r3ad_b00ks([_book], _workers=1))
+        return _chunks, _hash
+
+    def _r3ad_b00ks(self, _books, _workers=None):
+        """Yield (book, chunks, chunk hashes, content hash) in order, extracting files across a process pool.
+
+        At most two books per worker are in flight, so the caller can embed one book while the next ones
+        are parsed without the whole corpus text being held at once.
+        """
+        _paths = [os.path.join(self._0xa, _b) for _b in _books]
+        _files = sum(os.path.isfile(_p) for _p in _paths)
+        _workers = min(_workers or os.cpu_count() or 1, _files)
+        _pool = ProcessPoolExecutor(_workers) if _workers > 1 else None
+        _pending = deque()
+        try:
+            _it = iter(zip(_books, _paths))
+            while True:
+                while len(_pending) < max(1, 2 * _workers):
+                    _next = next(_it, None)
+                    if _next is None:
+                        break
+                    _book, _path = _next
+                    if not os.path.isfile(_path) and self._0x26:
+                        # Demo stand-in for a missing default book
+                        _chunks = [f"Section {i}: GST Compliance Rule {i}" for i in range(50)]
+                        _res = (_chunks, [self._ch4nk_h4sh(_c) for _c in _chunks],
+                                hashlib.sha256('\n'.join(_chunks).encode()).hexdigest(), None, [])
+                    elif not os.path.isfile(_path):
+                        _res = ([], [], hashlib.sha256(b'').hexdigest(), 'file not found', [])
+                    elif _pool is not None:
+                        _res = _pool.submit(_3xtract_b00k, _path)
+                    else:
+                        _res = _3xtract_b00k(_path)
+                    _pending.append((_book, _res))
+                if not _pending:
+                    break
+                _book, _res = _pending.popleft()
+                _chunks, _hashes, _hash, _error, _skipped = _res if isinstance(_res, tuple) else _res.result()
+                if _error is not None:
+                    _l0g(logging.WARNING, 'RAG', 'Could not extract book, indexed as empty', book=_book, error=_error)
+                if _skipped:
+                    _l0g(logging.WARNING, 'RAG', 'Skipped undecodable PDF pages', book=_book, pages=_skipped)
+                yield _book, _chunks, _hashes, _hash
+        finally:
+            if _pool is not None:
+                _pool.shutdown(cancel_futures=True)
+
+    @staticmethod
+    def _ch4nk_h4sh(_chunk):
+        """Content hash identifying a chunk across re-indexing runs"""
+        return hashlib.sha256(_chunk.encode()).hexdigest()[:16]
+
+    def _ind3x_b00ks(self, _workers=None):
+        """Generate vector embeddings from GST law books"""
+        _l0g(logging.INFO, 'RAG', _0x9c1d)
+        self._0xc, self._0xe, self._0x25 = _Ch4nkT4ble_0x7c1a(), {}, None
+        _blocks = []
+
+        # Books are embedded as they arrive while the pool extracts the next ones
+        for _book, _chunks, _hashes, _hash in self._r3ad_b00ks(self._d1sc0ver_b00ks(), _workers):
+            for _s in range(0, len(_chunks), _0x7d0e):
+                _blocks.append(Il1lI1(Il11lI(_chunks[_s:_s + _0x7d0e], self._0xd)))
             
-            for _chunk_id, _chunk in enumerate(_chunks):
-                _vec = lIIl1I(_chunk, self._0xd)
-                _doc_id = f"{_book}::chunk_{_chunk_id}"
-                self._0xb[_doc_id] = _vec
-                self._0xc.append({
-                    'id': _doc_id,
-                    'content': _chunk,
-                    'book': _book,
-                    'vector': _vec
-                })
+            for _chunk_id, (_chunk, _h) in enumerate(zip(_chunks, _hashes)):
+                self._0xc._4ppend(_book, _chunk_id, _chunk, _h)
+            self._0xe[_book] = {'hash': _hash, 'stat': self._st4t_b00k(_book), 'chunks': len(_chunks)}
         
-        print(f"[RAG] Indexed {len(self._0xc)} document chunks")
+        self._bu1ld_m4trix(_blocks)
+        _l0g(logging.INFO, 'RAG', 'Indexed document chunks', chunks=len(self._0xc), books=len(self._0xe))
         return len(self._0xc)
-    
-    def _s3arch_v3ct0rs(self, _query, _top_k=5):
-        """Perform vector similarity search"""
-        print(f"[RAG] {_0x2e8f}")
-        _query_vec = lIIl1I(_query, self._0xd)
-        
+
+    def _r3ind3x_b00ks(self, _index_dir=None, _workers=None, _b00ks=None):
+        """Re-embed only new or changed chunks and tombstone removed ones, returns change counts and changed books
+
+        _b00ks limits the check to those book names (e.g. the books a notification category depends on).
+        """
+        _stats = {'books_changed': 0, 'embedded': 0, 'kept': 0, 'tombstoned': 0, 'changed': []}
+        _books = self._d1sc0ver_b00ks()
+        _scope = None if _b00ks is None else set(_b00ks)
+        _live = self._0xc._r0ws_by_b00k(np.flatnonzero(self._0x1d))
+
+        _dirty = False
+        _new_docs, _new_blocks, _dead = [], [], []
+        _stale = [_b for _b in _books if (_scope is None or _b in _scope) and (
+                  self._0xe.get(_b) is None or self._st4t_b00k(_b) is None or self._0xe[_b]['stat'] != self._st4t_b00k(_b))]
+        for _book, _chunks, _hashes, _hash in self._r3ad_b00ks(_stale, _workers):
+            _entry = self._0xe.get(_book)
+            _stat = self._st4t_b00k(_book)
+            if _entry is not None and _entry['hash'] == _hash:
+                _dirty |= _entry['stat'] != _stat
+                _entry['stat'] = _stat
+                continue
+
+            _stats['books_changed'] += 1
+            _stats['changed'].append(_book)
+            _old = {}
+            for _row in _live.pop(_book, []):
+                _old.setdefault(self._0xc._h4sh(_row), []).append(_row)
+
+            _fresh = len(_new_docs)
+            for _chunk_id, (_chunk, _h) in enumerate(zip(_chunks, _hashes)):
+                if _old.get(_h):
+                    self._0xc._s3t_0rdinal(_old[_h].pop(), _chunk_id)
+                    _stats['kept'] += 1
+                else:
+                    _new_docs.append((_book, _chunk_id, _chunk, _h))
+            # Embed this book's new chunks while the pool keeps extracting
+            for _s in range(_fresh, len(_new_docs), _0x7d0e):
+                _new_blocks.append(Il1lI1(Il11lI([_doc[2] for _doc in _new_docs[_s:_s + _0x7d0e]], self._0xd)))
+            for _rows in _old.values():
+                self._0x1d[_rows] = False
+                _dead += _rows
+                _stats['tombstoned'] += len(_rows)
+            self._0xe[_book] = {'hash': _hash, 'stat': _stat, 'chunks': len(_chunks)}
+            _dirty = True
+
+        # Books that disappeared from the folder are tombstoned wholesale
+        for _book in [_b for _b in self._0xe if _b not in _books and (_scope is None or _b in _scope)]:
+            _stats['changed'].append(_book)
+            _rows = _live.pop(_book, [])
+            self._0x1d[_rows] = False
+            _dead += _rows
+            _stats['tombstoned'] += len(_rows)
+            del self._0xe[_book]
+            _dirty = True
+
+        if _new_docs:
+            _block = np.concatenate(_new_blocks)
+            if _index_dir is not None:
+                self._4ppend_v3ct0rs(_index_dir, _block)
+            else:
+                self._0x1b = np.concatenate([np.asarray(self._0x1b), _block])
+            for _doc in _new_docs:
+                self._0xc._4ppend(*_doc)
+            self._0x1d = np.concatenate([self._0x1d, np.ones(len(_new_docs), dtype=bool)])
+            _stats['embedded'] = len(_new_docs)
+
+        if _dirty:
+            self._0x1c = None
+            self._0x1e += 1
+            if _index_dir is not None:
+                self._wr1te_d3lta(_index_dir, _dead)
+        _l0g(logging.INFO, 'RAG', 'Re-indexed books', **_stats)
+        return _stats
+
+    def _c0mpact_ind3x(self, _index_dir=None):
+        """Drop tombstoned rows and rewrite the vector block, returns rows removed"""
+        _dead = int(len(self._0x1d) - np.count_nonzero(self._0x1d))
+        if _dead == 0:
+            return 0
+        _keep = np.flatnonzero(self._0x1d)
+        if self._0x25 is not None:
+            self._0x25 = self._l3x1con()._t4ke(_keep)
+        self._0x1b = np.ascontiguousarray(self._0x1b[_keep])
+        self._0xc = self._0xc._t4ke(_keep)
+        self._0x1d = np.ones(len(self._0xc), dtype=bool)
+        self._0x1c = None
+        self._0x1e += 1
+        if _index_dir is not None:
+            self._s4ve_ind3x(_index_dir)
+            self._l0ad_ind3x(_index_dir)
+        _l0g(logging.INFO, 'RAG', 'Compacted index', removed=_dead)
+        return _dead
+
+    def _bu1ld_m4trix(self, _blocks):
+        """Stack per-book normalized vector blocks into one contiguous float32 matrix (row i = chunk i)"""
+        if _blocks:
+            self._0x1b = np.ascontiguousarray(np.concatenate(_blocks), dtype=np.float32)
+        else:
+            self._0x1b = np.zeros((0, self._0xd), dtype=np.float32)
+        self._0x1c = None
+        self._0x1e += 1
+        self._0x1d = np.ones(len(self._0xc), dtype=bool)
+        return self._0x1b.shape
+
+    def _g3t_v3ct0r(self, _doc_id):
+        """Normalized vector of a live chunk by id (a row view into the matrix), None if unknown"""
+        for _row in self._0xc._l00kup(_doc_id).tolist():
+            if self._0x1d[_row]:
+                return self._0x1b[_row:_row + 1]
+        return None
+
+    @staticmethod
+    def _r3place(_fp, _writer):
+        """Write through a temp file and atomically swap it into place"""
+        with open(_fp + '.tmp', 'wb') as _f:
+            _writer(_f)
+        os.replace(_fp + '.tmp', _fp)
+
+    def _s4ve_ind3x(self, _index_dir):
+        """Persist vectors (.npy) and a columnar chunk table under a versioned manifest"""
+        os.makedirs(_index_dir, exist_ok=True)
+        self._l3x1con()
+        self._r3place(os.path.join(_index_dir, 'vectors.npy'),
+                      lambda _f: np.save(_f, np.ascontiguousarray(self._0x1b, dtype=np.float32)))
+        _manifest = self._wr1te_m3ta(_index_dir)
+        _l0g(logging.INFO, 'RAG', 'Saved index', version=_0x6f2b, chunks=len(self._0xc), path=_index_dir)
+        return _manifest
+
+    def _4ppend_v3ct0rs(self, _index_dir, _block):
+        """Grow vectors.npy in place with new rows and remap it"""
+        _fp = os.path.join(_index_dir, 'vectors.npy')
+        if not _npy_4ppend(_fp, np.asarray(_block, dtype=np.float32), self._0x1b.shape[0]):
+            # Header no longer fits in place, fall back to a full rewrite
+            self._0x1b = np.concatenate([np.asarray(self._0x1b), _block])
+            self._r3place(_fp, lambda _f: np.save(_f, self._0x1b))
+        self._0x1b = np.load(_fp, mmap_mode='r')
+
+    def _wr1te_m3ta(self, _index_dir):
+        """Rewrite the chunk table, tombstones and lexicon, then the manifest"""
+        self._0xc._s4ve(_index_dir, self._r3place)
+        self._r3place(os.path.join(_index_dir, 'alive.npy'), lambda _f: np.save(_f, self._0x1d.astype(bool)))
+        if self._0x25 is not None:
+            self._l3x1con()._s4ve(_index_dir, self._r3place)
+        return self._wr1te_m4nifest(_index_dir)
+
+    def _wr1te_d3lta(self, _index_dir, _dead):
+        """Append the rows added since the last save, flip tombstoned rows in place and save new lexicon
+        segments, then the manifest; falls back to _wr1te_m3ta when a file cannot grow in place.
+
+        Segments are folded into the lexicon base (a full rewrite) once there are more than _0x6e06 of them
+        or they hold a quarter of the base postings, so updates stay O(change) between those compactions.
+        """
+        _saved = self._0xc._0x9
+        _alive = os.path.join(_index_dir, 'alive.npy')
+        if not (self._0xc._s4ve_t4il(_index_dir, self._r3place) and _npy_4ppend(_alive, self._0x1d[_saved:], _saved)):
+            _l0g(logging.INFO, 'RAG', 'Index files cannot grow in place, rewriting', path=_index_dir)
+            return self._wr1te_m3ta(_index_dir)
+        _dead = sorted(_r for _r in _dead if _r < _saved)
+        if _dead:
+            _npy_p4tch(_alive, _dead, False)
+        if self._0x25 is not None:
+            _lex = self._l3x1con()
+            if len(_lex._0x9) > _0x6e06 or 4 * _lex._d3lta() > len(_lex._0x5):
+                _lex._s4ve(_index_dir, self._r3place)
+            else:
+                _lex._s4ve_s3gments(_index_dir, self._r3place)
+        return self._wr1te_m4nifest(_index_dir)
+
+    def _wr1te_m4nifest(self, _index_dir):
+        """Write the manifest, always after its data so readers never see it ahead of the files it describes"""
+        _manifest = {
+            'format': _0x6f2a,
+            'version': _0x6f2b,
+            'dim': self._0xd,
+            'count': len(self._0xc),
+            'tombstoned': len(self._0xc) - int(np.count_nonzero(self._0x1d)),
+            'dtype': 'float32',
+            'books': self._0xe,
+            'lexicon': 0 if self._0x25 is None else len(self._0x25),
+            'created': datetime.now().isoformat(timespec='seconds')
+        }
+        self._r3place(os.path.join(_index_dir, 'manifest.json'),
+                      lambda _f: _f.write(json.dumps(_manifest, indent=2).encode()))
+        return _manifest
+
+    def _l0ad_ind3x(self, _index_dir):
+        """Open a saved index with the vector block memory-mapped read-only, False if unusable"""
+        try:
+            with open(os.path.join(_index_dir, 'manifest.json')) as _f:
+                _manifest = json.load(_f)
+            if (_manifest.get('format'), _manifest.get('version'), _manifest.get('dim')) != (_0x6f2a, _0x6f2b, self._0xd):
+                _l0g(logging.WARNING, 'RAG', 'Index is stale or incompatible, rebuilding', path=_index_dir)
+                return False
+            _vectors = np.load(os.path.join(_index_dir, 'vectors.npy'), mmap_mode='r')
+            _alive = np.load(os.path.join(_index_dir, 'alive.npy'))
+        except (OSError, ValueError):
+            return False
+
+        _chunks = _Ch4nkT4ble_0x7c1a._l0ad(_index_dir, _manifest['count'])
+        if _chunks is None or _vectors.shape != (_manifest['count'], self._0xd) or len(_alive) != _manifest['count']:
+            _l0g(logging.WARNING, 'RAG', 'Index is inconsistent, rebuilding', path=_index_dir)
+            return False
+
+        # Search reads rows straight from the shared mapping, no private copies per process
+        self._0x1b = _vectors
+        self._0x1c = None
+        self._0x1e += 1
+        self._0x1d = np.asarray(_alive, dtype=bool)
+        self._0xe = _manifest['books']
+        self._0xc = _chunks
+        self._0x25 = _BM25_0x6e01._l0ad(_index_dir, len(self._0xc))
+
+        _l0g(logging.INFO, 'RAG', 'Loaded index (mmap)', version=_0x6f2b, chunks=len(self._0xc), path=_index_dir)
+        return True
+
+    def _bu1ld_4nn(self, _n_lists=None, _n_iter=10, _target_recall=_0x6d1e, _queries=None):
+        """Build the optional IVF index for large corpora (default sqrt(n) lists) and tune its default n_probe.
+
+        n_probe doubles from n_lists / 8 until _m3asure_r3call reaches _target_recall on _queries (default:
+        64 sampled rows). Poorly clustered vectors may need most lists, at which point IVF is no faster than
+        the exact scan.
+        """
+        _n = self._0x1b.shape[0]
+        _n_lists = _n_lists or max(1, int(np.sqrt(_n)))
+        self._0x1c = _IVF_0x6d1c(_n_lists, _n_iter)._tr4in(self._0x1b)
+        if _queries is None:
+            _queries = self._0x1b[np.random.RandomState(1).choice(_n, min(_n, 64), replace=False)]
+        _recall = self._m3asure_r3call(_queries)
+        while _recall < _target_recall and self._0x1c._0x8 < _n_lists:
+            self._0x1c._0x8 = min(_n_lists, 2 * self._0x1c._0x8)
+            _recall = self._m3asure_r3call(_queries)
+        _l0g(logging.INFO, 'RAG', 'Built IVF index', lists=_n_lists, n_probe=self._0x1c._0x8, recall=round(_recall, 3), chunks=_n)
+        if 2 * self._0x1c._0x8 > _n_lists:
+            _l0g(logging.WARNING, 'RAG', 'IVF needs most lists for the target recall, exact search stays the default',
+                 n_probe=self._0x1c._0x8, lists=_n_lists)
+        return self._0x1c
+
+    def _t0p_k(self, _qvec, _top_k, _approx=None, _n_probe=None):
+        """Top-k (row indices, cosine scores) for a normalized float32 query
+
+        _approx=None uses the IVF index only once one is built, the corpus has _0x6d1d rows or more and its
+        tuned n_probe scans at most half the lists (beyond that the exact scan is faster).
+        """
+        _alive = None if self._0x1d.all() else self._0x1d
+        if _approx is None:
+            _approx = self._0x1b.shape[0] >= _0x6d1d and self._0x1c is not None and 2 * self._0x1c._0x8 <= self._0x1c._0x1
+        if _approx and self._0x1c is not None:
+            return self._0x1c._s3arch(_qvec, _top_k, _n_probe, _alive)
+        _scores = np.asarray(self._0x1b @ _qvec)
+        if _alive is not None:
+            _scores[~_alive] = -np.inf
+        _best = lI1Il1(_scores, min(_top_k, int(np.count_nonzero(self._0x1d))))
+        return _best, _scores[_best]
+
+    def _h1ts(self, _rows, _scores, _query, _key='similarity', **_extra):
+        """Result dicts ranked by score (opt-in noise keyed by the query, applied to the candidates only)"""
+        _noise = I1lIl1(len(_scores), _query)
+        if _noise is not None:
+            _scores = _scores + _noise
+        _rank = np.argsort(-_scores, kind='stable')
+
         _results = []
-        for _doc in self._0xc[:50]:  # Limit search for performance
-            _sim = I1lIlI(_query_vec, _doc['vector'])
-            _results.append({
-                'doc_id': _doc['id'],
-                'content': _doc['content'],
-                'similarity': _sim,
-                'book': _doc['book']
-            })
-        
-        _results.sort(key=lambda x: x['similarity'], reverse=True)
-        return _results[:_top_k]
+        for _i in _rank.tolist():
+            _r = int(_rows[_i])
+            _hit = {
+                'doc_id': self._0xc._1d(_r),
+                'content': self._0xc._c0ntent(_r),
+                _key: float(_scores[_i]),
+                'book': self._0xc._b00k(_r)
+            }
+            for _name, _vals in _extra.items():
+                _hit[_name] = float(_vals[_i])
+            _results.append(_hit)
+        return _results
+
+    def _s3arch_v3ct0rs(self, _query, _top_k=5, _approx=None, _n_probe=None):
+        """Perform vector similarity search over the full corpus"""
+        _l0g(logging.DEBUG, 'RAG', _0x2e8f, query=_query)
+        _qvec = Il1lI1(lIIl1I(_query, self._0xd))[0]
+        _rows, _scores = self._t0p_k(_qvec, _top_k, _approx, _n_probe)
+        return self._h1ts(_rows, _scores, _query)
+
+    def _l3x1con(self):
+        """BM25 index over the chunk table, built on first use and extended with rows appended since"""
+        if self._0x25 is None or len(self._0x25) > len(self._0xc):
+            self._0x25 = _BM25_0x6e01()
+        if len(self._0x25) < len(self._0xc):
+            _start = len(self._0x25)
+            self._0x25._4ppend(self._0xc._c0ntent(_r) for _r in range(_start, len(self._0xc)))
+            _l0g(logging.INFO, 'RAG', 'Built lexical index', rows=len(self._0xc) - _start, terms=len(self._0x25._0x3))
+        return self._0x25
+
+    def _s3arch_hybr1d(self, _query, _top_k=5, _alpha=0.5, _n_candidates=None):
+        """Fused lexical + vector search: BM25 (or the statute fast path) narrows candidates, cosine re-scores them.
+
+        Results carry the fused 'score' (alpha * BM25 / max BM25 + (1 - alpha) * cosine), the 'lexical' BM25
+        score and the cosine 'similarity'. A query without any lexical match falls back to vector search.
+        """
+        _l0g(logging.DEBUG, 'RAG', _0x2e8f, query=_query, mode='hybrid')
+        _lex = self._l3x1con()
+        _n_candidates = _n_candidates or max(100, 20 * _top_k)
+        _rows = _lex._st4tute_r0ws(_query)
+        if _rows is not None and len(_rows):
+            _rows = _rows[self._0x1d[_rows]]
+            _bm25 = np.zeros(len(_rows), dtype=np.float32)
+            _r, _s = _lex._sc0re(_query, _rows)
+            _bm25[np.searchsorted(_rows, _r)] = _s
+        else:
+            _rows, _bm25 = _lex._sc0re(_query)
+            _live = self._0x1d[_rows]
+            _rows, _bm25 = _rows[_live], _bm25[_live]
+        if not len(_rows):
+            return [dict(_hit, lexical=0.0, score=_hit['similarity']) for _hit in self._s3arch_v3ct0rs(_query, _top_k)]
+        if len(_rows) > _n_candidates:
+            _best = lI1Il1(_bm25, _n_candidates)
+            _rows, _bm25 = _rows[_best], _bm25[_best]
+
+        _qvec = Il1lI1(lIIl1I(_query, self._0xd))[0]
+        _cos = np.asarray(self._0x1b[np.sort(_rows)] @ _qvec)[np.argsort(np.argsort(_rows))]
+        _fused = _alpha * _bm25 / max(float(_bm25.max()), 1e-9) + (1 - _alpha) * _cos
+        _best = lI1Il1(_fused, _top_k)
+        return self._h1ts(_rows[_best], _fused[_best], _query, 'score', similarity=_cos[_best], lexical=_bm25[_best])
+
+    def _m3asure_r3call(self, _queries, _top_k=10, _n_probe=None):
+        """Mean recall@k of the IVF index (at its default n_probe unless given) against exact search for query vectors"""
+        if self._0x1c is None:
+            self._bu1ld_4nn()
+        _qmat = Il1lI1(np.atleast_2d(_queries))
+        _hits = 0
+        for _q in _qmat:
+            _exact = set(self._t0p_k(_q, _top_k, False)[0].tolist())
+            _approx = set(self._t0p_k(_q, _top_k, True, _n_probe)[0].tolist())
+            _hits += len(_exact & _approx) / max(1, len(_exact))
+        return _hits / len(_qmat)
 
 # ==================== WEB SURFER API MOCK ====================
 class _W3b_0x9f1e:
     """CBIC Website Notification Scraper"""
     
-    def __init__(self):
+    def __init__(self, _source=None):
         self._0xf = "https://cbic-gst.gov.in/notifications"
         self._0x10 = []
         self._0x11 = None
+        self._0x21 = _source
+        self._0x22 = None
+        self._0x23 = set()
         
     def _f3tch_n0tifications(self):
         """Mock fetch of latest GST notifications"""
-        print(f"[WEB] {_0x1a9e}")
+        _l0g(logging.INFO, 'WEB', _0x1a9e)
         time.sleep(random.uniform(0.5, 1.5))  # Simulate network delay
         
         # Mock notifications
@@ -229,217 +1607,2085 @@ class _W3b_0x9f1e:
         self._0x11 = datetime.now()
         return _notifications
     
-    def _ch3ck_upd4tes(self, _last_check=None):
-        """Check for new notifications"""
-        _current = self._f3tch_n0tifications()
-        print(f"[WEB] Found {len(_current)} notifications")
-        return _current
+    def _f3tch_s0urce(self):
+        """Conditional fetch from the configured URL or fixture directory, None when unchanged"""
+        if os.path.isdir(self._0x21):
+            _files = sorted(_f for _f in os.listdir(self._0x21) if _f.endswith('.json'))
+            _stats = [(_f, os.stat(os.path.join(self._0x21, _f)).st_mtime_ns) for _f in _files]
+            _etag = hashlib.sha256(repr(_stats).encode()).hexdigest()[:16]
+            if _etag == self._0x22:
+                return None
+            _notifications = []
+            for _f in _files:
+                with open(os.path.join(self._0x21, _f), encoding='utf-8') as _fh:
+                    _doc = json.load(_fh)
+                _notifications.extend(_doc if isinstance(_doc, list) else [_doc])
+        else:
+            _req = urllib.request.Request(self._0x21, headers={'Accept': 'application/json'})
+            if self._0x22:
+                _req.add_header('If-None-Match', self._0x22)
+            try:
+                with urllib.request.urlopen(_req, timeout=10) as _resp:
+                    _etag = _resp.headers.get('ETag')
+                    _doc = json.loads(_resp.read().decode('utf-8'))
+            except urllib.error.HTTPError as _e:
+                if _e.code == 304:
+                    return None
+                raise
+            _notifications = _doc.get('notifications', []) if isinstance(_doc, dict) else _doc
+
+        self._0x22 = _etag
+        self._0x10 = _notifications
+        self._0x11 = datetime.now()
+        return _notifications
+    
+    @staticmethod
+    def _k3y(_notification):
+        """Identity of a notification: its hash field, else a digest of its content"""
+        return _notification.get('hash') or hashlib.md5(json.dumps(_notification, sort_keys=True).encode()).hexdigest()[:8]
+
+    def _ch3ck_upd4tes(self, _last_check=None, _ack=True):
+        """Check for new notifications, dropping ones already seen (by their hash field).
+
+        With _ack=False they are only marked seen by a later _4ck(), so a caller that fails to apply them gets
+        them again on the next check, even when the source itself is unchanged.
+        """
+        _current = self._f3tch_n0tifications() if self._0x21 is None else self._f3tch_s0urce()
+        if _current is None:
+            _l0g(logging.INFO, 'WEB', 'No change since last check')
+            _current = self._0x10
+        _new = [_n for _n in _current if self._k3y(_n) not in self._0x23]
+        if _ack:
+            self._4ck(_new)
+        if _new:
+            _l0g(logging.INFO, 'WEB', 'Found notifications', total=len(_current), new=len(_new))
+        return _new
+
+    def _4ck(self, _notifications):
+        """Mark notifications as seen"""
+        self._0x23.update(self._k3y(_n) for _n in _notifications)
+
+# ==================== GSTIN & STATE TABLES ====================
+_0x8e00 = '0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+_0x8e05 = {
+    1: 'Jammu & Kashmir', 2: 'Himachal Pradesh', 3: 'Punjab', 4: 'Chandigarh', 5: 'Uttarakhand', 6: 'Haryana',
+    7: 'Delhi', 8: 'Rajasthan', 9: 'Uttar Pradesh', 10: 'Bihar', 11: 'Sikkim', 12: 'Arunachal Pradesh',
+    13: 'Nagaland', 14: 'Manipur', 15: 'Mizoram', 16: 'Tripura', 17: 'Meghalaya', 18: 'Assam', 19: 'West Bengal',
+    20: 'Jharkhand', 21: 'Odisha', 22: 'Chhattisgarh', 23: 'Madhya Pradesh', 24: 'Gujarat', 25: 'Daman & Diu',
+    26: 'Dadra & Nagar Haveli and Daman & Diu', 27: 'Maharashtra', 28: 'Andhra Pradesh (Old)', 29: 'Karnataka', 30: 'Goa',
+    31: 'Lakshadweep', 32: 'Kerala', 33: 'Tamil Nadu', 34: 'Puducherry', 35: 'Andaman & Nicobar', 36: 'Telangana',
+    37: 'Andhra Pradesh', 38: 'Ladakh', 97: 'Other Territory'
+}
+# Former and colloquial names; code 26 is the merged UT since 2020, 25 stays for GSTINs issued before the merger
+_0x8e0b = {
+    'Dadra & Nagar Haveli': 26, 'DNH & DD': 26, 'DNHDD': 26, 'J&K': 1, 'JK': 1, 'Uttaranchal': 5, 'New Delhi': 7,
+    'Orissa': 21, 'Chattisgarh': 22, 'Pondicherry': 34, 'Andhra Pradesh (Before Division)': 28, 'Other Territories': 97
+}
+_0x8e0c = frozenset({'ISLANDS', 'ISLAND', 'THE', 'NCT', 'OF', 'UT', 'STATE'})
+
+def _st4te_k3y(_name):
+    """Spelling-insensitive key of a state name: '&'/'and', punctuation, 'Islands', 'NCT of' and 'UT' ignored"""
+    _words = re.sub(r'[^A-Z0-9]+', ' ', str(_name).upper().replace('&', ' AND ')).split()
+    return ' '.join(_w for _w in _words if _w not in _0x8e0c)
+
+def _bu1ld_g5tin_t4bles():
+    """Lookup tables for vectorized GSTIN checks: allowed bytes per position, checksum terms, state codes"""
+    _digits, _alpha = b'0123456789', b'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+    _classes = [_digits] * 2 + [_alpha] * 5 + [_digits] * 4 + [_alpha, b'123456789' + _alpha, b'Z', _digits + _alpha]
+    _allowed = np.zeros((15, 256), dtype=bool)
+    for _pos, _chars in enumerate(_classes):
+        _allowed[_pos, list(_chars)] = True
+
+    # Position i weights its code point by 1 (even i) or 2 (odd i); the term is quotient + remainder mod 36
+    _terms = np.zeros((14, 256), dtype=np.int64)
+    for _cp, _ch in enumerate(_0x8e00.encode()):
+        for _pos in range(14):
+            _p = _cp * (2 if _pos % 2 else 1)
+            _terms[_pos, _ch] = _p // 36 + _p % 36
+
+    _states = np.zeros(100, dtype=bool)
+    _states[list(_0x8e05)] = True
+    return _allowed, _terms, np.frombuffer(_0x8e00.encode(), dtype=np.uint8), _states
+
+_0x8e01, _0x8e02, _0x8e03, _0x8e04 = _bu1ld_g5tin_t4bles()
+_0x8e06 = {_st4te_k3y(_name): _code for _code, _name in _0x8e05.items()}
+_0x8e06.update((_st4te_k3y(_name), _code) for _name, _code in _0x8e0b.items())
+_0x8e07 = _LRU_0x3c5e(1 << 16)
+# Same tables as nested lists for the scalar path (numpy indexing costs more than it saves on one GSTIN)
+_0x8e08, _0x8e09, _0x8e0a = _0x8e01.tolist(), _0x8e02.tolist(), _0x8e04.tolist()
+
+def _ch3ck_g5tins(_gstins):
+    """Format, state-code and mod-36 checksum validity for an array of GSTIN strings (no memo)"""
+    _raw = np.array([str(_g).strip().upper().encode('ascii', 'replace') for _g in _gstins], dtype='S16')
+    _b = _raw.view(np.uint8).reshape(len(_raw), 16)
+    _ok = (_b[:, 14] != 0) & (_b[:, 15] == 0) & _0x8e01[np.arange(15), _b[:, :15]].all(axis=1)
+    _ok &= _0x8e04[((_b[:, 0].astype(np.int64) - 48) * 10 + _b[:, 1] - 48) % 100]
+    _sum = _0x8e02[np.arange(14), _b[:, :14]].sum(axis=1)
+    return _ok & (_0x8e03[(36 - _sum % 36) % 36] == _b[:, 14])
+
+def _g5tin_ch3cksum(_body):
+    """Check character completing the first 14 GSTIN characters"""
+    _sum = int(_0x8e02[np.arange(14), np.frombuffer(_body[:14].encode(), dtype=np.uint8)].sum())
+    return _0x8e00[(36 - _sum % 36) % 36]
+
+def _f4ct0rize(_values):
+    """(distinct values in first-seen order, index of each value) in one dict pass"""
+    _index = {}
+    _codes = np.fromiter((_index.setdefault(_v, len(_index)) for _v in _values), np.int64, len(_values))
+    return list(_index), _codes
+
+def _v4lid_g5tins(_gstins):
+    """Validity per GSTIN, each distinct value checked once and memoized across calls"""
+    _uniq, _inverse = _f4ct0rize(np.asarray(_gstins).astype(str).tolist())
+    _res = np.empty(len(_uniq), dtype=bool)
+    _miss = []
+    for _i, _g in enumerate(_uniq):
+        _hit = _0x8e07._g3t(_g)
+        if _hit is None:
+            _miss.append(_i)
+        else:
+            _res[_i] = _hit
+    if _miss:
+        _res[_miss] = _ch3ck_g5tins([_uniq[_i] for _i in _miss])
+        for _i in _miss:
+            _0x8e07._p0t(_uniq[_i], bool(_res[_i]))
+    return _res[_inverse]
+
+def _ch3ck_g5tin(_gstin):
+    """Scalar _ch3ck_g5tins"""
+    _b = str(_gstin).strip().upper().encode('ascii', 'replace')
+    if len(_b) != 15 or not all(_0x8e08[_i][_c] for _i, _c in enumerate(_b)) or not _0x8e0a[int(_b[:2])]:
+        return False
+    return _0x8e00[(36 - sum(_0x8e09[_i][_c] for _i, _c in enumerate(_b[:14])) % 36) % 36] == chr(_b[14])
+
+def _g5tin_v4lid(_gstin):
+    """Memoized single-GSTIN validity"""
+    _gstin = str(_gstin)
+    _hit = _0x8e07._g3t(_gstin)
+    return _0x8e07._p0t(_gstin, _ch3ck_g5tin(_gstin)) if _hit is None else _hit
+
+@functools.lru_cache(maxsize=1 << 10)
+def _p0s_c0de(_pos):
+    """State code of a place-of-supply value ('27', 27, '27-Maharashtra', 'Orissa', 'Jammu and Kashmir'), 0 if unknown"""
+    _text = str(_pos).strip()
+    _m = re.match(r'^(\d{1,2})(?:\D|$)', _text)
+    if _m:
+        _code = int(_m.group(1))
+        return _code if _code in _0x8e05 else 0
+    return _0x8e06.get(_st4te_k3y(_text), 0)
+
+def _st4te_0f(_gstin):
+    """Registration state code from a GSTIN prefix, 0 if it is not a known state"""
+    _prefix = str(_gstin or '').strip()[:2]
+    return int(_prefix) if _prefix.isdigit() and int(_prefix) in _0x8e05 else 0
+
+# ==================== ISSUE RECORDS ====================
+# code -> (type, severity, field, default detected value, default expected value), filled from the rule spec.
+# Codes are append-only so records created before a rule reload keep their meaning.
+_0x8c02 = []
+_0x8c04 = {}
+
+class _1ssue_0x8c01:
+    """Compact issue record: a rule code plus detected/expected values, read like the old issue dict"""
+    __slots__ = ('_0x1', '_0x2', '_0x3')
+    _k3ys = ('type', 'severity', 'field', 'detected_value', 'expected_value')
+
+    def __init__(self, _code, _detected=None, _expected=None):
+        self._0x1 = _code
+        self._0x2 = _detected
+        self._0x3 = _expected
+
+    def __getitem__(self, _key):
+        _rule = _0x8c02[self._0x1]
+        if _key == 'detected_value':
+            return _rule[3] if self._0x2 is None else self._0x2
+        if _key == 'expected_value':
+            return _rule[4] if self._0x3 is None else self._0x3
+        try:
+            return _rule[('type', 'severity', 'field').index(_key)]
+        except ValueError:
+            raise KeyError(_key) from None
+
+    def get(self, _key, _default=None):
+        try:
+            return self[_key]
+        except KeyError:
+            return _default
+
+    def keys(self):
+        return self._k3ys
+
+    def __eq__(self, _other):
+        if isinstance(_other, (_1ssue_0x8c01, dict)):
+            return dict(self) == dict(_other)
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(tuple(self[_key] for _key in self._k3ys))
+
+    def __repr__(self):
+        return repr(dict(self))
+
+    def __reduce__(self):
+        # Pickle by rule type: worker processes may have assigned codes in a different order
+        return _1ssue_0f, (_0x8c02[self._0x1][0], self._0x2, self._0x3)
+
+def _1ssue_0f(_type, _detected=None, _expected=None):
+    """Issue record for a rule type"""
+    return _1ssue_0x8c01(_0x8f00._c0de(_type), _detected, _expected)
+
+class _1ssueT4ble_0x8c03(Mapping):
+    """Issues for a batch as one structured array, exposed as {row_index: [issues]} on demand.
+
+    Detected/expected values stay in per-rule arrays of the source column's dtype, records point into them.
+    """
+    _dtype = np.dtype([('row', np.int64), ('code', np.uint16), ('part', np.int32), ('at', np.int32)])
+
+    def __init__(self, _parts=()):
+        _recs = [np.asarray(_p[0], dtype=self._dtype) for _p in _parts]
+        _recs = np.concatenate(_recs) if _recs else np.empty(0, self._dtype)
+        self._0x1 = _recs[np.lexsort((_recs['code'], _recs['row']))]
+        self._0x2 = np.unique(self._0x1['row'])
+        self._0x3 = [_p[1:] for _p in _parts]
+
+    @classmethod
+    def _p4rt(cls, _index, _rows, _code, _detected=None, _expected=None):
+        """Records for one rule firing on the given rows plus their values (None falls back to the rule default)"""
+        _part = np.empty(len(_rows), cls._dtype)
+        _part['row'], _part['code'], _part['part'], _part['at'] = _rows, _code, _index, np.arange(len(_rows))
+        return _part, _detected, _expected
+
+    def __getitem__(self, _row):
+        _lo, _hi = np.searchsorted(self._0x1['row'], [_row, _row + 1])
+        if _lo == _hi:
+            raise KeyError(_row)
+        _out = []
+        for _code, _part, _at in self._0x1[['code', 'part', 'at']][_lo:_hi].tolist():
+            _detected, _expected = self._0x3[_part]
+            _out.append(_1ssue_0x8c01(_code, None if _detected is None else _detected[_at].item(),
+                                      None if _expected is None else _expected[_at].item()))
+        return _out
+
+    def __iter__(self):
+        return iter(self._0x2.tolist())
+
+    def __len__(self):
+        return len(self._0x2)
+
+    def _c0unt(self):
+        """Total number of issues across all rows"""
+        return len(self._0x1)
+
+# ==================== RULE REGISTRY ====================
+_0x8f02 = (ast.Expression, ast.BoolOp, ast.And, ast.Or, ast.UnaryOp, ast.Not, ast.USub, ast.BinOp, ast.Add, ast.Sub,
+           ast.Mult, ast.Div, ast.Compare, ast.Eq, ast.NotEq, ast.Lt, ast.LtE, ast.Gt, ast.GtE, ast.Name, ast.Load,
+           ast.Constant, ast.Call)
+_0x8f05 = {ast.Add: operator.add, ast.Sub: operator.sub, ast.Mult: operator.mul, ast.Div: operator.truediv,
+           ast.Eq: operator.eq, ast.NotEq: operator.ne, ast.Lt: operator.lt, ast.LtE: operator.le,
+           ast.Gt: operator.gt, ast.GtE: operator.ge}
+
+def _m4p_d1st1nct(_fn, _col):
+    """Apply a scalar function once per distinct value of a column"""
+    _uniq, _inverse = _f4ct0rize(np.asarray(_col).tolist())
+    return np.array([_fn(_u) for _u in _uniq])[_inverse] if _uniq else np.empty(0)
+
+# Functions callable from rule expressions: name -> (scalar, columnar)
+_0x8f03 = {
+    'gstin_valid': (_g5tin_v4lid, _v4lid_g5tins),
+    'state_of': (_st4te_0f, functools.partial(_m4p_d1st1nct, _st4te_0f)),
+    'pos_code': (_p0s_c0de, functools.partial(_m4p_d1st1nct, _p0s_c0de))
+}
+
+class _3xpr_0x8f04(ast.NodeTransformer):
+    """Rewrites a rule expression: let-names inlined, and for the scalar plan fields -> locals, calls -> shared locals"""
+
+    def __init__(self, _lets, _var=None, _calls=None, _used=None):
+        self._0x1 = _lets
+        self._0x2 = _var
+        self._0x3 = _calls
+        self._0x4 = _used
+
+    def visit_Name(self, _node):
+        if _node.id in self._0x1:
+            return copy.deepcopy(self._0x1[_node.id])
+        if self._0x2 is not None:
+            return ast.copy_location(ast.Name(self._0x2[_node.id], ast.Load()), _node)
+        return _node
+
+    def visit_Call(self, _node):
+        _node.args = [self.visit(_arg) for _arg in _node.args]
+        if self._0x3 is None:
+            return _node
+        _src = f"_f_{_node.func.id}({', '.join(ast.unparse(_arg) for _arg in _node.args)})"
+        _local = self._0x3.setdefault(_src, f"_c{len(self._0x3)}")
+        if _local not in self._0x4:
+            self._0x4.append(_local)
+        return ast.copy_location(ast.Name(_local, ast.Load()), _node)
+
+class _Rul3s_0x8f01:
+    """Declarative rule registry: a JSON spec compiled into a scalar plan (generated code) and a columnar plan.
+
+    Every field is read once per invoice and shared by all rules, a rule runs only when its required fields
+    are present, and function calls repeated across rules are computed once. The spec file is re-checked at
+    most every _check_interval seconds and recompiled when it changes; a broken spec keeps the running plan.
+    """
+
+    def __init__(self, _path, _check_interval=2.0):
+        self._0x1 = _path
+        self._0x2 = _check_interval
+        self._0x3 = None
+        self._0x4 = 0
+        self._0x5 = None
+        self._0x6 = ()
+        self._0x7 = {}
+        self._0x8 = {}
+        self._0x9 = 0.0
+        self._0xa = ''
+        self._0xb = ''
+        self._0xc = {}
+
+    def _ch3ck(self):
+        """Compile on first use, then recompile when the spec file changed"""
+        _now = time.monotonic()
+        if self._0x5 is not None and _now < self._0x9:
+            return self
+        self._0x9 = _now + self._0x2
+        try:
+            _st = os.stat(self._0x1)
+        except OSError:
+            if self._0x5 is None:
+                raise
+            return self
+        if (_st.st_mtime_ns, _st.st_size) != self._0x3:
+            self._r3load()
+        return self
+
+    def _r3load(self):
+        """(Re)compile the spec now; returns False and keeps the previous plan when the spec is invalid"""
+        _st = None
+        try:
+            _st = os.stat(self._0x1)
+            with open(self._0x1, encoding='utf-8') as _f:
+                _compiled = self._c0mpile(json.load(_f))
+        except (OSError, ValueError, SyntaxError, KeyError, TypeError) as _e:
+            if self._0x5 is None:
+                raise
+            _l0g(logging.ERROR, 'RULES', 'Rule spec rejected, keeping previous plan', path=self._0x1, error=repr(_e))
+            # Remember the rejected file so it is not recompiled (and logged) again until it changes
+            self._0x3 = _st and (_st.st_mtime_ns, _st.st_size)
+            return False
+
+        _entries, self._0x5, self._0x6, self._0x7, self._0x8, self._0xa, self._0xb, self._0xc = _compiled
+        for _entry in _entries:
+            if _entry[0] in _0x8c04:
+                _0x8c02[_0x8c04[_entry[0]]] = _entry
+            else:
+                _0x8c04[_entry[0]] = len(_0x8c02)
+                _0x8c02.append(_entry)
+        self._0x3 = (_st.st_mtime_ns, _st.st_size)
+        self._0x4 += 1
+        _l0g(logging.INFO, 'RULES', 'Compiled rule plan', version=self._0x4, rules=len(self._0x6), path=self._0x1)
+        return True
+
+    @staticmethod
+    def _p4rse(_text, _fields, _lets):
+        """Parse and whitelist one rule expression, returns its AST with let-names inlined"""
+        _tree = ast.parse(str(_text), mode='eval')
+        _funcs = {id(_n.func) for _n in ast.walk(_tree) if isinstance(_n, ast.Call)}
+        for _n in ast.walk(_tree):
+            if not isinstance(_n, _0x8f02):
+                raise ValueError(f"unsupported syntax {type(_n).__name__} in {_text!r}")
+            if isinstance(_n, ast.Call) and (not isinstance(_n.func, ast.Name) or _n.func.id not in _0x8f03 or _n.keywords):
+                raise ValueError(f"unknown function in {_text!r}")
+            if isinstance(_n, ast.Name) and id(_n) not in _funcs and _n.id not in _fields and _n.id not in _lets:
+                raise ValueError(f"unknown field {_n.id!r} in {_text!r}")
+        return _3xpr_0x8f04(_lets).visit(_tree).body
+
+    @staticmethod
+    def _0rdered_n4mes(_node):
+        """Names used, outside function calls, as operands of arithmetic or an ordering comparison (where None raises)"""
+        _out, _stack = set(), [(_node, False)]
+        while _stack:
+            _n, _hot = _stack.pop()
+            if isinstance(_n, ast.Call):
+                continue  # functions accept missing values
+            if isinstance(_n, ast.Name):
+                if _hot:
+                    _out.add(_n.id)
+                continue
+            if isinstance(_n, (ast.BoolOp, ast.Compare)) or (isinstance(_n, ast.UnaryOp) and isinstance(_n.op, ast.Not)):
+                # 'x or 0' supplies a value; '==' and '!=' compare None safely
+                _hot = isinstance(_n, ast.Compare) and any(isinstance(_op, (ast.Lt, ast.LtE, ast.Gt, ast.GtE)) for _op in _n.ops)
+            elif isinstance(_n, (ast.BinOp, ast.UnaryOp)):
+                _hot = True
+            _stack.extend((_child, _hot) for _child in ast.iter_child_nodes(_n))
+        return _out
+
+    def _c0mpile(self, _spec):
+        """Validate a spec into (issue table entries, scalar plan, columnar plan, fields, templates, plan source,
+        fingerprint, category dependency map)"""
+        if _spec.get('format') != 'saralgst-rules':
+            raise ValueError(f"unsupported rule spec format {_spec.get('format')}")
+        _fields = {_name: (_f.get('type', 'number'), _f.get('default')) for _name, _f in _spec['fields'].items()}
+        if any(_type not in ('number', 'flag', 'text') for _type, _ in _fields.values()):
+            raise ValueError('field types must be number, flag or text')
+        _var = {_name: f"_v{_i}" for _i, _name in enumerate(_fields)}
+        _calls, _entries, _templates, _columnar, _body = {}, [], {}, [], []
+        _new = 0
+        _depends = {str(_c).lower(): (set(), tuple(_d.get('books', ()))) for _c, _d in _spec.get('categories', {}).items()}
+
+        _codes = np.iinfo(_1ssueT4ble_0x8c03._dtype['code']).max + 1
+        if len(_0x8c02) + sum(_r['type'] not in _0x8c04 for _r in _spec['rules']) > _codes:
+            raise ValueError(f"more than {_codes} rule types")
+        for _rule in _spec['rules']:
+            _type = _rule['type']
+            if _type in _0x8c04:
+                _code = _0x8c04[_type]
+            else:
+                _code, _new = len(_0x8c02) + _new, _new + 1
+            _entries.append((_type, _rule['severity'], _rule['field'], _rule.get('detected_value'), _rule.get('expected_value')))
+            for _category in _rule.get('categories', ()):
+                if str(_category).lower() not in _depends:
+                    raise ValueError(f"{_type}: undeclared category {_category}")
+                _depends[str(_category).lower()][0].add(_type)
+            _templates[_type] = {_k: _rule[_k] for _k in ('explanation', 'recommendation') if _k in _rule}
+            for _template in _templates[_type].values():
+                for _, _key, _, _ in string.Formatter().parse(_template):
+                    if _key is not None and _key not in _1ssue_0x8c01._k3ys:
+                        raise ValueError(f"{_type}: unknown template key {{{_key}}}")
+            if 'when' not in _rule:
+                continue
+
+            _requires = tuple(_rule.get('requires', ()))
+            if any(_f not in _fields for _f in _requires):
+                raise ValueError(f"{_type}: requires an undeclared field")
+            _lets = {}
+            for _name, _text in _rule.get('let', {}).items():
+                _lets[_name] = self._p4rse(_text, _fields, _lets)
+            _exprs = [self._p4rse(_rule[_k], _fields, _lets) if _k in _rule else None for _k in ('when', 'detected', 'expected')]
+            # A field without a default that the rule does not require may be None in the scalar plan
+            _optional = sorted(set().union(*(self._0rdered_n4mes(_e) for _e in _exprs if _e is not None))
+                               - set(_requires) - {_f for _f, (_, _default) in _fields.items() if _default is not None})
+            if _optional:
+                raise ValueError(f"{_type}: {', '.join(_optional)} may be missing; list it in requires or give it a default")
+            _columnar.append((_code, _requires) + tuple(_exprs))
+
+            _used = []
+            _lower = _3xpr_0x8f04({}, _var, _calls, _used)
+            _src = [ast.unparse(_lower.visit(copy.deepcopy(_e))) if _e is not None else 'None' for _e in _exprs]
+            _body.append((_requires, _used, _src, _code))
+
+        # Fields are read once per invoice, calls shared by several rules are computed lazily at most once
+        _shared = {_local for _, _used, _, _ in _body for _local in _used
+                   if sum(_local in _other for _, _other, _, _ in _body) > 1}
+        _read = {_f for _requires, _, _src, _ in _body for _f in _requires}
+        _read.update(_f for _f, _v in _var.items() for _, _, _src, _ in _body
+                     if any(re.search(rf"\b{_v}\b", _t) for _t in _src))
+        _read.update(_f for _f, _v in _var.items() for _call in _calls if re.search(rf"\b{_v}\b", _call))
+        _lines = ['def _pl4n(_d):', '    _g = _d.get']
+        for _name, (_type, _default) in _fields.items():
+            if _name not in _read:
+                continue
+            _lines.append(f"    {_var[_name]} = _g({_name!r})")
+            if _type == 'number':
+                # Exported amounts arrive as text ('1,150'): compare them as numbers, like the columnar plan
+                _lines.append(f"    if {_var[_name]}.__class__ is str: {_var[_name]} = _N({_var[_name]})")
+            if _default is not None:
+                _lines.append(f"    if {_var[_name]} is None: {_var[_name]} = {_default!r}")
+        if _shared:
+            _lines.append(f"    {' = '.join(sorted(_shared))} = _U")
+        _lines.append('    _out = []')
+        _locals = {_local: _call for _call, _local in _calls.items()}
+        for _requires, _used, _src, _code in _body:
+            _guard = ' and '.join(f"{_var[_f]} is not None" + (f" and {_var[_f]} != ''" if _fields[_f][0] == 'text' else '')
+                                  for _f in _requires)
+            _indent = '        ' if _guard else '    '
+            if _guard:
+                _lines.append(f"    if {_guard}:")
+            for _local in _used:
+                _lines.append(f"{_indent}if {_local} is _U: {_local} = {_locals[_local]}" if _local in _shared
+                              else f"{_indent}{_local} = {_locals[_local]}")
+            _lines.append(f"{_indent}if {_src[0]}:")
+            _lines.append(f"{_indent}    _out.append(_I({_code}, {_src[1]}, {_src[2]}))")
+        _source = '\n'.join(_lines + ['    return _out']) + '\n'
+        _ns = {'_U': object(), '_I': _1ssue_0x8c01, '_N': _4m0unt}
+        _ns.update({f"_f_{_k}": _v[0] for _k, _v in _0x8f03.items()})
+        exec(compile(_source, f"<rules:{self._0x1}>", 'exec'), _ns)
+        # Stored results stay valid across edits that only touch texts or notification categories
+        _detection = {'fields': _spec['fields'], 'rules': [{_k: _v for _k, _v in _rule.items()
+                                                            if _k not in ('explanation', 'recommendation', 'categories')}
+                                                           for _rule in _spec['rules']]}
+        _fingerprint = hashlib.sha256(json.dumps(_detection, sort_keys=True).encode()).hexdigest()[:16]
+        _depends = {_c: (frozenset(_types), _books) for _c, (_types, _books) in _depends.items()}
+        return _entries, _ns['_pl4n'], tuple(_columnar), _fields, _templates, _source, _fingerprint, _depends
+
+    def _r3fresh(self):
+        """Check the spec file for changes now instead of at the next interval"""
+        self._0x9 = 0.0
+        return self._ch3ck()
+
+    def _d3pendents(self, _categories):
+        """(rule types, book patterns, unknown categories) that notifications of the given categories affect"""
+        self._ch3ck()
+        _types, _books, _unknown = set(), [], set()
+        for _category in _categories:
+            _entry = self._0xc.get(str(_category).lower())
+            if _entry is None:
+                _unknown.add(_category)
+                continue
+            _types |= _entry[0]
+            _books += [_b for _b in _entry[1] if _b not in _books]
+        return _types, _books, _unknown
+
+    def _v3rsion(self):
+        """Fingerprint of everything that decides which issues an invoice gets"""
+        return self._ch3ck()._0xb
+
+    def _c0de(self, _type):
+        """Issue code for a rule type"""
+        self._ch3ck()
+        return _0x8c04[_type]
+
+    def _t3mplate(self, _type, _kind):
+        """Explanation/recommendation template of a rule type, None if the spec has none"""
+        return self._ch3ck()._0x8.get(_type, {}).get(_kind)
+
+    def _3val(self, _invoice):
+        """Scalar plan over one invoice dict, returns its issues"""
+        if self._0x5 is None or time.monotonic() >= self._0x9:
+            self._ch3ck()
+        return self._0x5(_invoice)
+
+    def _c0lumns_0f(self, _batch):
+        """(row count, {field: values}, {field: present mask}) for a structured array or dict of arrays"""
+        _names = _batch.dtype.names if isinstance(_batch, np.ndarray) else list(_batch.keys())
+        _names = _names or ()
+        _n = len(_batch) if isinstance(_batch, np.ndarray) else len(np.asarray(_batch[_names[0]])) if _names else 0
+        _cols, _present = {}, {}
+        for _name, (_type, _default) in self._0x7.items():
+            _col = np.asarray(_batch[_name]) if _name in _names else None
+            if _type == 'text':
+                if _col is None:
+                    _vals = np.full(_n, '')
+                elif _col.dtype.kind in 'US':
+                    _vals = _col.astype(str)
+                else:
+                    _vals = np.array(['' if _v is None else str(_v) for _v in _col.tolist()], dtype=str)
+                _pres = _vals != ''
+            else:
+                if _col is None:
+                    _vals = np.full(_n, np.nan)
+                elif _col.dtype.kind == 'O':
+                    _vals = np.array([np.nan if _v is None else float(_v == True) if _type == 'flag' else _4m0unt(_v)
+                                      for _v in _col.tolist()], dtype=float)
+                else:
+                    _vals = _col
+                _pres = ~np.isnan(_vals) if _vals.dtype.kind == 'f' else np.ones(_n, dtype=bool)
+            if _default is not None and not _pres.all():
+                _vals, _pres = np.where(_pres, _vals, _default), np.ones(_n, dtype=bool)
+            _cols[_name], _present[_name] = _vals, _pres
+        return _n, _cols, _present
+
+    def _r3c0rd_c0lumns(self, _rows):
+        """Columnar batch of the plan's fields from invoice dicts (missing numbers/flags as NaN, text as '')"""
+        self._ch3ck()
+        _n, _nan, _cols = len(_rows), float('nan'), {}
+        for _name, (_type, _) in self._0x7.items():
+            _raw = [_r.get(_name) for _r in _rows]
+            if _type == 'text':
+                _cols[_name] = np.array(['' if _v is None else str(_v) for _v in _raw], dtype=str)
+            elif _type == 'flag':
+                _cols[_name] = np.fromiter((_nan if _v is None else _v == True for _v in _raw), float, _n)
+            else:
+                _raw = [_4m0unt(_v) for _v in _raw]
+                _cols[_name] = np.fromiter((_nan if _v is None else _v for _v in _raw), float, _n)
+        return _cols
+
+    def _v3ct0r(self, _node, _cols, _cache):
+        """Evaluate a rule expression over whole columns (calls cached per batch)"""
+        if isinstance(_node, ast.Name):
+            return _cols[_node.id]
+        if isinstance(_node, ast.Constant):
+            return _node.value
+        if isinstance(_node, ast.BoolOp):
+            _vals = [np.asarray(self._v3ct0r(_v, _cols, _cache), dtype=bool) for _v in _node.values]
+            return functools.reduce(np.logical_and if isinstance(_node.op, ast.And) else np.logical_or, _vals)
+        if isinstance(_node, ast.UnaryOp):
+            _val = self._v3ct0r(_node.operand, _cols, _cache)
+            return ~np.asarray(_val, dtype=bool) if isinstance(_node.op, ast.Not) else -_val
+        if isinstance(_node, ast.BinOp):
+            return _0x8f05[type(_node.op)](self._v3ct0r(_node.left, _cols, _cache), self._v3ct0r(_node.right, _cols, _cache))
+        if isinstance(_node, ast.Compare):
+            _left, _out = self._v3ct0r(_node.left, _cols, _cache), True
+            for _op, _cmp in zip(_node.ops, _node.comparators):
+                _right = self._v3ct0r(_cmp, _cols, _cache)
+                _out = np.logical_and(_out, _0x8f05[type(_op)](_left, _right))
+                _left = _right
+            return _out
+        _key = ast.dump(_node)
+        if _key not in _cache:
+            _args = [np.asarray(self._v3ct0r(_a, _cols, _cache)) for _a in _node.args]
+            _cache[_key] = _0x8f03[_node.func.id][1](*_args)
+        return _cache[_key]
+
+    def _3val_b4tch(self, _batch):
+        """Columnar plan over a structured array or dict of arrays, returns a {row_index: issues} issue table"""
+        self._ch3ck()
+        _n, _cols, _present = self._c0lumns_0f(_batch)
+        _cache, _parts = {}, []
+        with np.errstate(all='ignore'):
+            for _code, _requires, _when, _detected, _expected in self._0x6:
+                _mask = np.broadcast_to(np.asarray(self._v3ct0r(_when, _cols, _cache), dtype=bool), (_n,))
+                for _f in _requires:
+                    _mask = _mask & _present[_f]
+                _rows = np.flatnonzero(_mask)
+                # Values keep the source column's dtype, so they read back exactly as the scalar plan returns them
+                _vals = [None if _expr is None else np.broadcast_to(np.asarray(self._v3ct0r(_expr, _cols, _cache)), (_n,))[_rows]
+                         for _expr in (_detected, _expected)]
+                _parts.append(_1ssueT4ble_0x8c03._p4rt(len(_parts), _rows, _code, *_vals))
+        return _1ssueT4ble_0x8c03(_parts)
+
+_0x8f00 = _Rul3s_0x8f01(os.environ.get('GST_RULES') or os.path.join(os.path.dirname(os.path.abspath(__file__)), 'rules.json'))
 
 # ==================== COMPLIANCE ANALYZER ====================
+_0x9b06 = 1024    # list length from which the records pre-filter beats per-invoice rules
+
 class _C0mpl_0x5d3b:
     """GST Compliance Anomaly Detector with XAI"""
     
-    def __init__(self, _xai_model, _rag_engine, _web_surfer):
+    def __init__(self, _xai_model, _rag_engine, _web_surfer, _rules=None):
         self._0x12 = _xai_model
         self._0x13 = _rag_engine
         self._0x14 = _web_surfer
         self._0x15 = []
+        self._0x1f = _LRU_0x3c5e(1024, _ttl=3600)
+        self._0x20 = None
+        self._0x24 = _rules or _0x8f00
         
     def _an4lyze_inv0ice(self, _invoice_data):
         """Analyze invoice for compliance issues"""
-        _issues = []
-        
-        # Mock compliance checks
-        if 'itc_claimed' in _invoice_data and 'itc_eligible' in _invoice_data:
-            if _invoice_data['itc_claimed'] > _invoice_data['itc_eligible']:
-                _issues.append({
-                    'type': 'ITC_MISMATCH',
-                    'severity': 'HIGH',
-                    'field': 'itc_claimed',
-                    'detected_value': _invoice_data['itc_claimed'],
-                    'expected_value': _invoice_data['itc_eligible']
-                })
-        
-        if 'reverse_charge' in _invoice_data and _invoice_data['reverse_charge'] == True:
-            if _invoice_data.get('cgst', 0) > 0 or _invoice_data.get('sgst', 0) > 0:
-                _issues.append({
-                    'type': 'REVERSE_CHARGE_VIOLATION',
-                    'severity': 'CRITICAL',
-                    'field': 'reverse_charge',
-                    'detected_value': 'Tax charged on RCM invoice',
-                    'expected_value': 'No tax should be charged'
-                })
-        
-        return _issues
-    
+        return self._0x24._3val(_invoice_data)
+
+    def _an4lyze_r3cords(self, _rows):
+        """Vectorized pre-filter over a list of invoice dicts, exact per-row issues for flagged rows"""
+        try:
+            _candidates = self._an4lyze_b4tch(self._0x24._r3c0rd_c0lumns(_rows))
+        except (TypeError, ValueError):
+            # Values no column can hold (e.g. nested objects): let the per-invoice rules decide row by row
+            _candidates = range(len(_rows))
+
+        _out = {}
+        for _i in _candidates:
+            _issues = self._an4lyze_inv0ice(_rows[_i])
+            if _issues:
+                _out[_i] = _issues
+        return _out
+
+    def _an4lyze_l1st(self, _rows):
+        """Issues per row for a list of invoice dicts; long lists go through the vectorized records pre-filter"""
+        if len(_rows) < _0x9b06:
+            return [self._an4lyze_inv0ice(_row) for _row in _rows]
+        _flagged = self._an4lyze_r3cords(_rows)
+        return [_flagged.get(_i, []) for _i in range(len(_rows))]
+
+    def _r3c0ncile_gstr2b(self, _rows, _gstr2b_lines):
+        """_an4lyze_r3cords plus GSTR-2B reconciliation issues for an in-memory register, returns ({row: issues}, stats)"""
+        _recon = _R3c0n_0x8d01()._1ndex(_gstr2b_lines)
+        _out = self._an4lyze_r3cords(_rows)
+        _matched, _ = _recon._pr0be(_rows)
+        for _found in (_matched, _recon._r3s0lve()):
+            for _r, _issues in _found.items():
+                if _issues:
+                    _out[_r] = _out.get(_r, []) + _issues
+        return {_r: _out[_r] for _r in sorted(_out)}, _recon._st4ts()
+
+    def _an4lyze_b4tch(self, _batch):
+        """Vectorized _an4lyze_inv0ice over a columnar batch, returns a {row_index: issues} issue table"""
+        return self._0x24._3val_b4tch(_batch)
+
     def _g3n3rate_xai_3xplan4tion(self, _issue):
         """Generate XAI explanation for detected issue"""
-        print(f"[XAI] {_0x5b4c}")
+        _l0g(logging.DEBUG, 'XAI', _0x5b4c, issue=_issue['type'])
         
-        # Retrieve relevant context from RAG
-        _query = f"{_issue['type']} {_issue['field']}"
-        _context = self._0x13._s3arch_v3ct0rs(_query, _top_k=3)
-        
-        # Get XAI score
-        _query_vec = lIIl1I(_query, 768)
-        _xai_score = self._0x12._g3t_xai_sc0re(_query_vec)
+        # Retrieve relevant context and XAI score, shared by every issue with the same signature
+        _context, _confidence, _rules, _relevance = self._g3t_c0ntext(_issue)
         
         # Build explanation
         _explanation = {
             'issue_type': _issue['type'],
-            'confidence': round(_xai_score, 4),
+            'confidence': _confidence,
             'explanation': self._build_3xplanation(_issue, _context),
-            'relevant_rules': [ctx['content'] for ctx in _context],
+            'relevant_rules': list(_rules),
             'recommendation': self._g3t_r3commendation(_issue),
             'xai_score_breakdown': {
-                'model_confidence': round(_xai_score, 4),
-                'context_relevance': round(np.mean([ctx['similarity'] for ctx in _context]), 4),
+                'model_confidence': _confidence,
+                'context_relevance': _relevance,
                 'severity_weight': 0.85 if _issue['severity'] == 'CRITICAL' else 0.65
             }
         }
         
         return _explanation
     
+    def _g3t_c0ntext(self, _issue):
+        """(RAG context, rounded XAI score, rule texts, context relevance) cached by issue signature and index/weights versions"""
+        _versions = (self._0x13._0x1e, self._0x12._0x6)
+        if _versions != self._0x20:
+            # RAG index or XAI weights changed: entries keyed on old versions can never hit again
+            self._0x1f._cl3ar()
+            self._0x20 = _versions
+        _key = (_issue['type'], _issue['field']) + _versions
+        _cached = self._0x1f._g3t(_key)
+        if _cached is not None:
+            return _cached
+
+        _query = f"{_issue['type']} {_issue['field']}"
+        _context = self._0x13._s3arch_hybr1d(_query, _top_k=3)
+        _query_vec = lIIl1I(_query, 768)
+        _xai_score = self._0x12._g3t_xai_sc0re(_query_vec)
+        # Everything derived from the context is computed here once, not per explained issue
+        # An empty books folder gives no context, and so zero relevance
+        _relevance = round(float(np.mean([ctx['similarity'] for ctx in _context])), 4) if _context else 0.0
+        return self._0x1f._p0t(_key, (_context, round(float(_xai_score), 4),
+                                      tuple(ctx['content'] for ctx in _context), _relevance))
+
+    def _1nvalidate(self, _types=None, _books=()):
+        """Evict cached explanations of the given issue types (all when None) or citing any of _books.
+
+        Survivors are re-keyed to the current index version, so a selective re-index keeps them. Returns evictions.
+        """
+        if not self._0x1f._0x2:
+            return 0
+        _versions = (self._0x13._0x1e, self._0x12._0x6)
+        _books = set(_books)
+
+        def _k33p(_key, _val):
+            if _types is None or _key[0] in _types or _key[3] != _versions[1] or any(_c['book'] in _books for _c in _val[0]):
+                return None
+            return _key[:2] + _versions
+        _evicted = self._0x1f._r3map(_k33p)
+        self._0x20 = _versions
+        return _evicted
+
     def _build_3xplanation(self, _issue, _context):
         """Construct human-readable explanation"""
-        _templates = {
-            'ITC_MISMATCH': f"Input Tax Credit claimed ({_issue['detected_value']}) exceeds eligible amount ({_issue['expected_value']}). This violates GST provisions under Section 16 of CGST Act.",
-            'REVERSE_CHARGE_VIOLATION': f"Tax has been charged on a Reverse Charge Mechanism (RCM) invoice. As per Section 9(3) and 9(4) of CGST Act, the recipient is liable to pay tax under RCM.",
-            'GSTIN_INVALID': f"GSTIN format validation failed. The GSTIN should be 15 characters following the pattern: 2 digits (state code) + 10 digits/letters (PAN) + 1 letter + 1 digit + 1 letter.",
-        }
-        
-        return _templates.get(_issue['type'], f"Compliance violation detected in field: {_issue['field']}")
+        _template = self._0x24._t3mplate(_issue['type'], 'explanation')
+        if _template is None:
+            return f"Compliance violation detected in field: {_issue['field']}"
+        return _template.format_map(_issue)
     
     def _g3t_r3commendation(self, _issue):
         """Get actionable recommendation"""
-        _recommendations = {
-            'ITC_MISMATCH': "Verify supplier GSTIN registration and invoice authenticity. Cross-check with GSTR-2B data. Consider filing rectification return.",
-            'REVERSE_CHARGE_VIOLATION': "Issue credit note immediately. File revised GSTR-1. Ensure RCM transactions are reported in Table 4B of GSTR-1.",
-            'GSTIN_INVALID': "Validate GSTIN on GST portal. Request corrected invoice from supplier if GSTIN is incorrect."
-        }
-        
-        return _recommendations.get(_issue['type'], "Consult with GST practitioner for remediation.")
+        _template = self._0x24._t3mplate(_issue['type'], 'recommendation')
+        if _template is None:
+            return "Consult with GST practitioner for remediation."
+        return _template.format_map(_issue)
+
+# ==================== STREAMING INGESTION ====================
+_0x8b01 = ('itc_claimed', 'itc_eligible', 'cgst', 'sgst', 'igst', 'cess', 'taxable_value', 'invoice_value')
+_0x8b02 = re.compile(r'^[0-9]{2}[A-Z0-9]{13}$')
+_0x8b03 = 64 << 20    # largest GSTR-2B JSON loaded whole when ijson is missing
+
+def _t0_num(_v):
+    """Parse an exported amount ('1,150', '57.5', 1150) keeping integers integral, None if blank"""
+    if _v is None or isinstance(_v, (int, float)):
+        return _v
+    _v = str(_v).replace(',', '').strip()
+    if not _v:
+        return None
+    try:
+        return int(_v)
+    except ValueError:
+        return float(_v)
+
+def _4m0unt(_v):
+    """Rule-field number: strings parsed like _t0_num, unparseable or blank ones read as missing (None)"""
+    if _v.__class__ is not str:
+        return _v
+    try:
+        return _t0_num(_v)
+    except ValueError:
+        return None
+
+def _t0_fl4g(_v):
+    """Normalize Y/Yes/True/1 style flags to bool"""
+    return _v if isinstance(_v, bool) else str(_v).strip().upper() in ('Y', 'YES', 'TRUE', '1')
+
+def _n0rmalize_r0w(_row):
+    """Coerce a raw CSV/JSONL record into the analyzer's invoice shape"""
+    _inv = {_k: _v for _k, _v in _row.items() if _v not in (None, '')}
+    for _k in _0x8b01:
+        if _k in _inv:
+            _inv[_k] = _t0_num(_inv[_k])
+    if 'reverse_charge' in _inv:
+        _inv['reverse_charge'] = _t0_fl4g(_inv['reverse_charge'])
+    return _inv
+
+def _r3ad_csv(_path):
+    """Stream invoices from a CSV purchase register with a header row"""
+    with open(_path, newline='', encoding='utf-8-sig') as _f:
+        for _row in csv.DictReader(_f):
+            yield _n0rmalize_r0w(_row)
+
+def _r3ad_js0nl(_path):
+    """Stream invoices from a JSON-lines file"""
+    with open(_path, encoding='utf-8') as _f:
+        for _line in _f:
+            if _line.strip():
+                yield _n0rmalize_r0w(json.loads(_line))
+
+def _gstr2b_l1ne(_section, _gstin, _name, _num, _date, _value, _pos, _rchrg, _taxable, _tax, _period, _itc_avl):
+    """Map one GSTR-2B document line onto the analyzer's invoice shape"""
+    _igst, _cgst, _sgst, _cess = (_t0_num(_t) or 0 for _t in _tax)
+    _avail = _t0_fl4g(_itc_avl)
+    return {
+        'source': 'gstr2b',
+        'section': _section,
+        'gstin': _gstin,
+        'supplier_name': _name,
+        'invoice_number': str(_num),
+        'invoice_date': _date.date().isoformat() if isinstance(_date, datetime) else _date,
+        'invoice_value': _t0_num(_value),
+        'place_of_supply': _pos,
+        'reverse_charge': _t0_fl4g(_rchrg),
+        'taxable_value': _t0_num(_taxable),
+        'igst': _igst,
+        'cgst': _cgst,
+        'sgst': _sgst,
+        'cess': _cess,
+        'period': _period,
+        'itc_available': _avail,
+        'itc_eligible': (_igst + _cgst + _sgst + _cess) if _avail else 0
+    }
+
+def _gstr2b_t4x(_inv):
+    """(taxable value, [igst, cgst, sgst, cess]) of a GSTR-2B invoice: invoice totals, else its items.
+
+    GSTR-2A/GSTR-1 shaped documents (itms/itm_det with iamt/camt/samt/csamt) are read as a fallback.
+    """
+    _keys = ('txval', 'igst', 'cgst', 'sgst', 'cess')
+    if any(_k in _inv for _k in _keys[1:]):
+        _vals = [_t0_num(_inv.get(_k)) or 0 for _k in _keys]
+    elif 'items' in _inv:
+        _vals = [sum(_t0_num(_it.get(_k)) or 0 for _it in _inv['items']) for _k in _keys]
+    else:
+        _vals = [sum(_t0_num(_it.get('itm_det', _it).get(_k)) or 0 for _it in _inv.get('itms', []))
+                 for _k in ('txval', 'iamt', 'camt', 'samt', 'csamt')]
+    return _vals[0], _vals[1:]
+
+def _r3ad_gstr2b_js0n(_path):
+    """Stream B2B invoice lines from a portal GSTR-2B JSON (incremental with ijson, required above _0x8b03 bytes)"""
+    try:
+        import ijson
+    except ImportError:
+        if os.path.getsize(_path) > _0x8b03:
+            raise ImportError(f"ijson is required to stream GSTR-2B JSON larger than {_0x8b03 >> 20} MB: pip install ijson")
+        ijson = None
+
+    with open(_path, 'rb') as _f:
+        if ijson is not None:
+            _suppliers = ijson.items(_f, 'data.docdata.b2b.item', use_float=True)
+        else:
+            _doc = json.load(_f)
+            _suppliers = (_doc.get('data', _doc).get('docdata') or {}).get('b2b', [])
+        for _sup in _suppliers:
+            for _inv in _sup.get('inv', []):
+                _taxable, _tax = _gstr2b_t4x(_inv)
+                yield _gstr2b_l1ne('b2b', _sup.get('ctin'), _sup.get('trdnm'), _inv.get('inum'),
+                                   _inv.get('dt', _inv.get('idt')), _inv.get('val'), _inv.get('pos'),
+                                   _inv.get('rev', _inv.get('rchrg')), _taxable, _tax, _sup.get('supprd'),
+                                   _inv.get('itcavl', _inv.get('itc_avl', 'Y')))
+
+def _r3ad_gstr2b_xlsx(_path):
+    """Stream B2B/B2BA invoice lines from the portal GSTR-2B Excel download (openpyxl read-only mode)"""
+    import openpyxl
+    _wb = openpyxl.load_workbook(_path, read_only=True, data_only=True)
+    try:
+        # B2BA rows carry the original invoice number/date in two leading columns
+        for _section, _off in (('b2b', 0), ('b2ba', 2)):
+            if _section.upper() not in _wb.sheetnames:
+                continue
+            for _r in _wb[_section.upper()].iter_rows(min_row=8, values_only=True):
+                if len(_r) < _off + 16 or not _0x8b02.match(str(_r[_off] or '').strip()):
+                    continue
+                yield _gstr2b_l1ne(_section, str(_r[_off]).strip(), _r[_off + 1], _r[_off + 2], _r[_off + 4],
+                                   _r[_off + 5], _r[_off + 6], _r[_off + 7], _r[_off + 8],
+                                   _r[_off + 9:_off + 13], _r[_off + 13], _r[_off + 15])
+    finally:
+        _wb.close()
+
+def _1ngest_r3ader(_path):
+    """Pick a streaming reader by file extension"""
+    _readers = {
+        '.csv': _r3ad_csv,
+        '.jsonl': _r3ad_js0nl,
+        '.ndjson': _r3ad_js0nl,
+        '.json': _r3ad_gstr2b_js0n,
+        '.xlsx': _r3ad_gstr2b_xlsx
+    }
+    _ext = os.path.splitext(_path)[1].lower()
+    if _ext not in _readers:
+        raise ValueError(f"Unsupported invoice file type: {_ext}")
+    return _readers[_ext](_path)
+
+def _b4tch3s(_records, _size):
+    """Group a record stream into lists of at most _size"""
+    _batch = []
+    for _rec in _records:
+        _batch.append(_rec)
+        if len(_batch) == _size:
+            yield _batch
+            _batch = []
+    if _batch:
+        yield _batch
+
+# ==================== GSTR-2B RECONCILIATION ====================
+_0x8d02 = str.maketrans('', '', ' \t\r\n/-_.')
+_0x8d03 = re.compile(r'[^A-Z0-9]+')
+_0x8d04 = re.compile(r'\d+')
+_0x8d05 = re.compile(r'^(\d{4})-(\d{2})-\d{2}|^\d{2}[-/](\d{2})[-/](\d{4})')
+# Portal filing periods: "Feb'25" (GSTR-2B Excel), "Feb-2025", "February 2025"
+_0x8d06 = re.compile(r"^([A-Za-z]{3})[A-Za-z]*\s*['’\-/ ]?\s*(\d{4}|\d{2})$")
+_0x8d07 = {_m: f'{_i:02d}' for _i, _m in enumerate(('JAN', 'FEB', 'MAR', 'APR', 'MAY', 'JUN', 'JUL', 'AUG', 'SEP', 'OCT', 'NOV', 'DEC'), 1)}
+
+@functools.lru_cache(maxsize=1 << 16)
+def _n0rm_g5tin(_gstin):
+    """GSTIN join key: upper-cased with whitespace and separators removed (memoized, registers repeat suppliers)"""
+    return sys.intern(str(_gstin).upper().translate(_0x8d02)) if _gstin else ''
+
+def _n0rm_1nv(_num):
+    """Invoice number join key: upper-cased with whitespace and / - _ . separators removed"""
+    return str(_num or '').upper().translate(_0x8d02)
+
+def _fuzzy_1nv(_num):
+    """Looser invoice key for the residue: alphanumerics only, leading zeros of digit runs dropped"""
+    return _0x8d04.sub(lambda _m: _m.group().lstrip('0') or '0', _0x8d03.sub('', str(_num or '').upper()))
+
+def _d1g1ts_1nv(_num):
+    """Digits-only invoice key ('SI/24-25/0042' -> '242542'), only trusted together with matching amounts"""
+    return ''.join(_d.lstrip('0') or '0' for _d in _0x8d04.findall(str(_num or '')))
+
+@functools.lru_cache(maxsize=1 << 12)
+def _p3riod(_period, _date=None):
+    """Return period as MMYYYY from MMYYYY, YYYYMM, YYYY-MM or Mon'YY values, else from the invoice date"""
+    _m = _0x8d06.match(str(_period or '').strip())
+    if _m is not None and _m.group(1).upper() in _0x8d07:
+        return _0x8d07[_m.group(1).upper()] + (_m.group(2) if len(_m.group(2)) == 4 else '20' + _m.group(2))
+    _p = re.sub(r'\D', '', str(_period or ''))
+    if len(_p) == 6:
+        return _p if int(_p[:2]) <= 12 else _p[4:] + _p[:4]
+    _m = _0x8d05.match(_date.date().isoformat() if isinstance(_date, datetime) else str(_date or ''))
+    if _m is None:
+        return ''
+    return _m.group(2) + _m.group(1) if _m.group(1) else _m.group(3) + _m.group(4)
+
+def _j01n_p3riod(_row):
+    """Reconciliation period of a 2B line or register row: its invoice-date month, else its stated period.
+
+    Both sides are keyed the same way because their 'period' fields differ: a 2B line carries the supplier's
+    GSTR-1 filing period and a register row the recipient's return period.
+    """
+    return _p3riod(None, _row.get('invoice_date')) or _p3riod(_row.get('period'))
+
+def _t4x_t0tal(_row):
+    _total = 0
+    for _k in ('igst', 'cgst', 'sgst', 'cess'):
+        _v = _row.get(_k)
+        if _v:
+            _total += _v if isinstance(_v, (int, float)) else _t0_num(_v) or 0
+    return _total
+
+class _R3c0n_0x8d01:
+    """GSTR-2B vs purchase-register reconciler: O(n) exact hash join, fuzzy hash joins on the residue only
+
+    GSTR-2B lines are indexed by (supplier GSTIN, normalized invoice number, _j01n_p3riod). Register rows are
+    probed batch by batch; rows without an exact partner are deferred and matched in _r3s0lve by
+    (GSTIN, fuzzy invoice number) and then by (GSTIN, invoice digits) with amounts within tolerance.
+    """
+
+    def __init__(self, _abs_tol=1.0, _pct_tol=0.005):
+        self._0x1 = _abs_tol
+        self._0x2 = _pct_tol
+        self._0x3 = {}
+        self._0x4 = array('q')
+        self._0x5 = bytearray()
+        self._0x6 = []
+        self._0x7 = array('d')
+        self._0x8 = array('d')
+        self._0x9 = array('d')
+        self._0xa = []
+        self._0xb = {'gstr2b': 0, 'register': 0, 'exact': 0, 'fuzzy': 0, 'amount': 0,
+                     'missing_in_gstr2b': 0, 'missing_in_books': 0}
+
+    def _1ndex(self, _lines):
+        """Build the exact-key index over GSTR-2B lines (duplicate keys are chained)"""
+        for _line in _lines:
+            _j = len(self._0x6)
+            _gstin, _num = _n0rm_g5tin(_line.get('gstin')), str(_line.get('invoice_number') or '')
+            _period = _j01n_p3riod(_line)
+            _key = (_gstin, _n0rm_1nv(_num), _period)
+            self._0x4.append(self._0x3.get(_key, -1))
+            self._0x3[_key] = _j
+            self._0x5.append(0)
+            self._0x6.append((_gstin, _num, _period))
+            self._0x7.append(_t0_num(_line.get('taxable_value')) or 0.0)
+            self._0x8.append(_t4x_t0tal(_line))
+            self._0x9.append(_t0_num(_line.get('itc_eligible')) or 0.0)
+        self._0xb['gstr2b'] = len(self._0x6)
+        return self
+
+    def _cl0se(self, _a, _b):
+        return abs(_a - _b) <= max(self._0x1, self._0x2 * max(abs(_a), abs(_b)))
+
+    def _4mounts_m4tch(self, _res, _j):
+        """Taxable values within tolerance when both sides carry them, else tax totals"""
+        if _res[4] is not None and self._0x7[_j]:
+            return self._cl0se(_res[4], self._0x7[_j])
+        return self._cl0se(_res[5], self._0x8[_j])
+
+    def _p41r(self, _res, _j, _level):
+        """Consume 2B line j for a register row, returns its issues"""
+        self._0x5[_j] = 1
+        self._0xb[_level] += 1
+        if _res[6] > self._0x9[_j] + self._0x1:
+            return [_1ssue_0x8c01(_0x8f00._c0de('GSTR2B_ITC_MISMATCH'), _res[6], self._0x9[_j])]
+        return []
+
+    def _pr0be(self, _rows, _offset=0):
+        """Exact-join a register batch, returns ({row: issues} for matched rows, deferred row numbers)"""
+        _out, _deferred = {}, []
+        for _i, _row in enumerate(_rows):
+            _gstin, _num = _n0rm_g5tin(_row.get('gstin')), str(_row.get('invoice_number') or '')
+            _period = _j01n_p3riod(_row)
+            _tax = _t4x_t0tal(_row)
+            _claimed = _t0_num(_row.get('itc_claimed'))
+            _res = (_offset + _i, _gstin, _num, _period, _t0_num(_row.get('taxable_value')), _tax,
+                    _tax if _claimed is None else _claimed)
+            _j = self._0x3.get((_gstin, _n0rm_1nv(_num), _period), -1)
+            while _j >= 0 and self._0x5[_j]:
+                _j = self._0x4[_j]
+            if _j < 0:
+                self._0xa.append(_res)
+                _deferred.append(_res[0])
+                continue
+            _issues = self._p41r(_res, _j, 'exact')
+            if _issues:
+                _out[_res[0]] = _issues
+        self._0xb['register'] += len(_rows)
+        return _out, _deferred
+
+    def _r3s0lve(self):
+        """Fuzzy-match the deferred rows against unmatched 2B lines, returns {row: issues} for every deferred row"""
+        _free = [_j for _j in range(len(self._0x6)) if not self._0x5[_j]]
+        _out = {}
+        for _key_fn, _level in ((_fuzzy_1nv, 'fuzzy'), (_d1g1ts_1nv, 'amount')):
+            _idx = {}
+            for _j in _free:
+                _idx.setdefault((self._0x6[_j][0], _key_fn(self._0x6[_j][1])), []).append(_j)
+            _left = []
+            for _res in self._0xa:
+                _cands = [_j for _j in _idx.get((_res[1], _key_fn(_res[2])), ()) if not self._0x5[_j]]
+                _good = [_j for _j in _cands if self._4mounts_m4tch(_res, _j)]
+                if _level == 'fuzzy':
+                    # Same supplier and document: prefer same period / amounts but accept any partner
+                    _good = _good or [_j for _j in _cands if self._0x6[_j][2] == _res[3]] or _cands
+                if _good:
+                    _out[_res[0]] = self._p41r(_res, _good[0], _level)
+                else:
+                    _left.append(_res)
+            self._0xa = _left
+            _free = [_j for _j in _free if not self._0x5[_j]]
+
+        for _res in self._0xa:
+            _out[_res[0]] = [_1ssue_0x8c01(_0x8f00._c0de('GSTR2B_MISSING'), _res[6], 0)] if _res[6] > self._0x1 else []
+        self._0xb['missing_in_gstr2b'] = len(self._0xa)
+        self._0xb['missing_in_books'] = len(_free)
+        self._0xa = []
+        return _out
+
+    def _m1ss1ng_1n_b00ks(self):
+        """GSTR-2B lines no register row claimed, as (gstin, invoice number, period, itc eligible)"""
+        return [self._0x6[_j] + (self._0x9[_j],) for _j in range(len(self._0x6)) if not self._0x5[_j]]
+
+    def _st4ts(self):
+        return dict(self._0xb)
+
+# ==================== RESULT STORE ====================
+_0x9c02 = 'saralgst-results'
+_0x9c03 = 1
+_0x9c04 = json.JSONEncoder(sort_keys=True, separators=(',', ':'), default=str).encode
+
+def _1nv0ice_k3y(_inv):
+    """Invoice identity within a return period: normalized supplier GSTIN and invoice number"""
+    return f"{_n0rm_g5tin(_inv.get('gstin'))}|{_n0rm_1nv(_inv.get('invoice_number'))}"
+
+def _c0ntent_h4sh(_inv):
+    """Signed 64-bit digest of an invoice's canonical JSON, so it fits an SQLite INTEGER"""
+    return int.from_bytes(hashlib.blake2b(_0x9c04(_inv).encode(), digest_size=8).digest(), 'little', signed=True)
+
+def _1ssues_js0n(_issues):
+    """Compact [[type, detected, expected], ...] form of an issue list"""
+    return json.dumps([[_i['type'], _i['detected_value'], _i['expected_value']] for _i in _issues], default=str)
+
+class _R3sults_0x9c01:
+    """Compliance results per return period in SQLite, one row per invoice identity.
+
+    A row keeps the invoice itself, its content hash, the fingerprint of the rule set it was checked under,
+    a stale flag and its issues. Re-running a period therefore only analyzes invoices that are new, edited,
+    marked stale or checked under different rules. Writes are bulk upserts in one transaction.
+    """
+
+    def __init__(self, _path):
+        self._0x1 = _path
+        os.makedirs(os.path.dirname(os.path.abspath(_path)), exist_ok=True)
+        # The async monitor re-checks stale rows from an executor thread, serialized with its consumer by a lock
+        self._0x2 = sqlite3.connect(_path, check_same_thread=False)
+        self._0x2.execute('PRAGMA journal_mode=WAL')
+        self._0x2.execute('PRAGMA synchronous=NORMAL')
+        self._0x2.execute('CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)')
+        _meta = dict(self._0x2.execute('SELECT key, value FROM meta'))
+        if (_meta.get('format'), _meta.get('version')) != (_0x9c02, str(_0x9c03)):
+            if _meta:
+                _l0g(logging.WARNING, 'STORE', 'Result store format changed, starting empty', path=_path)
+            self._0x2.execute('DROP TABLE IF EXISTS results')
+        self._0x2.execute('CREATE TABLE IF NOT EXISTS results (period TEXT NOT NULL, invoice_key TEXT NOT NULL, '
+                          'content_hash INTEGER NOT NULL, rules TEXT NOT NULL, stale INTEGER NOT NULL DEFAULT 0, '
+                          'types TEXT NOT NULL, issues TEXT NOT NULL, invoice TEXT NOT NULL, checked REAL NOT NULL, '
+                          'PRIMARY KEY (period, invoice_key)) WITHOUT ROWID')
+        self._0x2.executemany('INSERT OR REPLACE INTO meta VALUES (?, ?)', [('format', _0x9c02), ('version', str(_0x9c03))])
+        self._0x2.commit()
+
+    def _p3riod_r0ws(self, _period):
+        """{invoice_key: (content_hash, rules, stale, issues_json)} for one period"""
+        return {_r[0]: _r[1:] for _r in self._0x2.execute(
+            'SELECT invoice_key, content_hash, rules, stale, issues FROM results WHERE period = ?', (_period,))}
+
+    def _fr3sh(self, _period, _key, _hash, _rules):
+        """Stored issues JSON when this exact invoice was already checked under these rules, else None"""
+        _row = self._0x2.execute('SELECT issues FROM results WHERE period = ? AND invoice_key = ? AND content_hash = ? '
+                                 'AND rules = ? AND stale = 0', (_period, _key, _hash, _rules)).fetchone()
+        return _row and _row[0]
+
+    def _upsert(self, _period, _rows, _commit=True):
+        """Bulk insert-or-replace of (invoice_key, content_hash, rules, issues, invoice) rows"""
+        _now = time.time()
+        self._0x2.executemany(
+            'INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, 0, ?, ?, ?, ?)',
+            ((_period, _key, _hash, _rules, ' ' + ' '.join(sorted({_i['type'] for _i in _issues})) + ' ',
+              _1ssues_js0n(_issues), json.dumps(_inv, default=str), _now)
+             for _key, _hash, _rules, _issues, _inv in _rows))
+        if _commit:
+            self._0x2.commit()
+
+    def _d3lete(self, _period, _keys):
+        self._0x2.executemany('DELETE FROM results WHERE period = ? AND invoice_key = ?', ((_period, _k) for _k in _keys))
+        self._0x2.commit()
+
+    def _m4rk_st4le(self, _types=None, _period=None):
+        """Flag rows for re-analysis: those holding any of _types (all rows when None), optionally in one period"""
+        _where, _args = [], []
+        if _period is not None:
+            _where.append('period = ?')
+            _args.append(_period)
+        if _types is not None:
+            _types = list(_types)
+            if not _types:
+                return 0
+            _where.append('(' + ' OR '.join(["instr(types, ?) > 0"] * len(_types)) + ')')
+            _args.extend(f' {_t} ' for _t in _types)
+        _sql = 'UPDATE results SET stale = 1' + (' WHERE ' + ' AND '.join(_where) if _where else '')
+        _count = self._0x2.execute(_sql, _args).rowcount
+        self._0x2.commit()
+        _l0g(logging.INFO, 'STORE', 'Marked results stale', rows=_count, types=_types, period=_period)
+        return _count
+
+    def _st4le_r0ws(self):
+        """{period: [(invoice_key, invoice)]} for every stale row"""
+        _out = {}
+        for _period, _key, _inv in self._0x2.execute(
+                'SELECT period, invoice_key, invoice FROM results WHERE stale = 1 ORDER BY period, invoice_key'):
+            _out.setdefault(_period, []).append((_key, json.loads(_inv)))
+        return _out
+
+    def _c0mmit(self):
+        self._0x2.commit()
+
+    def _cl0se(self):
+        self._0x2.close()
+
+    def _st4ts(self):
+        """Stored and stale row counts per period"""
+        return {_p: {'invoices': _n, 'stale': _s, 'non_compliant': _f} for _p, _n, _s, _f in self._0x2.execute(
+            "SELECT period, COUNT(*), SUM(stale), SUM(types != '  ') FROM results GROUP BY period ORDER BY period")}
+
+# ==================== LAZY COMPONENT LOADER ====================
+class _L4zy_0x5e1f:
+    """Deferred engine component, built by its factory on first attribute access"""
+
+    def __init__(self, _name, _factory, _timings):
+        self._l4zy_name = _name
+        self._l4zy_factory = _factory
+        self._l4zy_timings = _timings
+        self._l4zy_obj = None
+
+    def __getattr__(self, _attr):
+        if _attr.startswith('_l4zy_'):
+            raise AttributeError(_attr)
+        return getattr(self._r34lize(), _attr)
+
+    def _r34lize(self):
+        """Build the wrapped component once and record its load time"""
+        if self._l4zy_obj is None:
+            _t0 = time.perf_counter()
+            self._l4zy_obj = self._l4zy_factory()
+            self._l4zy_timings[self._l4zy_name] = (time.perf_counter() - _t0) * 1000
+            _l0g(logging.INFO, 'ENGINE', 'Loaded component on first use', component=self._l4zy_name,
+                 ms=round(self._l4zy_timings[self._l4zy_name], 1))
+        return self._l4zy_obj
 
 # ==================== MAIN EXECUTION ENGINE ====================
 class _GSTEngine_0x1a2b:
-    """Main GST Compliance Engine Orchestrator"""
+    """Main GST Compliance Engine Orchestrator
+
+    _read_only engines (pool and service workers) open the persisted RAG index without re-indexing or
+    saving it; the parent process brings the index up to date before it starts them.
+    """
     
-    def __init__(self):
+    def __init__(self, _notification_source=None, _read_only=False):
         self._0x16 = None
         self._0x17 = None
         self._0x18 = None
         self._0x19 = None
         self._0x1a = os.path.dirname(os.path.abspath(__file__))
+        self._0x1b = {}
+        self._0x1c = _notification_source
+        self._0x26 = None
+        self._0x27 = None
+        self._0x28 = _read_only
         
     def _init_c0mp0nents(self):
-        """Initialize all engine components"""
-        print(f"\n{'='*60}")
-        print(f"[ENGINE] {_0x4a2b}")
-        print(f"{'='*60}\n")
-        
-        # Initialize XAI Model
-        self._0x16 = _XAI_0x7e3f(self._0x1a)
-        self._0x16._l0ad_w3ights()
-        
-        # Initialize RAG Engine
-        _books_path = os.path.join(self._0x1a, 'Books')
-        os.makedirs(_books_path, exist_ok=True)
-        self._0x17 = _RAG_0x4c2a(_books_path)
-        self._0x17._ind3x_b00ks()
+        """Initialize all engine components (XAI, RAG and web surfer load lazily on first use)"""
+        _l0g(logging.INFO, 'ENGINE', _0x4a2b)
+        _t0 = time.perf_counter()
         
-        # Initialize Web Surfer
-        self._0x18 = _W3b_0x9f1e()
-        self._0x18._ch3ck_upd4tes()
+        self._0x16 = _L4zy_0x5e1f('xai', self._l0ad_x4i, self._0x1b)
+        self._0x17 = _L4zy_0x5e1f('rag', self._l0ad_r4g, self._0x1b)
+        self._0x18 = _L4zy_0x5e1f('web', lambda: _W3b_0x9f1e(self._0x1c), self._0x1b)
         
-        # Initialize Compliance Analyzer
+        # Initialize Compliance Analyzer (rule checks need none of the lazy components)
         self._0x19 = _C0mpl_0x5d3b(self._0x16, self._0x17, self._0x18)
         
-        print(f"\n[ENGINE] All components initialized successfully")
+        self._0x1b['init'] = (time.perf_counter() - _t0) * 1000
+        _l0g(logging.INFO, 'ENGINE', 'All components initialized successfully', ms=round(self._0x1b['init'], 1))
+
+    def _l0ad_x4i(self):
+        """Build the XAI model and load its weights"""
+        _xai = _XAI_0x7e3f(self._0x1a)
+        _xai._l0ad_w3ights()
+        return _xai
+
+    def _l0ad_r4g(self):
+        """Open the persisted RAG index, building it on first run (read-only engines never write it)"""
+        _books_path = os.path.join(self._0x1a, 'Books')
+        os.makedirs(_books_path, exist_ok=True)
+        _rag = _RAG_0x4c2a(_books_path, _demo=bool(os.environ.get('GST_DEMO_BOOKS')))
+        _index_path = os.path.join(self._0x1a, 'Index')
+        if self._0x28:
+            if not _rag._l0ad_ind3x(_index_path):
+                _l0g(logging.WARNING, 'RAG', 'No usable index for a read-only engine, indexing in memory', path=_index_path)
+                _rag._ind3x_b00ks(_workers=1)
+        elif _rag._l0ad_ind3x(_index_path):
+            _rag._r3ind3x_b00ks(_index_path)
+        else:
+            _rag._ind3x_b00ks()
+            _rag._s4ve_ind3x(_index_path)
+        return _rag
+
+    def _w4rm_up(self):
+        """Eagerly load every lazy component, e.g. before serving traffic"""
+        for _component in (self._0x16, self._0x17, self._0x18):
+            _component._r34lize()
+        return self._st4rtup_r3port()
+
+    def _st4rtup_r3port(self):
+        """Startup timings in ms: engine init plus each component loaded so far"""
+        _l0g(logging.INFO, 'ENGINE', 'Startup report (ms)', **{_k: round(_v, 1) for _k, _v in self._0x1b.items()})
+        return dict(self._0x1b)
     
+    def _m3trics(self, _prometheus=False):
+        """Instrumentation snapshot merged with cache stats and startup timings (or Prometheus text)"""
+        _snap = _0x9a7c._sn4pshot()
+        _snap['startup_ms'] = dict(self._0x1b)
+        if self._0x19 is not None:
+            _snap['explanation_cache'] = self._0x19._0x1f._st4ts()
+        if self._0x26 is not None:
+            _snap['server'] = self._0x26._st4ts()
+        if not _prometheus:
+            return _snap
+        _gauges = {f"startup_ms_{_k}": round(_v, 3) for _k, _v in self._0x1b.items()}
+        for _section in ('explanation_cache', 'server'):
+            _gauges.update({f"{_section}_{_k}": _v for _k, _v in _snap.get(_section, {}).items()
+                            if isinstance(_v, (int, float))})
+        return _0x9a7c._pr0metheus(_gauges)
+
+    def _ev4luate_inv0ice(self, _invoice_data):
+        """Run the compliance pipeline for one invoice without console reporting"""
+        return self._r3sult(self._0x19._an4lyze_inv0ice(_invoice_data))
+
+    def _ev4luate_b4tch(self, _invoices):
+        """_ev4luate_inv0ice over a list of invoices; long lists go through the vectorized records pre-filter"""
+        return [self._r3sult(_issues) for _issues in self._0x19._an4lyze_l1st(_invoices)]
+
+    def _r3sult(self, _issues):
+        """Status, issues and explanations for one invoice's issues"""
+        if _0x9a7c._0x1:
+            _0x9a7c._1ncr('invoices')
+            for _issue in _issues:
+                _0x9a7c._1ncr(f"issue_{_issue['type']}")
+        return {
+            'status': 'NON_COMPLIANT' if _issues else 'COMPLIANT',
+            'issues': _issues,
+            'explanations': [self._0x19._g3n3rate_xai_3xplan4tion(_issue) for _issue in _issues]
+        }
+
     def _pr0cess_inv0ice(self, _invoice_data):
         """Process invoice through compliance pipeline"""
-        print(f"\n{'='*60}")
-        print(f"[ENGINE] Processing Invoice: {_invoice_data.get('invoice_number', 'UNKNOWN')}")
-        print(f"{'='*60}\n")
-        
         # Analyze invoice
-        _issues = self._0x19._an4lyze_inv0ice(_invoice_data)
+        _result = self._ev4luate_inv0ice(_invoice_data)
+        if not _0x9a7e.isEnabledFor(logging.INFO):
+            return _result
         
-        if _issues:
-            print(f"[ALERT] {_0x3d7a} - {len(_issues)} issue(s) found")
+        _number = _invoice_data.get('invoice_number', 'UNKNOWN')
+        if _result['issues']:
+            _l0g(logging.WARNING, 'ALERT', _0x3d7a, invoice=_number, issues=len(_result['issues']))
             
-            _explanations = []
-            for _issue in _issues:
-                _explanation = self._0x19._g3n3rate_xai_3xplan4tion(_issue)
-                _explanations.append(_explanation)
-                
-                print(f"\n[XAI] Issue Type: {_issue['type']}")
-                print(f"[XAI] Severity: {_issue['severity']}")
-                print(f"[XAI] Confidence: {_explanation['confidence']}")
-                print(f"[XAI] Explanation: {_explanation['explanation']}")
-                print(f"[XAI] Recommendation: {_explanation['recommendation']}")
-                
-            return {
-                'status': 'NON_COMPLIANT',
-                'issues': _issues,
-                'explanations': _explanations
-            }
+            for _issue, _explanation in zip(_result['issues'], _result['explanations']):
+                _l0g(logging.INFO, 'XAI', 'Issue explained', invoice=_number, type=_issue['type'],
+                     severity=_issue['severity'], confidence=_explanation['confidence'],
+                     explanation=_explanation['explanation'], recommendation=_explanation['recommendation'])
         else:
-            print(f"[SUCCESS] Invoice is compliant")
-            return {
-                'status': 'COMPLIANT',
-                'issues': [],
-                'explanations': []
-            }
+            _l0g(logging.INFO, 'SUCCESS', 'Invoice is compliant', invoice=_number)
+        
+        return _result
+
+    def _str3am_f1le(self, _src, _dst, _batch_size=5000, _explain=True, _all_rows=False, _gstr2b=None):
+        """Stream an invoice file through the analyzer in fixed-size batches, writing JSONL results as it goes.
+
+        With _gstr2b (a GSTR-2B JSON/XLSX/CSV export) every register row is also reconciled against it.
+        Rows without an exact GSTR-2B partner are written after the last batch, once fuzzy matching ran.
+        """
+        if self._0x19 is None:
+            self._init_c0mp0nents()
+        _stats = {'rows': 0, 'batches': 0, 'non_compliant': 0, 'issues': 0}
+        _l0g(logging.INFO, 'STREAM', 'Ingesting file', path=_src, batch_size=_batch_size)
+        _recon = None
+        if _gstr2b is not None:
+            _recon = _R3c0n_0x8d01()._1ndex(_1ngest_r3ader(_gstr2b))
+            _l0g(logging.INFO, 'RECON', 'Indexed GSTR-2B lines', path=_gstr2b, lines=_recon._0xb['gstr2b'])
+        _pending = {}
+
+        with open(_dst + '.tmp', 'w', encoding='utf-8') as _out:
+            def _3mit(_row_no, _inv, _issues):
+                if _issues:
+                    _stats['non_compliant'] += 1
+                    _stats['issues'] += len(_issues)
+                elif not _all_rows:
+                    return
+                _row = {
+                    'row': _row_no,
+                    'invoice_number': _inv.get('invoice_number'),
+                    'gstin': _inv.get('gstin'),
+                    'status': 'NON_COMPLIANT' if _issues else 'COMPLIANT',
+                    'issues': [dict(_issue) for _issue in _issues]
+                }
+                if _explain and _issues:
+                    _row['explanations'] = [self._0x19._g3n3rate_xai_3xplan4tion(_issue) for _issue in _issues]
+                _out.write(json.dumps(_row, default=str) + '\n')
+
+            for _batch in _b4tch3s(_1ngest_r3ader(_src), _batch_size):
+                _base = _stats['rows']
+                _flagged = self._0x19._an4lyze_r3cords(_batch)
+                _deferred = ()
+                if _recon is not None:
+                    _matched, _deferred = _recon._pr0be(_batch, _base)
+                    for _r, _issues in _matched.items():
+                        _flagged[_r - _base] = _flagged.get(_r - _base, []) + _issues
+                    for _r in _deferred:
+                        _inv = _batch[_r - _base]
+                        _pending[_r] = ({'invoice_number': _inv.get('invoice_number'), 'gstin': _inv.get('gstin')},
+                                        _flagged.get(_r - _base, []))
+                    _deferred = set(_deferred)
+                for _i, _inv in enumerate(_batch):
+                    if _base + _i not in _deferred:
+                        _3mit(_base + _i, _inv, _flagged.get(_i, []))
+                _stats['rows'] += len(_batch)
+                _stats['batches'] += 1
+
+            if _recon is not None:
+                for _r, _issues in sorted(_recon._r3s0lve().items()):
+                    _inv, _own = _pending.pop(_r)
+                    _3mit(_r, _inv, _own + _issues)
+                _stats['reconciliation'] = _recon._st4ts()
+        os.replace(_dst + '.tmp', _dst)
+
+        _l0g(logging.INFO, 'STREAM', 'Finished file', output=_dst, **_stats)
+        return _stats
+
+    def _r3sults(self):
+        """Result store at GST_RESULTS (default State/results.sqlite next to the engine), opened on first use"""
+        if self._0x27 is None:
+            self._0x27 = _R3sults_0x9c01(os.environ.get('GST_RESULTS') or os.path.join(self._0x1a, 'State', 'results.sqlite'))
+        return self._0x27
+
+    def _r3run_p3riods(self, _invoices, _explain=False):
+        """Re-check a register against the result store, analyzing only new, edited or stale invoices.
+
+        _invoices is an iterable of invoice dicts or a file path for _1ngest_r3ader. Invoices are grouped by
+        return period, and stored invoices of those periods that are missing from the input are removed.
+        Returns {period: report}: counts plus the deltas, i.e. invoices whose issues changed (with their
+        explanations when _explain). An identity repeated within a period is stored as key#2, key#3, ...
+        """
+        if self._0x19 is None:
+            self._init_c0mp0nents()
+        _store, _rules = self._r3sults(), self._0x19._0x24._v3rsion()
+        _periods = {}
+        for _inv in (_1ngest_r3ader(_invoices) if isinstance(_invoices, str) else _invoices):
+            _periods.setdefault(_p3riod(_inv.get('period'), _inv.get('invoice_date')), []).append(_inv)
+
+        _reports = {}
+        for _period, _rows in sorted(_periods.items()):
+            _seen, _items = {}, []
+            for _inv in _rows:
+                _key = _1nv0ice_k3y(_inv)
+                _seen[_key] = _seen.get(_key, 0) + 1
+                _items.append((_key if _seen[_key] == 1 else f"{_key}#{_seen[_key]}", _inv))
+            _reports[_period] = self._r3run_p3riod(_store, _rules, _period, _items, _explain, True)
+        return _reports
+
+    def _r3check_st4le(self, _explain=False, _store=None):
+        """Re-analyze every stored invoice marked stale (see _R3sults_0x9c01._m4rk_st4le), returns {period: report}"""
+        if self._0x19 is None:
+            self._init_c0mp0nents()
+        _store, _rules = _store or self._r3sults(), self._0x19._0x24._v3rsion()
+        return {_period: self._r3run_p3riod(_store, _rules, _period, _items, _explain, False)
+                for _period, _items in _store._st4le_r0ws().items()}
+
+    def _r3run_p3riod(self, _store, _rules, _period, _items, _explain, _complete):
+        """Delta re-run of one period's (invoice_key, invoice) items; _complete removes stored keys not given"""
+        _stored = _store._p3riod_r0ws(_period)
+        _report = {'invoices': len(_items), 'unchanged': 0, 'analyzed': 0, 'added': 0, 'changed': 0,
+                   'rechecked': 0, 'removed': 0, 'non_compliant': 0, 'newly_non_compliant': 0, 'resolved': 0}
+        _run = []
+        for _key, _inv in _items:
+            _hash = _c0ntent_h4sh(_inv)
+            _old = _stored.get(_key)
+            if _old is None:
+                _kind = 'added'
+            elif _old[0] != _hash:
+                _kind = 'changed'
+            elif _old[1] != _rules or _old[2]:
+                _kind = 'rechecked'
+            else:
+                _report['unchanged'] += 1
+                _report['non_compliant'] += _old[3] != '[]'
+                continue
+            _report[_kind] += 1
+            _run.append((_key, _hash, _inv, _kind))
+
+        _issues = self._0x19._an4lyze_l1st([_r[2] for _r in _run])
+        _store._upsert(_period, [(_key, _hash, _rules, _found, _inv)
+                                 for (_key, _hash, _inv, _), _found in zip(_run, _issues)], _commit=False)
+        _current = {_key for _key, _ in _items} if _complete else _stored.keys()
+        _removed = [_key for _key in _stored if _key not in _current]
+        _store._d3lete(_period, _removed)
+        _report['analyzed'], _report['removed'] = len(_run), len(_removed)
+
+        _deltas = []
+        for (_key, _, _inv, _kind), _found in zip(_run, _issues):
+            _report['non_compliant'] += bool(_found)
+            _before = json.loads(_stored[_key][3]) if _key in _stored else []
+            if _1ssues_js0n(_found) == json.dumps(_before):
+                continue
+            _delta = {'invoice': _key, 'invoice_number': _inv.get('invoice_number'), 'change': _kind,
+                      'before': [_b[0] for _b in _before], 'after': [_i['type'] for _i in _found],
+                      'issues': [dict(_i) for _i in _found]}
+            if _explain and _found:
+                _delta['explanations'] = [self._0x19._g3n3rate_xai_3xplan4tion(_i) for _i in _found]
+            _deltas.append(_delta)
+        for _key in _removed:
+            _before = json.loads(_stored[_key][3])
+            if _before:
+                _deltas.append({'invoice': _key, 'invoice_number': None, 'change': 'removed',
+                                'before': [_b[0] for _b in _before], 'after': [], 'issues': []})
+        _report['newly_non_compliant'] = sum(1 for _d in _deltas if _d['after'] and not _d['before'])
+        _report['resolved'] = sum(1 for _d in _deltas if _d['before'] and not _d['after'])
+        _report['deltas'] = _deltas
+        _l0g(logging.INFO, 'STORE', 'Period re-run', period=_period,
+             **{_k: _v for _k, _v in _report.items() if _k != 'deltas'})
+        return _report
+
+    def _4pply_n0tifications(self, _notifications, _store=None):
+        """Selective invalidation for new CBIC notifications through the category map in the rule spec.
+
+        For the notifications' categories the rule spec is re-checked, only the dependent books are
+        re-indexed, only cached explanations of the dependent rule types (or citing a re-indexed book) are
+        evicted, and stored results holding those types are marked stale (in _store, default the engine's
+        open result store). An unknown or missing category invalidates everything. Returns what was touched.
+        """
+        if self._0x19 is None:
+            self._init_c0mp0nents()
+        _rules = self._0x19._0x24._r3fresh()
+        _categories = {_n.get('category') or '' for _n in _notifications}
+        _types, _patterns, _unknown = _rules._d3pendents(_categories)
+        _everything = bool(_unknown)
+        _report = {'categories': sorted(_categories), 'unknown': sorted(_unknown), 'rules': sorted(_types),
+                   'books': [], 'reindexed': [], 'evicted': 0, 'stale': 0}
+
+        # A RAG index that was never loaded is checked against every book on first use anyway
+        _rag = self._0x17._l4zy_obj if isinstance(self._0x17, _L4zy_0x5e1f) else self._0x17
+        if _rag is not None:
+            _report['books'] = [_b for _b in _rag._d1sc0ver_b00ks()
+                                if _everything or any(fnmatch.fnmatch(_b.lower(), _p.lower()) for _p in _patterns)]
+            if _report['books']:
+                _index_path = os.path.join(self._0x1a, 'Index')
+                _stats = _rag._r3ind3x_b00ks(_index_path if os.path.isdir(_index_path) else None, _b00ks=_report['books'])
+                _report['reindexed'] = _stats['changed']
+        _report['evicted'] = self._0x19._1nvalidate(None if _everything else _types, _report['reindexed'])
+
+        _store = _store or self._0x27
+        if _store is not None:
+            _report['stale'] = _store._m4rk_st4le(None if _everything else _types)
+        _l0g(logging.INFO, 'MONITOR', 'Applied notifications', **_report)
+        return _report
+
+    def _r3fresh_n0tifications(self, _notifications, _store=None):
+        """_4pply_n0tifications, then re-check the stored invoices it marked stale; returns how many were re-analyzed"""
+        if not self._4pply_n0tifications(_notifications, _store)['stale']:
+            return 0
+        return sum(_report['analyzed'] for _report in self._r3check_st4le(_store=_store).values())
+
+    def _p4rallel_pr0cess(self, _invoices, _shard_by='gstin', _workers=None, _chunk=1024, _progress=None):
+        """Shard invoices by GSTIN or return period across a process pool, results in input order"""
+        if self._0x19 is None:
+            self._init_c0mp0nents()
+        _shards = {}
+        for _pos, _inv in enumerate(_invoices):
+            _shards.setdefault(str(_inv.get(_shard_by, 'UNKNOWN')), []).append(_pos)
+
+        # Large shards are sliced so one dominant GSTIN cannot serialize the pool
+        _tasks = []
+        for _key in sorted(_shards):
+            _positions = _shards[_key]
+            for _s in range(0, len(_positions), _chunk):
+                _slice = _positions[_s:_s + _chunk]
+                _tasks.append((_key, _slice, [_invoices[_p] for _p in _slice]))
+
+        _results = [None] * len(_invoices)
+        _done = dict.fromkeys(_shards, 0)
+        _workers = _workers or os.cpu_count() or 1
+
+        def _c0llect(_key, _slice, _res):
+            for _p, _r in zip(_slice, _res):
+                _results[_p] = _r
+            _done[_key] += len(_slice)
+            if _progress is not None:
+                _progress(_key, _done[_key], len(_shards[_key]))
+            elif _done[_key] == len(_shards[_key]):
+                _l0g(logging.INFO, 'PARALLEL', 'Shard done', shard=_key, invoices=_done[_key])
+
+        if _workers == 1:
+            for _key, _slice, _batch in _tasks:
+                _c0llect(_key, _slice, [self._ev4luate_inv0ice(_inv) for _inv in _batch])
+            return _results
+
+        # Persist the RAG index before forking so every worker maps the same pages
+        self._0x17._r34lize()
+        with ProcessPoolExecutor(_workers, initializer=_w0rker_1nit) as _pool:
+            for _fut in as_completed([_pool.submit(_w0rker_sh4rd, _task) for _task in _tasks]):
+                _c0llect(*_fut.result())
+        return _results
+
+    def _sc4ling_b3nchmark(self, _n_invoices=20000, _worker_counts=None, _gstins=64):
+        """Throughput of _p4rallel_pr0cess per worker count on synthetic invoices"""
+        _invoices = lIl1Il(_n_invoices, _gstins)
+        _counts = _worker_counts or sorted({1, 2, 4, os.cpu_count() or 1})
+        _report = {}
+        for _w in _counts:
+            _t0 = time.perf_counter()
+            self._p4rallel_pr0cess(_invoices, _workers=_w, _progress=lambda *_: None)
+            _dt = time.perf_counter() - _t0
+            _report[_w] = {'seconds': round(_dt, 3), 'invoices_per_sec': round(_n_invoices / _dt, 1)}
+            _report[_w]['speedup'] = round(_report[_counts[0]]['seconds'] / _dt, 2)
+            _report[_w]['efficiency'] = round(_report[_w]['speedup'] * _counts[0] / _w, 2)
+            _l0g(logging.INFO, 'PARALLEL', 'Scaling run', workers=_w, **_report[_w])
+        return _report
     
-    def _r3al_tim3_m0nit0ring(self):
+    def _s3rve(self, _address='127.0.0.1:8765', _window_ms=2.0, _max_batch=256, _workers=1):
+        """Serve invoice checks over local HTTP ('host:port' or 'unix:/path') until interrupted.
+
+        With _workers > 1 (TCP only) that many processes share the port through SO_REUSEPORT, each with its
+        own warm engine over the same memory-mapped index; /metrics then reports the answering worker.
+        """
+        _l0g(logging.INFO, 'ENGINE', 'Entering service mode, press Ctrl+C to stop', workers=_workers)
+        if _workers > 1 and _address.startswith('unix:'):
+            raise ValueError('Multiple service workers need a TCP address')
+        _previous = None
+        try:
+            # SIGTERM stops the service like Ctrl+C: waiting requests are answered and workers reaped
+            _previous = signal.signal(signal.SIGTERM, signal.default_int_handler)
+        except ValueError:
+            pass
+        try:
+            if _workers > 1:
+                # Persist the RAG index before forking so every worker maps the same pages
+                self._0x17._r34lize()
+                _procs = [multiprocessing.Process(target=_s3rve_w0rker, args=(_address, _window_ms, _max_batch), daemon=True)
+                          for _ in range(_workers)]
+                for _proc in _procs:
+                    _proc.start()
+                try:
+                    for _proc in _procs:
+                        _proc.join()
+                except KeyboardInterrupt:
+                    _l0g(logging.INFO, 'ENGINE', 'Service stopped by user')
+                finally:
+                    for _proc in _procs:
+                        _proc.terminate()
+                        _proc.join()
+                return
+            try:
+                return asyncio.run(self._4sync_s3rve(_address, _window_ms, _max_batch))
+            except KeyboardInterrupt:
+                _l0g(logging.INFO, 'ENGINE', 'Service stopped by user', **self._0x26._st4ts())
+        finally:
+            # An embedding application gets its own SIGTERM handler back
+            if _previous is not None:
+                signal.signal(signal.SIGTERM, _previous)
+
+    async def _4sync_s3rve(self, _address, _window_ms=2.0, _max_batch=256, _started=None, _reuse_port=False):
+        """Warm every component, then serve until cancelled; _started (a Future) receives the listening service"""
+        if self._0x19 is None:
+            self._init_c0mp0nents()
+        self._w4rm_up()
+        # Compile the rule plan and fill the explanation cache before the first request pays for it
+        self._ev4luate_b4tch(lIl1Il(256))
+        # Resident state is never garbage: keep it out of the collector's generations while serving,
+        # unless the host application manages its own frozen set
+        _freeze = gc.get_freeze_count() == 0
+        if _freeze:
+            gc.collect()
+            gc.freeze()
+        try:
+            self._0x26 = _S3rv1ce_0x9b01(self, _window_ms, _max_batch)
+            await self._0x26._st4rt(_address, _reuse_port)
+            if _started is not None:
+                _started.set_result(self._0x26)
+            try:
+                await self._0x26._0xb.serve_forever()
+            finally:
+                self._0x26._st0p()
+        finally:
+            if _freeze:
+                gc.unfreeze()
+
+    def _r3al_tim3_m0nit0ring(self, _invoices=None, _poll_interval=30, _store=None):
         """Continuous monitoring mode"""
-        print(f"\n[ENGINE] Entering real-time monitoring mode...")
-        print(f"[ENGINE] Press Ctrl+C to stop\n")
+        _l0g(logging.INFO, 'ENGINE', 'Entering real-time monitoring mode, press Ctrl+C to stop')
         
         try:
-            _iteration = 0
-            while True:
-                _iteration += 1
-                print(f"\n{'='*60}")
-                print(f"[MONITOR] Iteration #{_iteration} - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-                print(f"{'='*60}\n")
-                
-                # Check for new notifications
-                _notifications = self._0x18._ch3ck_upd4tes()
-                if _notifications:
-                    print(f"[MONITOR] Processing {len(_notifications)} new notifications")
-                
-                # Mock invoice processing
-                _mock_invoice = {
-                    'invoice_number': f'INV-{random.randint(1000, 9999)}',
-                    'itc_claimed': random.randint(5000, 15000),
-                    'itc_eligible': random.randint(4000, 12000),
-                    'reverse_charge': random.choice([True, False]),
-                    'cgst': random.randint(0, 1000) if random.random() > 0.5 else 0,
-                    'sgst': random.randint(0, 1000) if random.random() > 0.5 else 0,
-                }
-                
-                _result = self._pr0cess_inv0ice(_mock_invoice)
-                
-                print(f"\n[MONITOR] Status: {_result['status']}")
-                print(f"[MONITOR] Sleeping for 30 seconds...")
-                
-                time.sleep(30)
-                
+            return asyncio.run(self._4sync_m0nit0r(_invoices, _poll_interval, _store=_store))
         except KeyboardInterrupt:
-            print(f"\n[ENGINE] Monitoring stopped by user")
+            _l0g(logging.INFO, 'ENGINE', 'Monitoring stopped by user')
+
+    @staticmethod
+    def _m0ck_inv0ice():
+        """Random invoice for the demo monitor feed"""
+        return {
+            'invoice_number': f'INV-{random.randint(1000, 9999)}',
+            'itc_claimed': random.randint(5000, 15000),
+            'itc_eligible': random.randint(4000, 12000),
+            'reverse_charge': random.choice([True, False]),
+            'cgst': random.randint(0, 1000) if random.random() > 0.5 else 0,
+            'sgst': random.randint(0, 1000) if random.random() > 0.5 else 0,
+        }
+
+    async def _4sync_m0nit0r(self, _invoices=None, _poll_interval=30, _max_backoff=300, _mock_interval=30, _polls=None,
+                             _store=None):
+        """Poll notifications and process queued invoices concurrently, returns a run summary
+        
+        _invoices is an iterable of invoice dicts or a file path for _1ngest_r3ader; when given, the
+        monitor stops once it is drained, otherwise mock invoices arrive every _mock_interval seconds.
+        _polls bounds the number of notification polls (None polls until the feed ends or forever).
+        With _store (a _R3sults_0x9c01), invoices already checked unchanged under the current rules are
+        skipped and every evaluated invoice is recorded.
+        """
+        if self._0x19 is None:
+            self._init_c0mp0nents()
+        _queue = asyncio.Queue(maxsize=1000)
+        # Held by the consumer per invoice and by the poller while notifications are applied in the executor
+        _lock = asyncio.Lock()
+        _summary = {'polls': 0, 'poll_errors': 0, 'notifications': 0, 'invoices': 0, 'unchanged': 0, 'non_compliant': 0,
+                    'rechecked': 0}
+
+        async def _p0ller():
+            _failures = 0
+            while _polls is None or _summary['polls'] < _polls:
+                try:
+                    _new = await asyncio.to_thread(self._0x18._ch3ck_upd4tes, _ack=False)
+                    _failures = 0
+                    _summary['polls'] += 1
+                    if _new:
+                        _l0g(logging.INFO, 'MONITOR', 'Processing new notifications', count=len(_new))
+                        # Re-indexing runs off the loop; the lock keeps the consumer off the index and store meanwhile
+                        async with _lock:
+                            _summary['rechecked'] += await asyncio.get_running_loop().run_in_executor(
+                                None, self._r3fresh_n0tifications, _new, _store)
+                        # Only applied notifications count as seen, a failed apply is retried on the next poll
+                        self._0x18._4ck(_new)
+                        _summary['notifications'] += len(_new)
+                    _delay = _poll_interval
+                except Exception as _e:
+                    _failures += 1
+                    _summary['poll_errors'] += 1
+                    _delay = min(_max_backoff, _poll_interval * 2 ** _failures) + random.uniform(0, 1)
+                    _l0g(logging.WARNING, 'MONITOR', 'Notification poll failed', error=str(_e), retry_s=round(_delay, 1))
+                await asyncio.sleep(_delay)
+
+        async def _pr0ducer():
+            if _invoices is None:
+                while True:
+                    await _queue.put(self._m0ck_inv0ice())
+                    await asyncio.sleep(_mock_interval)
+            _source = _1ngest_r3ader(_invoices) if isinstance(_invoices, str) else _invoices
+            for _inv in _source:
+                await _queue.put(_inv)
+
+        async def _c0nsumer():
+            while True:
+                _inv = await _queue.get()
+                async with _lock:
+                    _summary['invoices'] += 1
+                    _fresh = False
+                    if _store is not None:
+                        _period, _key, _hash = _p3riod(_inv.get('period'), _inv.get('invoice_date')), _1nv0ice_k3y(_inv), _c0ntent_h4sh(_inv)
+                        _rules = self._0x19._0x24._v3rsion()
+                        _fresh = _store._fr3sh(_period, _key, _hash, _rules) is not None
+                        _summary['unchanged'] += _fresh
+                    if not _fresh:
+                        _result = self._ev4luate_inv0ice(_inv)
+                        if _result['issues']:
+                            _summary['non_compliant'] += 1
+                            _l0g(logging.INFO, 'MONITOR', _result['status'], invoice=_inv.get('invoice_number', 'UNKNOWN'),
+                                 issues=[_i['type'] for _i in _result['issues']])
+                        if _store is not None:
+                            # One commit per drained queue (or 256 invoices), not per invoice
+                            _store._upsert(_period, [(_key, _hash, _rules, _result['issues'], _inv)], _commit=False)
+                            if _queue.qsize() == 0 or _summary['invoices'] % 256 == 0:
+                                _store._c0mmit()
+                _queue.task_done()
+                await asyncio.sleep(0)
+
+        _poll_task = asyncio.create_task(_p0ller())
+        _consumer_task = asyncio.create_task(_c0nsumer())
+        try:
+            await _pr0ducer()
+            await _queue.join()
+            if _polls is not None:
+                await _poll_task
+        finally:
+            _poll_task.cancel()
+            _consumer_task.cancel()
+            if _store is not None:
+                _store._c0mmit()
+        _l0g(logging.INFO, 'MONITOR', 'Summary', **_summary)
+        return _summary
+
+# ==================== PARALLEL PIPELINE WORKERS ====================
+_0x7a01 = None
+
+def _w0rker_1nit():
+    """Process-pool initializer: one lazily-loaded engine per worker process"""
+    global _0x7a01
+    _0x7a01 = _GSTEngine_0x1a2b(_read_only=True)
+    _0x7a01._init_c0mp0nents()
+
+def _w0rker_sh4rd(_task):
+    """Evaluate one shard slice, returns (shard key, input positions, results)"""
+    _key, _slice, _batch = _task
+    return _key, _slice, [_0x7a01._ev4luate_inv0ice(_inv) for _inv in _batch]
+
+# ==================== SERVICE MODE ====================
+_0x9b02 = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed', 411: 'Length Required',
+           413: 'Payload Too Large', 500: 'Internal Server Error', 503: 'Service Unavailable'}
+_0x9b03 = 1 << 20     # max request body
+_0x9b04 = 64 << 10    # max request head
+_0x9b07 = 8192        # latency samples kept for percentiles
+_0x9b08 = max(1024, socket.SOMAXCONN)  # listen backlog: the default 100 drops SYNs (1 s retry) under a connection burst
+
+def _js0n_d3fault(_obj):
+    """json.dumps fallback: issue records as dicts, anything else as text"""
+    return dict(_obj) if isinstance(_obj, _1ssue_0x8c01) else str(_obj)
+
+def _r3sp0nse(_status, _body, _keep_alive=True, _type='application/json'):
+    """One serialized HTTP/1.1 response; non-bytes bodies are JSON-encoded"""
+    if not isinstance(_body, bytes):
+        _body = json.dumps(_body, default=_js0n_d3fault).encode()
+    _close = '' if _keep_alive else 'Connection: close\r\n'
+    return (f"HTTP/1.1 {_status} {_0x9b02[_status]}\r\nContent-Type: {_type}\r\n"
+            f"Content-Length: {len(_body)}\r\n{_close}\r\n").encode('latin-1') + _body
+
+class _C0nn_0x9b05(asyncio.Protocol):
+    """One client connection: incremental HTTP/1.1 parsing with keep-alive and pipelining"""
+
+    def __init__(self, _service):
+        self._0x1 = _service
+        self._0x2 = None
+        self._0x3 = bytearray()
+        self._0x4 = 0
+        self._0x5 = False
+
+    def connection_made(self, _transport):
+        self._0x2 = _transport
+        self._0x1._0x9['connections'] += 1
+
+    def connection_lost(self, _exc):
+        self._0x2 = None
+        self._0x1._0x9['connections'] -= 1
+
+    def data_received(self, _data):
+        if self._0x5:
+            return
+        self._0x3 += _data
+        while not self._0x5:
+            _end = self._0x3.find(b'\r\n\r\n')
+            if _end < 0:
+                if len(self._0x3) > _0x9b04:
+                    self._f41l(413, 'Request head too large')
+                return
+            _lines = self._0x3[:_end].decode('latin-1').split('\r\n')
+            _parts = _lines[0].split(' ')
+            if len(_parts) != 3:
+                return self._f41l(400, 'Malformed request line')
+            _method, _target, _version = _parts
+            _headers = {}
+            for _line in _lines[1:]:
+                _k, _, _v = _line.partition(':')
+                _headers[_k.strip().lower()] = _v.strip()
+            if 'transfer-encoding' in _headers:
+                return self._f41l(411, 'Chunked bodies are not supported, send Content-Length')
+            try:
+                _length = int(_headers.get('content-length', 0))
+            except ValueError:
+                return self._f41l(400, 'Invalid Content-Length')
+            if _length > _0x9b03:
+                return self._f41l(413, 'Request body too large')
+            if len(self._0x3) < _end + 4 + _length:
+                return
+            _body = bytes(self._0x3[_end + 4:_end + 4 + _length])
+            del self._0x3[:_end + 4 + _length]
+            _connection = _headers.get('connection', '').lower()
+            _keep_alive = _connection != 'close' if _version == 'HTTP/1.1' else _connection == 'keep-alive'
+            self._0x5 = not _keep_alive
+            self._0x1._r3quest(self, _method, _target, _body, _keep_alive)
+
+    def _f41l(self, _status, _error):
+        """Answer an unparseable request and close once everything before it has been answered"""
+        self._0x5 = True
+        self._0x3.clear()
+        self._0x1._r3ply(self, _status, {'error': _error}, False)
+
+    def _s3nd(self, _data, _keep_alive):
+        if self._0x2 is None:
+            return
+        self._0x2.write(_data)
+        if not _keep_alive:
+            self._0x2.close()
+
+class _S3rv1ce_0x9b01:
+    """Resident engine behind a local HTTP/1.1 endpoint (TCP or Unix socket) with micro-batched evaluation.
+
+    Invoice requests that arrive within _window_ms of the first pending one are evaluated together in a
+    single event-loop turn, and a batch is flushed early once _max_batch invoices are waiting, so a burst of
+    concurrent clients costs one wakeup instead of one per request. Responses keep request order per
+    connection. Beyond _max_pending waiting invoices new requests are refused with 503.
+
+    POST /invoice takes one invoice object (or a list of them) and returns what _ev4luate_inv0ice returns
+    (or a list of those). GET /health reports readiness and versions, GET /metrics the engine metrics
+    (Prometheus text, or JSON with ?format=json).
+    """
+
+    def __init__(self, _engine, _window_ms=2.0, _max_batch=256, _max_pending=10000):
+        self._0x1 = _engine
+        self._0x2 = _window_ms / 1000
+        self._0x3 = _max_batch
+        self._0x4 = _max_pending
+        self._0x5 = []
+        self._0x6 = 0
+        self._0x7 = None
+        self._0x8 = np.zeros(_0x9b07)
+        self._0x9 = {'connections': 0, 'requests': 0, 'invoices': 0, 'batches': 0, 'max_batch': 0,
+                     'errors': 0, 'rejected': 0}
+        self._0xa = time.monotonic()
+        self._0xb = None
+        self._0xc = None
+        self._0xd = 0
+
+    async def _st4rt(self, _address, _reuse_port=False):
+        """Listen on 'host:port', ':port' or 'unix:/path/to.sock'"""
+        self._0xc = asyncio.get_running_loop()
+        if _address.startswith('unix:'):
+            self._0xb = await self._0xc.create_unix_server(lambda: _C0nn_0x9b05(self), _address[5:], backlog=_0x9b08)
+        else:
+            _host, _, _port = _address.rpartition(':')
+            self._0xb = await self._0xc.create_server(lambda: _C0nn_0x9b05(self), _host or '127.0.0.1', int(_port),
+                                                      reuse_port=_reuse_port or None, backlog=_0x9b08)
+        _l0g(logging.INFO, 'SERVER', 'Serving', address=_address, window_ms=self._0x2 * 1000, max_batch=self._0x3)
+        return self
+
+    def _st0p(self):
+        """Stop listening and answer whatever is still waiting"""
+        if self._0xb is not None:
+            self._0xb.close()
+        if self._0x5:
+            self._fl4sh()
+
+    def _r3quest(self, _conn, _method, _target, _body, _keep_alive):
+        """Route one parsed request"""
+        self._0x9['requests'] += 1
+        _path, _, _query = _target.partition('?')
+        if _path == '/invoice':
+            if _method != 'POST':
+                return self._r3ply(_conn, 405, {'error': 'Use POST'}, _keep_alive)
+            try:
+                _doc = json.loads(_body)
+            except ValueError as _e:
+                return self._r3ply(_conn, 400, {'error': f'Invalid JSON: {_e}'}, _keep_alive)
+            _single = isinstance(_doc, dict)
+            _invoices = [_doc] if _single else _doc
+            if not isinstance(_invoices, list) or not all(isinstance(_inv, dict) for _inv in _invoices):
+                return self._r3ply(_conn, 400, {'error': 'Expected an invoice object or a list of them'}, _keep_alive)
+            if self._0x6 + len(_invoices) > self._0x4:
+                self._0x9['rejected'] += 1
+                return self._r3ply(_conn, 503, {'error': 'Too many pending invoices'}, _keep_alive)
+            return self._3nqueue(_conn, _keep_alive, _invoices, _single)
+        if _method != 'GET':
+            _status, _reply = (405, {'error': 'Use GET'}) if _path in ('/health', '/metrics') else (404, {'error': 'Not found'})
+            return self._r3ply(_conn, _status, _reply, _keep_alive)
+        if _path == '/health':
+            return self._r3ply(_conn, 200, self._h3alth(), _keep_alive)
+        if _path == '/metrics':
+            if 'format=json' in _query:
+                return self._r3ply(_conn, 200, self._0x1._m3trics(), _keep_alive)
+            return self._r3ply(_conn, 200, self._0x1._m3trics(_prometheus=True).encode(), _keep_alive,
+                               'text/plain; version=0.0.4')
+        return self._r3ply(_conn, 404, {'error': 'Not found'}, _keep_alive)
+
+    def _r3ply(self, _conn, _status, _body, _keep_alive, _type='application/json'):
+        """Send a ready response now, or behind the connection's invoices still waiting for the batch"""
+        _data = _r3sp0nse(_status, _body, _keep_alive, _type)
+        if _conn._0x4:
+            _conn._0x4 += 1
+            self._0x5.append((_conn, _keep_alive, None, _data, 0.0))
+        else:
+            _conn._s3nd(_data, _keep_alive)
+
+    def _3nqueue(self, _conn, _keep_alive, _invoices, _single):
+        _conn._0x4 += 1
+        self._0x5.append((_conn, _keep_alive, _invoices, _single, time.perf_counter()))
+        self._0x6 += len(_invoices)
+        if self._0x6 >= self._0x3:
+            if self._0x7 is not None:
+                self._0x7.cancel()
+            self._0x7 = self._0xc.call_soon(self._fl4sh)
+        elif self._0x7 is None:
+            self._0x7 = self._0xc.call_later(self._0x2, self._fl4sh)
+
+    def _fl4sh(self):
+        """Evaluate every waiting invoice as one batch and answer the requests in arrival order"""
+        self._0x7 = None
+        _entries, _count, self._0x5, self._0x6 = self._0x5, self._0x6, [], 0
+        _results = None
+        if _count:
+            try:
+                _results = iter(self._0x1._ev4luate_b4tch(
+                    [_inv for _entry in _entries if _entry[2] is not None for _inv in _entry[2]]))
+            except Exception as _e:
+                _l0g(logging.WARNING, 'SERVER', 'Batch failed, evaluating requests one by one', error=repr(_e))
+            self._0x9['invoices'] += _count
+            self._0x9['batches'] += 1
+            self._0x9['max_batch'] = max(self._0x9['max_batch'], _count)
+
+        for _conn, _keep_alive, _invoices, _payload, _t0 in _entries:
+            _conn._0x4 -= 1
+            if _invoices is None:
+                _conn._s3nd(_payload, _keep_alive)
+                continue
+            if _results is not None:
+                _res = [next(_results) for _ in _invoices]
+                _data = _r3sp0nse(200, _res[0] if _payload else _res, _keep_alive)
+            else:
+                _data = self._1s0lated(_invoices, _payload, _keep_alive)
+            _conn._s3nd(_data, _keep_alive)
+            self._0x8[self._0xd % _0x9b07] = time.perf_counter() - _t0
+            self._0xd += 1
+
+    def _1s0lated(self, _invoices, _single, _keep_alive):
+        """Response for one request of a failed batch, so a bad invoice only fails its own request"""
+        try:
+            _res = self._0x1._ev4luate_b4tch(_invoices)
+        except Exception as _e:
+            self._0x9['errors'] += 1
+            _l0g(logging.ERROR, 'SERVER', 'Invoice evaluation failed', error=repr(_e))
+            return _r3sp0nse(500, {'error': repr(_e)}, _keep_alive)
+        return _r3sp0nse(200, _res[0] if _single else _res, _keep_alive)
+
+    def _st4ts(self):
+        """Request counters, batch sizes and server-side latency percentiles (ms) over recent requests"""
+        _samples = self._0x8[:min(self._0xd, _0x9b07)]
+        _stats = dict(self._0x9, pending=self._0x6, uptime_s=round(time.monotonic() - self._0xa, 1))
+        _stats['mean_batch'] = round(self._0x9['invoices'] / self._0x9['batches'], 2) if self._0x9['batches'] else 0.0
+        for _p in (50, 99):
+            _stats[f'latency_p{_p}_ms'] = round(float(np.percentile(_samples, _p)) * 1000, 3) if len(_samples) else 0.0
+        return _stats
+
+    def _h3alth(self):
+        """Readiness plus the versions of the resident state"""
+        _engine = self._0x1
+        _loaded = {_name: _c._l4zy_obj is not None
+                   for _name, _c in (('xai', _engine._0x16), ('rag', _engine._0x17), ('web', _engine._0x18))}
+        return {
+            'status': 'ok' if all(_loaded.values()) else 'starting',
+            'components': _loaded,
+            'rules_version': _engine._0x19._0x24._0x4,
+            'index_version': _engine._0x17._0x1e if _loaded['rag'] else None,
+            'weights_version': _engine._0x16._0x6 if _loaded['xai'] else None,
+            'pending': self._0x6,
+            'uptime_s': round(time.monotonic() - self._0xa, 1)
+        }
+
+def _s3rve_w0rker(_address, _window_ms, _max_batch):
+    """Service worker process: its own warm engine listening on a shared SO_REUSEPORT address"""
+    _engine = _GSTEngine_0x1a2b(_read_only=True)
+    _engine._init_c0mp0nents()
+    try:
+        asyncio.run(_engine._4sync_s3rve(_address, _window_ms, _max_batch, _reuse_port=True))
+    except KeyboardInterrupt:
+        pass
 
 # ==================== ENTRY POINT ====================
 def _m4in():
     """Main execution entry point"""
+    _c0nfigure_l0gging(os.environ.get('GST_LOG_LEVEL', 'INFO').upper(), os.environ.get('GST_LOG_FORMAT') == 'json')
+    if os.environ.get('GST_METRICS'):
+        _0x9a7c._3nable()
     _engine = _GSTEngine_0x1a2b()
     _engine._init_c0mp0nents()
+    if os.environ.get('GST_SERVE'):
+        _engine._s3rve(os.environ['GST_SERVE'], float(os.environ.get('GST_BATCH_WINDOW_MS', 2)),
+                       _workers=int(os.environ.get('GST_SERVE_WORKERS', 1)))
+        return
     
     # Demo: Process sample invoices
-    print(f"\n{'='*60}")
-    print("[DEMO] Processing sample invoices...")
-    print(f"{'='*60}\n")
+    _l0g(logging.INFO, 'DEMO', 'Processing sample invoices...')
     
     _test_invoices = [
         {
@@ -469,8 +3715,11 @@ def _m4in():
     ]
     
     for _inv in _test_invoices:
-        _result = _engine._pr0cess_inv0ice(_inv)
-        time.sleep(2)
+        _engine._pr0cess_inv0ice(_inv)
+    
+    _engine._st4rtup_r3port()
+    if _0x9a7c._0x1:
+        _l0g(logging.INFO, 'ENGINE', 'Metrics', **_engine._m3trics())
     
     # Uncomment to enable continuous monitoring
     # _engine._r3al_tim3_m0nit0ring()